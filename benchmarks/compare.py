@@ -0,0 +1,83 @@
+"""
+Compares two benchmark result files written by ``run.py``.
+
+    python -m benchmarks.compare results/main.json results/branch.json
+
+Exits with status 1 if any benchmark's median time is more than ``--threshold``
+percent slower, or it makes more queries, so it can be used in CI.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(base, head, threshold):
+    """
+    Returns a list of rows comparing each benchmark in ``base`` and ``head``,
+    and whether any of them regressed.
+    """
+    rows = []
+    regressed = False
+    for name in {**base["results"], **head["results"]}:
+        base_result = base["results"].get(name)
+        head_result = head["results"].get(name)
+        if base_result is None or head_result is None:
+            rows.append((name, base_result, head_result, None, ""))
+            continue
+        change = (head_result["median"] / base_result["median"] - 1) * 100
+        flags = []
+        if change > threshold:
+            flags.append("slower")
+        if head_result["queries"] > base_result["queries"]:
+            flags.append("more queries")
+        regressed = regressed or bool(flags)
+        rows.append((name, base_result, head_result, change, ", ".join(flags)))
+    return rows, regressed
+
+
+def format_result(result):
+    if result is None:
+        return "-"
+    return f"{result['median'] * 1000:.2f} ms ({result['queries']} q)"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("base", help="The results to compare against.")
+    parser.add_argument("head", help="The new results.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10,
+        help="The percentage slowdown reported as a regression (default: 10).",
+    )
+    options = parser.parse_args(argv)
+
+    base, head = load(options.base), load(options.head)
+    for key in ("database", "sites", "page_types", "pages", "seed"):
+        if base["metadata"].get(key) != head["metadata"].get(key):
+            print(
+                f"Warning: the results were run with different {key} values "
+                f"({base['metadata'].get(key)} and {head['metadata'].get(key)}).",
+                file=sys.stderr,
+            )
+
+    rows, regressed = compare(base, head, options.threshold)
+    print(f"{'Benchmark':<40} {'Base':>22} {'Head':>22} {'Change':>9}")
+    for name, base_result, head_result, change, flags in rows:
+        change = "-" if change is None else f"{change:+.1f}%"
+        print(
+            f"{name:<40} {format_result(base_result):>22}"
+            f" {format_result(head_result):>22} {change:>9}  {flags}".rstrip()
+        )
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+# Generated by Django 5.1.15 on 2026-10-18 14:39
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("wagtailcore", "0089_log_entry_data_json_null_to_object"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CaseStudyPage",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "last_review_date",
+                    models.DateField(blank=True, null=True),
+                ),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                (
+                    "next_review_date",
+                    models.DateField(editable=False, null=True),
+                ),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="ContactPage",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "last_review_date",
+                    models.DateField(blank=True, null=True),
+                ),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                (
+                    "next_review_date",
+                    models.DateField(editable=False, null=True),
+                ),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="EventPage",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "last_review_date",
+                    models.DateField(blank=True, null=True),
+                ),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                (
+                    "next_review_date",
+                    models.DateField(editable=False, null=True),
+                ),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="GeneratedTree",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sites", models.PositiveIntegerField()),
+                ("page_types", models.PositiveIntegerField()),
+                ("pages", models.PositiveIntegerField()),
+                ("seed", models.IntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="GuidancePage",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "last_review_date",
+                    models.DateField(blank=True, null=True),
+                ),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                (
+                    "next_review_date",
+                    models.DateField(editable=False, null=True),
+                ),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="NewsPage",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "last_review_date",
+                    models.DateField(blank=True, null=True),
+                ),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                (
+                    "next_review_date",
+                    models.DateField(editable=False, null=True),
+                ),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="PolicyPage",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "last_review_date",
+                    models.DateField(blank=True, null=True),
+                ),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                (
+                    "next_review_date",
+                    models.DateField(editable=False, null=True),
+                ),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="ReportPage",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "last_review_date",
+                    models.DateField(blank=True, null=True),
+                ),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                (
+                    "next_review_date",
+                    models.DateField(editable=False, null=True),
+                ),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="ServicePage",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "last_review_date",
+                    models.DateField(blank=True, null=True),
+                ),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                (
+                    "next_review_date",
+                    models.DateField(editable=False, null=True),
+                ),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+    ]
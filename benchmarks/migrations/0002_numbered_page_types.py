@@ -0,0 +1,655 @@
+# Generated by Django 5.1.15 on 2026-10-18 16:20
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("benchmarks", "0001_initial"),
+        ("wagtailcore", "0089_log_entry_data_json_null_to_object"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Type10Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type11Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type12Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type13Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type14Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type15Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type16Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type17Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type18Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type19Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type20Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type21Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type22Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type23Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type24Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="Type9Page",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(blank=True, null=True)),
+                (
+                    "current_version_ref",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="current version ref"
+                    ),
+                ),
+                (
+                    "current_version_compiled_by",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        verbose_name="current version compiled by",
+                    ),
+                ),
+                ("next_review_date", models.DateField(editable=False, null=True)),
+                (
+                    "custom_review_frequency",
+                    models.PositiveIntegerField(editable=False, null=True),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+    ]
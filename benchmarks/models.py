@@ -0,0 +1,71 @@
+from django.db import models
+from wagtail.models import Page
+
+from wagtail_periodic_review.models import PeriodicReviewMixin
+
+
+class BenchmarkPage(PeriodicReviewMixin, Page):
+    class Meta:
+        abstract = True
+
+
+class PolicyPage(BenchmarkPage): ...
+
+
+class GuidancePage(BenchmarkPage): ...
+
+
+class NewsPage(BenchmarkPage): ...
+
+
+class EventPage(BenchmarkPage): ...
+
+
+class ServicePage(BenchmarkPage): ...
+
+
+class ReportPage(BenchmarkPage): ...
+
+
+class CaseStudyPage(BenchmarkPage): ...
+
+
+class ContactPage(BenchmarkPage): ...
+
+
+# The number of page types synthetic trees can use, enough to time queries
+# across the 15+ page types where joining each subclass table falls apart
+MAX_PAGE_TYPES = 24
+
+# The page types that synthetic trees can use, in order
+PAGE_TYPES = [
+    PolicyPage,
+    GuidancePage,
+    NewsPage,
+    EventPage,
+    ServicePage,
+    ReportPage,
+    CaseStudyPage,
+    ContactPage,
+]
+# Numbered page types make up the rest
+for _number in range(len(PAGE_TYPES) + 1, MAX_PAGE_TYPES + 1):
+    _name = f"Type{_number}Page"
+    globals()[_name] = type(_name, (BenchmarkPage,), {"__module__": __name__})
+    PAGE_TYPES.append(globals()[_name])
+
+
+class GeneratedTree(models.Model):
+    """
+    The parameters of the synthetic tree in the benchmark database,
+    so that it can be reused by later runs.
+    """
+
+    sites = models.PositiveIntegerField()
+    page_types = models.PositiveIntegerField()
+    pages = models.PositiveIntegerField()
+    seed = models.IntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.pages} pages, {self.page_types} page types, {self.sites} sites"
@@ -0,0 +1,257 @@
+"""
+Times the package's hot paths against a synthetic page tree, and writes the
+results as JSON, to compare between commits with ``compare.py``.
+
+    python -m benchmarks.run --pages 100000 --output results/main.json
+"""
+
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+class BenchmarkContext:
+    """
+    Shared state for benchmark functions: a logged in test client for a
+    superuser, and the parameters of the generated tree.
+    """
+
+    def __init__(self, tree):
+        from django.contrib.auth import get_user_model
+        from django.test import Client
+
+        self.tree = tree
+        self.user, _ = get_user_model().objects.get_or_create(
+            username="benchmark", defaults={"is_superuser": True, "is_staff": True}
+        )
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def get_request(self):
+        from django.test import RequestFactory
+
+        request = RequestFactory().get("/admin/")
+        request.user = self.user
+        return request
+
+
+def get_git_revision():
+    try:
+        return subprocess.run(  # noqa: S603
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            cwd=BASE_DIR,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def setup_database(options):
+    """
+    Creates the benchmark database and generates the tree, unless ``--keepdb``
+    is used and the existing database has a tree with the same parameters.
+    """
+    from django.db import connection
+
+    from benchmarks.models import GeneratedTree
+    from benchmarks.tree import TreeGenerator
+
+    parameters = {
+        "sites": options.sites,
+        "page_types": options.page_types,
+        "pages": options.pages,
+        "seed": options.seed,
+    }
+    connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, serialize=False, keepdb=options.keepdb
+    )
+    tree = GeneratedTree.objects.filter(**parameters).first()
+    if tree is None:
+        if GeneratedTree.objects.exists():
+            # The database has a different tree
+            connection.creation.create_test_db(
+                verbosity=0, autoclobber=True, serialize=False
+            )
+        print(f"Generating a tree of {options.pages} pages…", file=sys.stderr)
+        started = time.perf_counter()
+        TreeGenerator(**parameters).generate()
+        tree = GeneratedTree.objects.create(**parameters)
+        print(f"Generated in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return tree
+
+
+def run_benchmark(func, context, repeat):
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    # Warm up in-process caches, such as content types, then count the queries
+    cache.clear()
+    func(context)
+    cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        rows = func(context)
+    # Read the count now, as requests made by the test client reset the log
+    query_count = len(queries)
+
+    times = []
+    for _ in range(repeat):
+        cache.clear()
+        started = time.perf_counter()
+        func(context)
+        times.append(time.perf_counter() - started)
+
+    result = {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "max": max(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "times": times,
+        "queries": query_count,
+    }
+    if rows is not None:
+        result["rows"] = rows
+    return result
+
+
+def get_metadata(options, database_vendor):
+    import django
+    import wagtail
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "git_revision": get_git_revision(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "wagtail": wagtail.__version__,
+        "database": database_vendor,
+        "sites": options.sites,
+        "page_types": options.page_types,
+        "pages": options.pages,
+        "seed": options.seed,
+        "repeat": options.repeat,
+    }
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sites", type=int, default=2, help="Default: 2.")
+    parser.add_argument(
+        "--page-types",
+        type=int,
+        default=4,
+        help="The number of PeriodicReviewMixin page types used (default: 4, up to 24).",
+    )
+    parser.add_argument(
+        "--pages", type=int, default=10_000, help="Default: 10,000 (up to 1,000,000)."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of timed runs of each benchmark (default: 5).",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        dest="names",
+        action="append",
+        metavar="NAME",
+        help="Only run benchmarks whose name contains NAME. Can be used multiple times.",
+    )
+    parser.add_argument(
+        "--module",
+        dest="modules",
+        action="append",
+        default=[],
+        metavar="MODULE",
+        help="Import MODULE to register more benchmarks. Can be used multiple times.",
+    )
+    parser.add_argument(
+        "--keepdb",
+        action="store_true",
+        help="Keep the benchmark database, and reuse its tree if it matches.",
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    return parser
+
+
+def main(argv=None):
+    parser = get_parser()
+    options = parser.parse_args(argv)
+    if options.sites < 1:
+        parser.error("--sites must be a positive number.")
+    if not 1 <= options.pages <= 1_000_000:
+        parser.error("--pages must be between 1 and 1,000,000.")
+    if options.repeat < 1:
+        parser.error("--repeat must be a positive number.")
+
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+
+    import django
+
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from benchmarks.models import PAGE_TYPES
+    from benchmarks.suite import BENCHMARKS
+
+    # Checked before the tree is generated, once the page types are loaded
+    if not 1 <= options.page_types <= len(PAGE_TYPES):
+        parser.error(f"--page-types must be between 1 and {len(PAGE_TYPES)}.")
+
+    for module in options.modules:
+        importlib.import_module(module)
+
+    setup_test_environment()
+    old_database_name = connection.settings_dict["NAME"]
+    tree = setup_database(options)
+    try:
+        context = BenchmarkContext(tree)
+        results = {}
+        for name, func in BENCHMARKS.items():
+            if options.names and not any(part in name for part in options.names):
+                continue
+            results[name] = result = run_benchmark(func, context, options.repeat)
+            print(
+                f"{name:<40} {result['median'] * 1000:>10.2f} ms"
+                f" {result['queries']:>6} queries",
+                file=sys.stderr,
+            )
+        output = {
+            "metadata": get_metadata(options, connection.vendor),
+            "results": results,
+        }
+    finally:
+        if not options.keepdb:
+            connection.creation.destroy_test_db(old_database_name, verbosity=0)
+
+    if options.output:
+        path = Path(options.output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(output, indent=2))
+    else:
+        print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
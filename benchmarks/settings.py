@@ -0,0 +1,26 @@
+import os
+
+from tests.settings import *  # noqa: F403
+from tests.settings import BASE_DIR, INSTALLED_APPS
+
+
+INSTALLED_APPS = ["benchmarks", *INSTALLED_APPS]
+
+DATABASES = {
+    "default": {
+        "ENGINE": os.environ.get("DATABASE_ENGINE", "django.db.backends.sqlite3"),
+        "NAME": os.environ.get("DATABASE_NAME", BASE_DIR / "benchmarks.sqlite3"),
+        "USER": os.environ.get("DATABASE_USER", None),
+        "PASSWORD": os.environ.get("DATABASE_PASS", None),
+        "HOST": os.environ.get("DATABASE_HOST", None),
+        "TEST": {
+            # The benchmark database is created (or reused) like a test database
+            "NAME": os.environ.get("DATABASE_NAME", BASE_DIR / "benchmarks.sqlite3"),
+        },
+    }
+}
+
+DEBUG = False
+
+# Time the queries rather than the cache
+WAGTAIL_PERIODIC_REVIEW_DASHBOARD_CACHE_TIMEOUT = 0
@@ -0,0 +1,87 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from wagtail.models import Page
+
+from wagtail_periodic_review.models import PeriodicReviewFrequencySettings
+from wagtail_periodic_review.utils import (
+    add_review_date_annotations,
+    for_review_this_month,
+    review_overdue,
+)
+from wagtail_periodic_review.wagtail_hooks import (
+    ForReviewThisMonthPanel,
+    OverdueReviewsPanel,
+)
+
+
+# Benchmark functions by name, in the order they run
+BENCHMARKS = {}
+
+# The number of rows fetched by the queryset benchmarks, like a listing page
+LISTING_SIZE = 50
+
+
+def benchmark(name):
+    """
+    Registers a benchmark function, which is called with a ``BenchmarkContext``
+    for each timed run. It can return the number of rows it processed.
+
+    Modules passed to ``run.py`` with ``--module`` can register more benchmarks.
+    """
+
+    def decorator(func):
+        if name in BENCHMARKS:
+            raise ValueError(f"A benchmark named '{name}' is already registered.")
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+@benchmark("review_overdue")
+def bench_review_overdue(context):
+    queryset = review_overdue(Page.objects.live())
+    queryset.count()
+    return len(queryset[:LISTING_SIZE])
+
+
+@benchmark("for_review_this_month")
+def bench_for_review_this_month(context):
+    queryset = for_review_this_month(Page.objects.live())
+    queryset.count()
+    return len(queryset[:LISTING_SIZE])
+
+
+@benchmark("add_review_date_annotations")
+def bench_add_review_date_annotations(context):
+    queryset = add_review_date_annotations(Page.objects.all()).filter(
+        next_review_date__isnull=False
+    )
+    return len(queryset.order_by("next_review_date", "pk")[:LISTING_SIZE])
+
+
+@benchmark("report_view")
+def bench_report_view(context):
+    response = context.client.get(reverse("wagtail_periodic_review_report"))
+    if response.status_code != 200:
+        raise RuntimeError(f"The report returned a {response.status_code} response.")
+
+
+@benchmark("dashboard_panels")
+def bench_dashboard_panels(context):
+    request = context.get_request()
+    for panel_class in (OverdueReviewsPanel, ForReviewThisMonthPanel):
+        panel_class(request).render_html({"request": request})
+
+
+@benchmark("recalculate_next_review_dates")
+def bench_recalculate_next_review_dates(context):
+    for settings in PeriodicReviewFrequencySettings.objects.select_related("site"):
+        settings.recalculate_next_review_dates()
+
+
+@benchmark("recalculate_review_dates_command")
+def bench_recalculate_review_dates_command(context):
+    call_command("recalculate_review_dates", stdout=StringIO())
@@ -0,0 +1,173 @@
+import datetime
+import math
+import random
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from wagtail.models import Locale, Page, Site
+
+from benchmarks.models import PAGE_TYPES
+from wagtail_periodic_review.dates import add_months
+from wagtail_periodic_review.models import (
+    PeriodicReviewFrequencyRule,
+    PeriodicReviewFrequencySettings,
+    ReviewFrequencyChoices,
+)
+from wagtail_periodic_review.review_index import rebuild_review_index
+from wagtail_periodic_review.rules import get_rule_frequency, invalidate_rule_map
+
+
+# The maximum number of pages in each section of a site
+SECTION_SIZE = 1000
+
+# The share of pages that have no last review date, are not live,
+# or have a custom review frequency
+UNREVIEWED_RATIO = 0.05
+DRAFT_RATIO = 0.05
+CUSTOM_FREQUENCY_RATIO = 0.1
+
+# How far back last review dates go
+MAX_REVIEW_AGE_DAYS = 730
+
+
+def _insert(model, objs, fields):
+    # QuerySet.bulk_create() doesn't support multi-table inheritance,
+    # so insert rows into each table directly, in batches
+    batch_size = connection.ops.bulk_batch_size(fields, objs) or len(objs)
+    for i in range(0, len(objs), batch_size):
+        model._base_manager._insert(objs[i : i + batch_size], fields=fields, raw=True)
+
+
+def bulk_create_children(parent, pages):
+    """
+    Adds unsaved ``pages`` (instances of ``Page`` or its subclasses) as the
+    last children of ``parent``, and sets their primary keys.
+    """
+    if not pages:
+        return
+    depth = parent.depth + 1
+    for step, page in enumerate(pages, start=parent.numchild + 1):
+        page.depth = depth
+        page.path = Page._get_path(parent.path, depth, step)
+        page.numchild = 0
+        page.url_path = f"{parent.url_path}{page.slug}/"
+        page.draft_title = page.title
+
+    Page.objects.bulk_create([Page(**_get_page_values(page)) for page in pages])
+    page_ids = dict(
+        Page.objects.filter(
+            path__startswith=parent.path, depth=depth, path__gte=pages[0].path
+        ).values_list("path", "pk")
+    )
+    pages_by_model = {}
+    for page in pages:
+        page.pk = page.id = page_ids[page.path]
+        if type(page) is not Page:
+            pages_by_model.setdefault(type(page), []).append(page)
+
+    for model, model_pages in pages_by_model.items():
+        # Insert rows for each table between the model and Page
+        for table_model in model._meta.get_parent_list()[::-1][1:] + [model]:
+            _insert(table_model, model_pages, table_model._meta.local_concrete_fields)
+
+    parent.numchild += len(pages)
+    Page.objects.filter(pk=parent.pk).update(numchild=parent.numchild)
+
+
+def _get_page_values(page):
+    return {
+        field.attname: getattr(page, field.attname)
+        for field in Page._meta.concrete_fields
+        if not field.primary_key
+    }
+
+
+class TreeGenerator:
+    """
+    Creates a synthetic page tree of ``pages`` pages using ``PeriodicReviewMixin``,
+    spread evenly across ``sites`` sites, each with its own frequency rules.
+    Each site has sections of up to ``SECTION_SIZE`` pages of the first
+    ``page_types`` benchmark page types. The same ``seed`` gives the same tree.
+    """
+
+    def __init__(self, *, sites, page_types, pages, seed=0):
+        if not 1 <= page_types <= len(PAGE_TYPES):
+            raise ValueError(f"page_types must be between 1 and {len(PAGE_TYPES)}.")
+        if sites < 1:
+            raise ValueError("sites must be at least 1.")
+        self.sites = sites
+        self.page_types = PAGE_TYPES[:page_types]
+        self.pages = pages
+        self.random = random.Random(seed)  # noqa: S311
+        self.today = datetime.date.today()
+
+    def generate(self):
+        root = Page.get_first_root_node()
+        self.locale = Locale.get_default()
+        self.content_type_ids = {
+            model: content_type.pk
+            for model, content_type in ContentType.objects.get_for_models(
+                *self.page_types
+            ).items()
+        }
+        pages_per_site, remainder = divmod(self.pages, self.sites)
+        for i in range(self.sites):
+            with transaction.atomic():
+                site = self.create_site(root, i)
+                self.create_sections(site, pages_per_site + (i < remainder))
+        rebuild_review_index()
+
+    def create_site(self, root, index):
+        root_page = root.add_child(
+            instance=Page(title=f"Site {index}", slug=f"site-{index}")
+        )
+        site = Site.objects.create(
+            hostname=f"site-{index}.example.com", root_page=root_page
+        )
+        PeriodicReviewFrequencySettings.objects.create(site=site)
+        rules = list(
+            PeriodicReviewFrequencyRule.objects.filter(sitesettings__site=site)
+        )
+        for rule in rules:
+            rule.frequency = self.random.choice(ReviewFrequencyChoices.values)
+        PeriodicReviewFrequencyRule.objects.bulk_update(rules, ["frequency"])
+        invalidate_rule_map()
+        return site
+
+    def create_sections(self, site, page_count):
+        sections = [
+            Page(title=f"Section {i}", slug=f"section-{i}", locale=self.locale)
+            for i in range(math.ceil(page_count / SECTION_SIZE))
+        ]
+        bulk_create_children(site.root_page, sections)
+        for i, section in enumerate(sections):
+            count = min(SECTION_SIZE, page_count - i * SECTION_SIZE)
+            bulk_create_children(
+                section, [self.get_page(site, section, j) for j in range(count)]
+            )
+
+    def get_page(self, site, section, index):
+        model = self.random.choice(self.page_types)
+        content_type_id = self.content_type_ids[model]
+        page = model(
+            title=f"{section.title} page {index}",
+            slug=f"page-{index}",
+            content_type_id=content_type_id,
+            locale=self.locale,
+            live=self.random.random() >= DRAFT_RATIO,
+        )
+        if self.random.random() >= UNREVIEWED_RATIO:
+            page.last_review_date = self.today - datetime.timedelta(
+                days=self.random.randrange(MAX_REVIEW_AGE_DAYS)
+            )
+            if self.random.random() < CUSTOM_FREQUENCY_RATIO:
+                page.custom_review_frequency = self.random.choice(
+                    ReviewFrequencyChoices.values
+                )
+            page.next_review_date = add_months(
+                page.last_review_date,
+                page.custom_review_frequency
+                or get_rule_frequency(site.pk, content_type_id)
+                or ReviewFrequencyChoices.TWELVE_MONTHS,
+            )
+        return page
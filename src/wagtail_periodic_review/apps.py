@@ -6,3 +6,10 @@ class WagtailPeriodicReviewConfig(AppConfig):
     label = "wagtail_periodic_review"
     name = "wagtail_periodic_review"
     verbose_name = "Wagtail Periodic Review"
+
+    def ready(self):
+        from .registry import register_review_models
+        from .signal_handlers import register_signal_handlers
+
+        register_review_models()
+        register_signal_handlers(self)
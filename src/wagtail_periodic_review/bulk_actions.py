@@ -0,0 +1,235 @@
+import uuid
+
+from collections import defaultdict
+
+from django import forms
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from django.utils.translation import ngettext
+from wagtail.admin.views.pages.bulk_actions.page_bulk_action import PageBulkAction
+from wagtail.admin.widgets import AdminDateInput
+from wagtail.models import PageLogEntry, Revision
+
+from .caching import invalidate_review_data
+from .dates import add_months
+from .registry import get_review_models
+from .rules import get_rule_frequency
+from .sites import get_site_id_for_path
+from .utils import get_periodic_review_models, has_generated_next_review_date
+
+
+MARK_AS_REVIEWED_LOG_ACTION = "wagtail_periodic_review.mark_as_reviewed"
+
+# The maximum number of page IDs per query
+MARK_AS_REVIEWED_CHUNK_SIZE = 1000
+
+
+def _chunks(values, size=MARK_AS_REVIEWED_CHUNK_SIZE):
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
+
+def _update_revisions(revision_values):
+    """
+    Sets the ``{field name: value}`` of each revision ID in
+    ``revision_values`` in the revision's content.
+    """
+    revisions = []
+    for ids in _chunks(list(revision_values)):
+        for revision in Revision.objects.filter(pk__in=ids).only("pk", "content"):
+            for field, value in revision_values[revision.pk].items():
+                revision.content[field] = value
+            revisions.append(revision)
+    Revision.objects.bulk_update(
+        revisions, ["content"], batch_size=MARK_AS_REVIEWED_CHUNK_SIZE
+    )
+
+
+@transaction.atomic
+def mark_as_reviewed(
+    pages,
+    last_review_date,
+    current_version_ref="",
+    current_version_compiled_by="",
+    user=None,
+):
+    """
+    Sets the review fields of ``pages`` (instances of ``Page`` or its
+    subclasses) that use ``PeriodicReviewMixin``, and returns the number
+    of pages updated.
+
+    Unlike saving each page, this recalculates next review dates with one
+    UPDATE per model and review frequency (plus the same for the review
+    index), and writes the audit log entries with a single query. The latest
+    revisions of pages with unpublished changes are updated too, so that
+    publishing them keeps the review.
+    """
+    from .models import PageReviewIndex, ReviewFrequencyChoices
+
+    pages_by_id = {page.pk: page for page in pages}
+    updated_ids = []
+    # Review values by revision ID, for pages with unpublished changes
+    revision_values = {}
+    for review_model in get_review_models():
+        if not review_model.defines_review_fields:
+            # These pages are updated with the model defining the fields
+            continue
+        model = review_model.model
+
+        # Only query the models of the selected pages
+        model_page_ids = [
+            page.pk
+            for page in pages_by_id.values()
+            if page.specific_class is not None
+            and issubclass(page.specific_class, model)
+        ]
+        page_ids_by_frequency = defaultdict(list)
+        index_values = {}
+        draft_revision_ids = {}
+        for ids in _chunks(model_page_ids):
+            for (
+                page_id,
+                content_type_id,
+                path,
+                custom_frequency,
+                has_unpublished_changes,
+                latest_revision_id,
+            ) in model.objects.filter(pk__in=ids).values_list(
+                "pk",
+                "content_type_id",
+                "path",
+                "custom_review_frequency",
+                "has_unpublished_changes",
+                "latest_revision_id",
+            ):
+                site_id = get_site_id_for_path(path)
+                frequency = (
+                    custom_frequency
+                    or get_rule_frequency(site_id, content_type_id, path)
+                    or ReviewFrequencyChoices.TWELVE_MONTHS
+                )
+                page_ids_by_frequency[frequency].append(page_id)
+                index_values[page_id] = {
+                    "content_type_id": content_type_id,
+                    "site_id": site_id,
+                }
+                if has_unpublished_changes and latest_revision_id:
+                    draft_revision_ids[page_id] = latest_revision_id
+
+        for frequency, frequency_page_ids in page_ids_by_frequency.items():
+            next_review_date = add_months(last_review_date, frequency)
+            review_values = {
+                "last_review_date": last_review_date,
+                "current_version_ref": current_version_ref,
+                "current_version_compiled_by": current_version_compiled_by,
+            }
+            if has_generated_next_review_date(model):
+                # The database calculates the next review dates of these pages
+                review_values["review_frequency"] = frequency
+            else:
+                review_values["next_review_date"] = next_review_date
+            for ids in _chunks(frequency_page_ids):
+                model.objects.filter(pk__in=ids).update(**review_values)
+                index_rows = PageReviewIndex.objects.filter(page_id__in=ids)
+                if index_rows.update(
+                    last_review_date=last_review_date,
+                    next_review_date=next_review_date,
+                ) < len(ids):
+                    # Index the pages that were missing from the index
+                    indexed_ids = set(index_rows.values_list("page_id", flat=True))
+                    PageReviewIndex.objects.bulk_create(
+                        PageReviewIndex(
+                            page_id=page_id,
+                            last_review_date=last_review_date,
+                            next_review_date=next_review_date,
+                            **index_values[page_id],
+                        )
+                        for page_id in ids
+                        if page_id not in indexed_ids
+                    )
+            for page_id in frequency_page_ids:
+                if page_id in draft_revision_ids:
+                    revision_values[draft_revision_ids[page_id]] = {
+                        **review_values,
+                        "next_review_date": next_review_date,
+                    }
+            updated_ids.extend(frequency_page_ids)
+
+    if revision_values:
+        _update_revisions(revision_values)
+
+    if not updated_ids:
+        return 0
+
+    # Log all pages as a single action
+    log_uuid = uuid.uuid4()
+    timestamp = timezone.now()
+    data = {
+        "last_review_date": last_review_date,
+        "current_version_ref": current_version_ref,
+        "current_version_compiled_by": current_version_compiled_by,
+    }
+    PageLogEntry.objects.bulk_create(
+        [
+            PageLogEntry(
+                page_id=page_id,
+                content_type_id=pages_by_id[page_id].content_type_id,
+                label=pages_by_id[page_id].get_admin_display_title(),
+                action=MARK_AS_REVIEWED_LOG_ACTION,
+                data=data,
+                timestamp=timestamp,
+                uuid=log_uuid,
+                user=user,
+            )
+            for page_id in updated_ids
+        ],
+        batch_size=MARK_AS_REVIEWED_CHUNK_SIZE,
+    )
+    invalidate_review_data()
+    return len(updated_ids)
+
+
+class MarkAsReviewedForm(forms.Form):
+    last_review_date = forms.DateField(
+        label=_("Last review date"), widget=AdminDateInput
+    )
+    current_version_ref = forms.CharField(
+        label=_("Current version ref"), max_length=20, required=False
+    )
+    current_version_compiled_by = forms.CharField(
+        label=_("Current version compiled by"), max_length=255, required=False
+    )
+
+
+class MarkAsReviewedBulkAction(PageBulkAction):
+    display_name = _("Mark as reviewed")
+    action_type = "mark_as_reviewed"
+    aria_label = _("Mark selected pages as reviewed")
+    template_name = (
+        "wagtailadmin/periodic_review/bulk_actions/confirm_bulk_mark_as_reviewed.html"
+    )
+    action_priority = 60
+    form_class = MarkAsReviewedForm
+
+    def get_initial(self):
+        return {"last_review_date": timezone.now().date()}
+
+    def check_perm(self, page):
+        return page.specific_class in get_periodic_review_models() and (
+            page.permissions_for_user(self.request.user).can_edit()
+        )
+
+    def get_execution_context(self):
+        return {**super().get_execution_context(), **self.cleaned_form.cleaned_data}
+
+    @classmethod
+    def execute_action(cls, objects, user=None, **kwargs):
+        return mark_as_reviewed(objects, user=user, **kwargs), 0
+
+    def get_success_message(self, num_parent_objects, num_child_objects):
+        return ngettext(
+            "%(num_pages)d page has been marked as reviewed",
+            "%(num_pages)d pages have been marked as reviewed",
+            num_parent_objects,
+        ) % {"num_pages": num_parent_objects}
@@ -0,0 +1,100 @@
+import threading
+import weakref
+
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+
+CACHE_KEY_PREFIX = "wagtail_periodic_review"
+
+# Versions data derived from page review dates, such as the dashboard panels
+REVIEW_DATA_CACHE_NAME = "review_data"
+
+
+def _get_version_key(name):
+    return f"{CACHE_KEY_PREFIX}:{name}:version"
+
+
+def get_cache_version(name):
+    """
+    Returns the current version token for the named group of cached values,
+    which is shared between processes via Django's cache framework.
+    """
+    key = _get_version_key(name)
+    if (version := cache.get(key)) is None:
+        cache.add(key, uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _set_cache_version(name):
+    cache.set(_get_version_key(name), uuid4().hex, timeout=None)
+
+
+# The pending bumps of each database connection, which like Django's
+# connections are separate for each thread
+_local = threading.local()
+
+
+def _get_pending_bumps():
+    if not hasattr(_local, "pending_bumps"):
+        _local.pending_bumps = {}
+    # on_commit() callbacks are registered on the default database
+    return _local.pending_bumps.setdefault(DEFAULT_DB_ALIAS, weakref.WeakSet())
+
+
+class PendingBump:
+    """
+    An ``on_commit()`` callback bumping the version for ``name``. Until it
+    runs, it is in the connection's pending bumps, which only keep a weak
+    reference to it, so that it also leaves them when the transaction (or the
+    savepoint it was registered in) is rolled back and the callback is
+    discarded.
+    """
+
+    def __init__(self, name, pending_bumps):
+        self.name = name
+        self.token = uuid4().hex
+        self.pending_bumps = pending_bumps
+        pending_bumps.add(self)
+
+    def __call__(self):
+        self.pending_bumps.discard(self)
+        _set_cache_version(self.name)
+
+
+def bump_cache_version(name):
+    """
+    Invalidates all values cached against the current version token for
+    ``name``. The version is bumped again once the current transaction is
+    committed, so that other processes cannot cache data read before the
+    change became visible to them.
+    """
+    _set_cache_version(name)
+    transaction.on_commit(PendingBump(name, _get_pending_bumps()))
+
+
+def get_pending_bumps(name):
+    """
+    Returns the tokens of the ``PendingBump`` callbacks that will bump the
+    version for ``name`` once the current transaction is committed. Tokens
+    rather than callbacks are returned, so that keeping them does not keep
+    the callbacks of rolled back transactions pending.
+    """
+    return frozenset(bump.token for bump in _get_pending_bumps() if bump.name == name)
+
+
+def get_memo_state(name):
+    """
+    Returns a token for values derived from the ``name`` data and kept in
+    memory, which changes whenever they have to be rebuilt: when the version
+    is bumped, and when a transaction with a pending bump is rolled back,
+    which discards the changes the values may have been built from.
+    """
+    return get_cache_version(name), get_pending_bumps(name)
+
+
+def invalidate_review_data():
+    bump_cache_version(REVIEW_DATA_CACHE_NAME)
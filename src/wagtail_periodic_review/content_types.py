@@ -0,0 +1,50 @@
+from django.contrib.contenttypes.models import ContentType
+from django.utils.text import capfirst
+
+from . import utils
+
+
+class ReviewContentTypes:
+    """
+    The content types of the page models using ``PeriodicReviewMixin``:
+
+    - ``by_model``: a dictionary of ``ContentType`` objects by model
+    - ``ids``: the content type IDs, in model registration order
+    - ``labels``: a dictionary of display labels by content type ID
+    """
+
+    def __init__(self, models):
+        content_types = ContentType.objects.get_for_models(*models)
+        self.by_model = {model: content_types[model] for model in models}
+        self.ids = [content_type.pk for content_type in self.by_model.values()]
+        self.labels = {
+            content_type.pk: capfirst(model._meta.verbose_name)
+            for model, content_type in self.by_model.items()
+        }
+
+    @property
+    def choices(self):
+        return list(self.labels.items())
+
+
+_review_content_types = None
+
+
+def get_review_content_types():
+    """
+    Returns the ``ReviewContentTypes`` of the periodic review models. They
+    are looked up with at most one query the first time this is called, and
+    kept in memory until ``clear_review_content_types()`` is called, which
+    happens after running migrations.
+    """
+    global _review_content_types
+
+    if _review_content_types is None:
+        _review_content_types = ReviewContentTypes(utils.get_periodic_review_models())
+    return _review_content_types
+
+
+def clear_review_content_types():
+    global _review_content_types
+
+    _review_content_types = None
@@ -0,0 +1,86 @@
+import calendar
+import datetime
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Batches with at least this many dates use NumPy, when it is installed
+NUMPY_THRESHOLD = 256
+
+# The ordinal of the NumPy ``datetime64`` epoch, 1970-01-01
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def days_in_month(year, month):
+    if month == 2 and calendar.isleap(year):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def add_months(value, months):
+    """
+    Adds ``months`` (which may be negative) to a date or datetime.
+
+    The day is clamped to the end of the target month, matching
+    ``value + dateutil.relativedelta.relativedelta(months=months)``
+    (e.g. 2024-01-31 + 1 month = 2024-02-29).
+    """
+    year, month = divmod(value.year * 12 + value.month - 1 + months, 12)
+    month += 1
+    return value.replace(
+        year=year, month=month, day=min(value.day, days_in_month(year, month))
+    )
+
+
+def _add_months_to_ordinals_numpy(ordinals, months):
+    days = np.asarray(ordinals, dtype=np.int64) - _EPOCH_ORDINAL
+    dates = days.astype("datetime64[D]")
+    month_starts = dates.astype("datetime64[M]")
+    day_offsets = dates - month_starts.astype("datetime64[D]")
+
+    target_months = month_starts + np.asarray(months, dtype=np.int64)
+    target_starts = target_months.astype("datetime64[D]")
+    target_lengths = (target_months + 1).astype("datetime64[D]") - target_starts
+    results = target_starts + np.minimum(day_offsets, target_lengths - 1)
+    return (results.astype(np.int64) + _EPOCH_ORDINAL).tolist()
+
+
+def add_months_to_ordinals(ordinals, months, *, use_numpy=None):
+    """
+    Returns a list of ``ordinals`` (as from ``date.toordinal()``), each with
+    ``months`` added using the same clamping as ``add_months()``.
+
+    ``months`` is either a number of months for all dates, or a sequence with
+    the number for each date. NumPy is used for large batches when it is
+    installed, unless ``use_numpy`` says otherwise.
+    """
+    if not isinstance(months, int):
+        months = list(months)
+        if len(months) != len(ordinals):
+            raise ValueError("ordinals and months must be the same length.")
+
+    if use_numpy is None:
+        use_numpy = np is not None and len(ordinals) >= NUMPY_THRESHOLD
+    if use_numpy:
+        if np is None:
+            raise ImportError("NumPy is not installed.")
+        return _add_months_to_ordinals_numpy(ordinals, months)
+
+    if isinstance(months, int):
+        months = [months] * len(ordinals)
+
+    # Many pages share review dates, so calculate each one once
+    results = {}
+    for key in zip(ordinals, months):
+        if key not in results:
+            ordinal, months_to_add = key
+            results[key] = add_months(
+                datetime.date.fromordinal(ordinal), months_to_add
+            ).toordinal()
+    return [results[key] for key in zip(ordinals, months)]
@@ -0,0 +1,65 @@
+from django.db import NotSupportedError
+from django.db.models import DateField, Func, Value
+
+
+class AddMonths(Func):
+    """
+    Adds a number of months to a date expression in the database.
+
+    The day is clamped to the end of the target month, matching
+    ``dateutil.relativedelta`` (e.g. 2024-01-31 + 1 month = 2024-02-29).
+    ``months`` can be an integer or an expression, such as a column reference.
+    """
+
+    arity = 2
+    output_field = DateField()
+
+    # Database vendors with date arithmetic matching ``relativedelta``
+    supported_vendors = frozenset({"sqlite", "postgresql", "mysql"})
+
+    def __init__(self, expression, months, **extra):
+        if isinstance(months, int):
+            months = Value(months)
+        super().__init__(expression, months, **extra)
+
+    def _compile_args(self, compiler, connection):
+        date_expression, months_expression = self.get_source_expressions()
+        date_sql, date_params = compiler.compile(date_expression)
+        months_sql, months_params = compiler.compile(months_expression)
+        return date_sql, tuple(date_params), months_sql, tuple(months_params)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(
+            f"AddMonths is not supported on the '{connection.vendor}' database backend."
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        date_sql, date_params, months_sql, months_params = self._compile_args(
+            compiler, connection
+        )
+        # SQLite rolls over into the following month instead of clamping
+        # (2024-01-31 + 1 month = 2024-03-02), so step back to the last day
+        # of the intended month whenever the day of the month has changed.
+        shifted_sql = f"date({date_sql}, '+' || ({months_sql}) || ' months')"
+        shifted_params = date_params + months_params
+        sql = (
+            f"CASE WHEN strftime('%%d', {shifted_sql}) = strftime('%%d', {date_sql}) "
+            f"THEN {shifted_sql} "
+            f"ELSE date({shifted_sql}, 'start of month', '-1 day') END"
+        )
+        params = shifted_params + date_params + shifted_params + shifted_params
+        return sql, params
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        date_sql, date_params, months_sql, months_params = self._compile_args(
+            compiler, connection
+        )
+        sql = f"({date_sql} + make_interval(months => ({months_sql})::integer))::date"
+        return sql, date_params + months_params
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        date_sql, date_params, months_sql, months_params = self._compile_args(
+            compiler, connection
+        )
+        sql = f"DATE_ADD({date_sql}, INTERVAL ({months_sql}) MONTH)"
+        return sql, date_params + months_params
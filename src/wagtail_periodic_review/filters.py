@@ -1,20 +1,52 @@
 import django_filters
 
-from django.contrib.contenttypes.models import ContentType
-from django.utils.text import capfirst
+from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.formats import number_format
 from django.utils.translation import gettext as _
 from wagtail.admin.filters import DateRangePickerWidget, WagtailFilterSet
 from wagtail.models import Page
 
-from .utils import get_periodic_review_models
+from .content_types import get_review_content_types
+from .dates import add_months
+from .utils import OVERDUE, THIS_MONTH, get_month_range
+
+
+# Review due filter choices, besides OVERDUE and THIS_MONTH
+NEXT_MONTH = "next_month"
+LATER = "later"
 
 
 def content_type_choices():
-    choices = []
-    for model in get_periodic_review_models():
-        if ct := ContentType.objects.get_for_model(model):
-            choices.append((ct.id, capfirst(model._meta.verbose_name)))
-    return choices
+    return get_review_content_types().choices
+
+
+def review_due_choices():
+    return [
+        (OVERDUE, _("Overdue")),
+        (THIS_MONTH, _("Due this month")),
+        (NEXT_MONTH, _("Due next month")),
+        (LATER, _("Due later")),
+    ]
+
+
+def get_review_due_filters(date):
+    """
+    Returns a ``Q`` object on the ``next_review_date`` annotation for each
+    review due choice, relative to the month containing ``date``.
+    """
+    month_start, next_month_start = get_month_range(date)
+    later_start = add_months(month_start, 2)
+    return {
+        OVERDUE: Q(next_review_date__lt=month_start),
+        THIS_MONTH: Q(
+            next_review_date__gte=month_start, next_review_date__lt=next_month_start
+        ),
+        NEXT_MONTH: Q(
+            next_review_date__gte=next_month_start, next_review_date__lt=later_start
+        ),
+        LATER: Q(next_review_date__gte=later_start),
+    }
 
 
 class PeriodicReviewFilterSet(WagtailFilterSet):
@@ -24,6 +56,12 @@ class PeriodicReviewFilterSet(WagtailFilterSet):
         choices=content_type_choices,
         empty_label=_("Any"),
     )
+    review_due = django_filters.ChoiceFilter(
+        label=_("Review due"),
+        choices=review_due_choices,
+        method="filter_review_due",
+        empty_label=_("Any"),
+    )
     last_review = django_filters.DateFromToRangeFilter(
         label=_("Last reviewed"),
         field_name="last_review_date",
@@ -35,6 +73,69 @@ class PeriodicReviewFilterSet(WagtailFilterSet):
         widget=DateRangePickerWidget(),
     )
 
+    # The filters whose choices are labelled with the number of matching pages
+    facet_filters = ("content_type", "review_due")
+
     class Meta:
         model = Page
-        fields = ("content_type", "last_review", "next_review")
+        fields = ("content_type", "review_due", "last_review", "next_review")
+
+    def filter_review_due(self, queryset, name, value):
+        return queryset.filter(get_review_due_filters(timezone.now().date())[value])
+
+    def get_facet_counts(self, queryset):
+        """
+        Returns the number of pages in ``queryset`` (annotated with
+        ``next_review_date``) for each choice of the ``facet_filters``, as
+        ``{filter name: {choice value: count}}``. Each choice is counted with
+        the other filters applied, as the number of pages selecting it would
+        show.
+
+        All counts come from a single query, grouped by content type with
+        a conditional count for each review due choice.
+        """
+        if "next_review_date" not in queryset.query.annotations:
+            return {}
+
+        data = self.form.cleaned_data
+        for name, filter_ in self.filters.items():
+            if name not in self.facet_filters:
+                queryset = filter_.filter(queryset, data.get(name))
+
+        due_filters = get_review_due_filters(timezone.now().date())
+        review_due = data.get("review_due")
+        rows = (
+            queryset.order_by()
+            .values("content_type_id")
+            .annotate(
+                facet_total=Count("pk", filter=due_filters.get(review_due)),
+                **{
+                    f"facet_{choice}": Count("pk", filter=due_filter)
+                    for choice, due_filter in due_filters.items()
+                },
+            )
+        )
+
+        content_type = data.get("content_type")
+        counts = {
+            "content_type": {},
+            "review_due": dict.fromkeys(due_filters, 0),
+        }
+        for row in rows:
+            counts["content_type"][row["content_type_id"]] = row["facet_total"]
+            if not content_type or str(row["content_type_id"]) == content_type:
+                for choice in due_filters:
+                    counts["review_due"][choice] += row[f"facet_{choice}"]
+        return counts
+
+    def set_facet_counts(self, counts):
+        """
+        Adds the ``counts`` from ``get_facet_counts()`` to the labels
+        of the filter form's choices, such as "Overdue (87)".
+        """
+        for name, choice_counts in counts.items():
+            choices = []
+            for value, label in self.filters[name].extra["choices"]():
+                count = number_format(choice_counts.get(value, 0), force_grouping=True)
+                choices.append((value, f"{label} ({count})"))
+            self.form.fields[name].choices = choices
@@ -0,0 +1,106 @@
+import logging
+import time
+
+from contextlib import contextmanager, nullcontext
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .signals import review_operation_finished
+
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    tracer = None
+else:
+    tracer = trace.get_tracer("wagtail_periodic_review")
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReviewOperation:
+    """
+    The measurements of an instrumented operation: how long it took in
+    seconds, the number of database queries it made, and the number of rows
+    it returned or updated, if known. ``site_id`` and ``content_type_id``
+    are set for operations limited to a site or content type.
+    """
+
+    def __init__(self, name, *, site_id=None, content_type_id=None):
+        self.name = name
+        self.site_id = site_id
+        self.content_type_id = content_type_id
+        self.rows = None
+        self.duration = None
+        self.query_count = 0
+
+    def __repr__(self):
+        return f"<ReviewOperation {self.name}>"
+
+    def as_dict(self):
+        return {
+            "operation": self.name,
+            "site_id": self.site_id,
+            "content_type_id": self.content_type_id,
+            "rows": self.rows,
+            "duration": self.duration,
+            "query_count": self.query_count,
+        }
+
+
+def is_enabled():
+    return (
+        tracer is not None
+        or review_operation_finished.has_listeners()
+        or logger.isEnabledFor(logging.DEBUG)
+    )
+
+
+@contextmanager
+def instrument(name, *, site_id=None, content_type_id=None, using=DEFAULT_DB_ALIAS):
+    """
+    Measures the code run in the block, which can set ``rows`` on the yielded
+    ``ReviewOperation``. When it completes, the measurements are sent with the
+    ``review_operation_finished`` signal, logged at DEBUG level by the
+    ``wagtail_periodic_review.instrumentation`` logger, and recorded on an
+    OpenTelemetry span if ``opentelemetry-api`` is installed.
+
+    Nothing is measured unless at least one of these is in use.
+    """
+    operation = ReviewOperation(name, site_id=site_id, content_type_id=content_type_id)
+    if not is_enabled():
+        yield operation
+        return
+
+    def count_queries(execute, sql, params, many, context):
+        operation.query_count += 1
+        return execute(sql, params, many, context)
+
+    span_context = (
+        nullcontext()
+        if tracer is None
+        else tracer.start_as_current_span(f"wagtail_periodic_review.{name}")
+    )
+    with span_context as span, connections[using].execute_wrapper(count_queries):
+        started = time.perf_counter()
+        yield operation
+        operation.duration = time.perf_counter() - started
+        if span is not None:
+            span.set_attributes(
+                {
+                    f"wagtail_periodic_review.{key}": value
+                    for key, value in operation.as_dict().items()
+                    if value is not None and key not in ("operation", "duration")
+                }
+            )
+
+    logger.debug(
+        "%s took %.1f ms, with %d queries and %s rows",
+        name,
+        operation.duration * 1000,
+        operation.query_count,
+        operation.rows,
+        extra={"review_operation": operation.as_dict()},
+    )
+    review_operation_finished.send(sender=ReviewOperation, operation=operation)
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from wagtail_periodic_review.models import PageReviewIndex
+from wagtail_periodic_review.review_index import rebuild_review_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Recreates the periodic review index for all pages using PeriodicReviewMixin."
+    )
+
+    def handle(self, *args, **options):
+        rebuild_review_index()
+        self.stdout.write(
+            f"Indexed {PageReviewIndex.objects.count()} pages for periodic review."
+        )
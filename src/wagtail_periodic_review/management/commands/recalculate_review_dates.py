@@ -0,0 +1,195 @@
+import json
+import os
+import time
+
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from wagtail.models import Site
+
+from wagtail_periodic_review.models import ReviewFrequencyChoices
+from wagtail_periodic_review.rules import get_rule_frequency
+from wagtail_periodic_review.sites import get_site_id_for_path
+from wagtail_periodic_review.utils import (
+    get_periodic_review_models,
+    update_next_review_dates,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculates next review dates for pages using PeriodicReviewMixin, "
+        "in chunks that are each committed in their own transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--site",
+            action="append",
+            type=int,
+            dest="site_ids",
+            metavar="SITE_ID",
+            help="Only recalculate pages in this site. Can be used multiple times.",
+        )
+        parser.add_argument(
+            "--content-type",
+            action="append",
+            dest="content_types",
+            metavar="APP_LABEL.MODEL",
+            help="Only recalculate pages of this type. Can be used multiple times.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="The number of pages updated per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to wait between chunks, to limit database load.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="A file to record progress in after each chunk, removed on completion.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue from the position recorded in the --checkpoint file.",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be a positive number.")
+        if options["resume"] and not options["checkpoint"]:
+            raise CommandError("--resume requires --checkpoint.")
+
+        self.checkpoint_path = options["checkpoint"]
+        checkpoint = self.read_checkpoint() if options["resume"] else None
+
+        for site, model, content_type_id in self.get_targets(options):
+            if checkpoint:
+                if (site.pk, content_type_id) != (
+                    checkpoint["site_id"],
+                    checkpoint["content_type_id"],
+                ):
+                    continue
+                last_pk = checkpoint["last_pk"]
+                checkpoint = None
+            else:
+                last_pk = 0
+
+            updated = self.recalculate(
+                site,
+                model,
+                content_type_id,
+                last_pk,
+                chunk_size=options["chunk_size"],
+                sleep=options["sleep"],
+            )
+            if options["verbosity"] > 0:
+                self.stdout.write(
+                    f"{site}: updated {updated} {model._meta.verbose_name_plural}."
+                )
+
+        if checkpoint:
+            raise CommandError(
+                "The checkpoint does not match the selected sites and content types."
+            )
+
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def get_targets(self, options):
+        """
+        Returns a list of ``(site, model, content_type_id)`` tuples to recalculate,
+        with sites ordered so that pages within nested sites are processed last,
+        and models after the models they inherit from.
+        """
+        sites = Site.objects.select_related("root_page").order_by("root_page__path")
+        if options["site_ids"]:
+            sites = sites.filter(pk__in=options["site_ids"])
+
+        models = get_periodic_review_models()
+        if options["content_types"]:
+            selected = set()
+            for label in options["content_types"]:
+                try:
+                    app_label, model_name = label.lower().split(".")
+                    content_type = ContentType.objects.get_by_natural_key(
+                        app_label, model_name
+                    )
+                except (ValueError, ContentType.DoesNotExist) as e:
+                    raise CommandError(f"Unknown content type '{label}'.") from e
+                selected.add(content_type.model_class())
+            models = [model for model in models if model in selected]
+
+        content_types = ContentType.objects.get_for_models(*models)
+        return [
+            (site, model, content_types[model].pk) for site in sites for model in models
+        ]
+
+    def recalculate(self, site, model, content_type_id, last_pk, *, chunk_size, sleep):
+        queryset = (
+            model.objects.descendant_of(site.root_page, inclusive=True)
+            .filter(content_type_id=content_type_id)
+            .order_by("pk")
+            .values_list("pk", "path", "custom_review_frequency")
+        )
+        updated = 0
+        while rows := list(queryset.filter(pk__gt=last_pk)[:chunk_size]):
+            # Group the pages by the frequency of their most specific rule
+            pks_by_frequency = defaultdict(list)
+            for pk, path, custom_frequency in rows:
+                if get_site_id_for_path(path) != site.pk:
+                    # The page belongs to a nested site (or another site with
+                    # the same root page), and is recalculated with its rules
+                    continue
+                frequency = (
+                    custom_frequency
+                    or get_rule_frequency(site.pk, content_type_id, path)
+                    or ReviewFrequencyChoices.TWELVE_MONTHS
+                )
+                pks_by_frequency[frequency].append(pk)
+            with transaction.atomic():
+                for frequency, pks in pks_by_frequency.items():
+                    updated += update_next_review_dates(
+                        model.objects.filter(pk__in=pks), frequency
+                    )
+            last_pk = rows[-1][0]
+            self.write_checkpoint(
+                {
+                    "site_id": site.pk,
+                    "content_type_id": content_type_id,
+                    "last_pk": last_pk,
+                }
+            )
+            if sleep:
+                time.sleep(sleep)
+        return updated
+
+    def read_checkpoint(self):
+        try:
+            with open(self.checkpoint_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            # Nothing to resume
+            return None
+        except ValueError as e:
+            raise CommandError(
+                f"Invalid checkpoint file '{self.checkpoint_path}'."
+            ) from e
+
+    def write_checkpoint(self, position):
+        if not self.checkpoint_path:
+            return
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(position, f)
+        # Replace the file in one step, so an interrupted run
+        # never leaves a partially written checkpoint
+        os.replace(temp_path, self.checkpoint_path)
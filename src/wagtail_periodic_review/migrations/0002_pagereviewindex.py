@@ -0,0 +1,54 @@
+# Generated by Django 5.1.15 on 2026-10-18 14:07
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("wagtail_periodic_review", "0001_initial"),
+        ("wagtailcore", "0083_workflowcontenttype"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PageReviewIndex",
+            fields=[
+                (
+                    "page",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="review_index",
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("last_review_date", models.DateField(null=True)),
+                ("next_review_date", models.DateField(db_index=True, null=True)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "site",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="wagtailcore.site",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "page review index entry",
+                "verbose_name_plural": "page review index entries",
+            },
+        ),
+    ]
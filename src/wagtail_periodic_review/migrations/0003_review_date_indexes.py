@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-18 14:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_periodic_review", "0002_pagereviewindex"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pagereviewindex",
+            name="last_review_date",
+            field=models.DateField(db_index=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="pagereviewindex",
+            index=models.Index(
+                fields=["site", "content_type", "next_review_date"],
+                name="wpr_site_type_next_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-18 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_periodic_review", "0003_review_date_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="periodicreviewfrequencyrule",
+            name="recalculation_pending",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.15 on 2026-10-18 14:56
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "wagtail_periodic_review",
+            "0004_periodicreviewfrequencyrule_recalculation_pending",
+        ),
+        ("wagtailcore", "0083_workflowcontenttype"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="periodicreviewfrequencyrule",
+            name="unique_rule",
+        ),
+        migrations.AddField(
+            model_name="periodicreviewfrequencyrule",
+            name="root_page",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Only apply this rule to this page and the pages below it. Leave blank to apply it to the whole site.",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="wagtailcore.page",
+                verbose_name="subtree",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="periodicreviewfrequencyrule",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("root_page__isnull", True)),
+                fields=("sitesettings", "content_type"),
+                name="unique_rule",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="periodicreviewfrequencyrule",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("root_page__isnull", False)),
+                fields=("sitesettings", "content_type", "root_page"),
+                name="unique_subtree_rule",
+            ),
+        ),
+    ]
@@ -1,6 +1,10 @@
-from dateutil.relativedelta import relativedelta
+from functools import partial, reduce
+from operator import or_
+
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import F
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from modelcluster.fields import ParentalKey
@@ -10,7 +14,18 @@ from wagtail.contrib.settings.models import BaseSiteSetting, register_setting
 from wagtail.models import Orderable
 from wagtail.search import index
 
-from .utils import get_periodic_review_models
+from .caching import invalidate_review_data
+from .content_types import get_review_content_types
+from .dates import add_months
+from .expressions import AddMonths
+from .instrumentation import instrument
+from .panels import RecalculationStatusPanel
+from .paths import get_subtree_filter, get_subtree_roots
+from .review_index import INDEXED_PAGE_FIELDS
+from .rules import get_rule_frequency, get_subtree_rule_map, invalidate_rule_map
+from .sites import get_site_id_for_path, get_site_path_index
+from .tasks import defer_recalculation
+from .utils import update_next_review_dates
 from .widgets import PeriodicReviewContentTypeSelect
 
 
@@ -26,6 +41,12 @@ class ReviewFrequencyChoices(models.IntegerChoices):
     FOUR_YEARS = 48, _("4 years")
 
 
+def _get_field_names(model, names):
+    # The field names for names that may be attribute names, such as
+    # "content_type_id"
+    return {model._meta.get_field(name).name for name in names}
+
+
 class PeriodicReviewMixin(models.Model):
     """
     A mixin class to be use with page types that require
@@ -76,14 +97,45 @@ class PeriodicReviewMixin(models.Model):
     def save(self, *args, **kwargs):
         """
         Overrides Page.save() to recalculate ``next_review_date`` whenever
-        ``last_review_date`` is updated.
+        ``last_review_date`` is updated, and to keep the page's
+        ``PageReviewIndex`` entry up to date.
         """
-        if (
-            "update_fields" not in kwargs
-            or "last_review_date" in kwargs["update_fields"]
-        ):
-            self.next_review_date = self.calculate_next_review_date()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "last_review_date" in update_fields:
+            self.set_next_review_date()
         super().save(*args, **kwargs)
+        if update_fields is None or not _get_field_names(
+            self, update_fields
+        ).isdisjoint(_get_field_names(self, INDEXED_PAGE_FIELDS)):
+            self.update_review_index()
+
+    def set_next_review_date(self):
+        self.next_review_date = self.calculate_next_review_date()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if instance.get_deferred_fields().isdisjoint(INDEXED_PAGE_FIELDS):
+            instance._indexed_values = (instance.pk, instance.get_indexed_values())
+        return instance
+
+    def get_indexed_values(self):
+        return {field: getattr(self, field) for field in INDEXED_PAGE_FIELDS}
+
+    def update_review_index(self):
+        """
+        Updates the page's ``PageReviewIndex`` entry, unless the indexed values
+        are the same as when the page was loaded from the database.
+        """
+        indexed_values = (self.pk, self.get_indexed_values())
+        if indexed_values == getattr(self, "_indexed_values", None):
+            return
+        PageReviewIndex.objects.update_or_create(
+            page_id=self.pk,
+            defaults={"site_id": self.get_review_site_id(), **indexed_values[1]},
+        )
+        self._indexed_values = indexed_values
+        invalidate_review_data()
 
     def with_content_json(self, content_json):
         """
@@ -92,27 +144,141 @@ class PeriodicReviewMixin(models.Model):
         """
         obj = super().with_content_json(content_json)
         obj.next_review_date = self.next_review_date
+        # The revision is saved over the same database row
+        if hasattr(self, "_indexed_values"):
+            obj._indexed_values = self._indexed_values
         return obj
 
+    def get_review_site_id(self):
+        """
+        Returns the ID of the site whose frequency rules apply to this page:
+        the site with the most specific root page at or above it in the tree,
+        whether or not the page is routable.
+        """
+        if self.path:
+            return get_site_id_for_path(self.path)
+
     def get_review_frequency_rule(self):
-        if url_parts := self.get_url_parts():
-            return PeriodicReviewFrequencyRule.objects.filter(
-                sitesettings__site_id=url_parts[0],
-                content_type=self.cached_content_type,
-            ).first()
+        """
+        Returns the rule for the most specific subtree containing this page,
+        or the site-wide rule for its type if no subtree rule applies.
+        """
+        if site_id := self.get_review_site_id():
+            rules = [
+                rule
+                for rule in PeriodicReviewFrequencyRule.objects.filter(
+                    sitesettings__site_id=site_id,
+                    content_type=self.cached_content_type,
+                ).select_related("root_page")
+                if rule.root_page is None or self.path.startswith(rule.root_page.path)
+            ]
+            return max(
+                rules,
+                key=lambda rule: len(rule.root_page.path) if rule.root_page else 0,
+                default=None,
+            )
 
     def get_review_frequency(self):
         if self.custom_review_frequency:
             return self.custom_review_frequency
-        if rule := self.get_review_frequency_rule():
-            return rule.frequency
+        if (site_id := self.get_review_site_id()) and (
+            frequency := get_rule_frequency(site_id, self.content_type_id, self.path)
+        ):
+            return frequency
         return ReviewFrequencyChoices.TWELVE_MONTHS
 
     def calculate_next_review_date(self):
         if self.last_review_date:
-            return self.last_review_date + relativedelta(
-                months=self.get_review_frequency()
-            )
+            return add_months(self.last_review_date, self.get_review_frequency())
+
+
+if hasattr(models, "GeneratedField"):
+
+    class GeneratedReviewDateMixin(PeriodicReviewMixin):
+        """
+        A variant of ``PeriodicReviewMixin`` that stores the effective review
+        frequency of each page, and has the database calculate
+        ``next_review_date`` from it and ``last_review_date``, as a stored
+        generated column.
+
+        ``next_review_date`` stays correct however ``last_review_date`` is
+        changed, including by ``QuerySet.update()``, and changes to the
+        frequency settings only update ``review_frequency``.
+
+        Requires Django 5.0+, and SQLite, PostgreSQL or MySQL.
+        """
+
+        review_frequency = models.PositiveIntegerField(
+            default=ReviewFrequencyChoices.TWELVE_MONTHS, editable=False
+        )
+        next_review_date = models.GeneratedField(
+            expression=AddMonths(F("last_review_date"), F("review_frequency")),
+            output_field=models.DateField(null=True),
+            db_persist=True,
+        )
+
+        class Meta:
+            abstract = True
+
+        def save(self, *args, **kwargs):
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "last_review_date" in update_fields:
+                # set_next_review_date() updates the frequency the database
+                # calculates next_review_date from
+                kwargs["update_fields"] = {*update_fields, "review_frequency"}
+            super().save(*args, **kwargs)
+
+        def set_next_review_date(self):
+            self.review_frequency = self.get_review_frequency()
+            # The database calculates the saved value, but the page's index
+            # entry is updated from this one, without refetching the page
+            self.next_review_date = self.calculate_next_review_date()
+
+        def with_content_json(self, content_json):
+            obj = super().with_content_json(content_json)
+            obj.review_frequency = self.review_frequency
+            return obj
+
+
+class PageReviewIndex(models.Model):
+    """
+    A denormalised copy of the review dates of every page using
+    ``PeriodicReviewMixin``, allowing review queries to use a single
+    table, however many page types use the mixin.
+
+    Entries are kept up to date by ``PeriodicReviewMixin.save()`` and
+    the next review date recalculation, and can be recreated with the
+    ``rebuild_periodic_review_index`` management command.
+    """
+
+    page = models.OneToOneField(
+        "wagtailcore.Page",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="review_index",
+    )
+    site = models.ForeignKey(
+        "wagtailcore.Site", null=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    last_review_date = models.DateField(null=True, db_index=True)
+    next_review_date = models.DateField(null=True, db_index=True)
+
+    class Meta:
+        verbose_name = _("page review index entry")
+        verbose_name_plural = _("page review index entries")
+        indexes = [
+            # per-site and per-type review queries, e.g. for recalculation
+            models.Index(
+                fields=["site", "content_type", "next_review_date"],
+                name="wpr_site_type_next_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return str(self.page_id)
 
 
 class PeriodicReviewFrequencyRule(Orderable):
@@ -128,19 +294,59 @@ class PeriodicReviewFrequencyRule(Orderable):
         choices=ReviewFrequencyChoices.choices,
         default=ReviewFrequencyChoices.TWELVE_MONTHS,
     )
+    root_page = models.ForeignKey(
+        "wagtailcore.Page",
+        verbose_name=_("subtree"),
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text=_(
+            "Only apply this rule to this page and the pages below it. "
+            "Leave blank to apply it to the whole site."
+        ),
+    )
+    recalculation_pending = models.BooleanField(default=False, editable=False)
 
     class Meta(Orderable.Meta):
         constraints = [
             models.UniqueConstraint(
-                fields=["sitesettings", "content_type"], name="unique_rule"
-            )
+                fields=["sitesettings", "content_type"],
+                condition=models.Q(root_page__isnull=True),
+                name="unique_rule",
+            ),
+            models.UniqueConstraint(
+                fields=["sitesettings", "content_type", "root_page"],
+                condition=models.Q(root_page__isnull=False),
+                name="unique_subtree_rule",
+            ),
         ]
 
     panels = [
         FieldPanel("content_type", widget=PeriodicReviewContentTypeSelect),
         FieldPanel("frequency"),
+        FieldPanel("root_page"),
     ]
 
+    def clean(self):
+        super().clean()
+        if self.root_page is None:
+            return
+        # Pages within nested sites use the nested site's rules
+        if get_site_id_for_path(self.root_page.path) != self.sitesettings.site_id:
+            raise ValidationError(
+                {"root_page": _("The subtree must be within the site.")}
+            )
+        # The site-wide rule covers the same pages
+        if self.root_page_id == self.sitesettings.site.root_page_id:
+            raise ValidationError(
+                {
+                    "root_page": _(
+                        "Leave the subtree blank to apply the rule to the whole site."
+                    )
+                }
+            )
+
     @property
     def cached_content_type(self):
         return ContentType.objects.get_for_id(self.content_type_id)
@@ -149,75 +355,233 @@ class PeriodicReviewFrequencyRule(Orderable):
     def model_class(self):
         return self.cached_content_type.model_class()
 
+    def get_excluded_paths(self, site):
+        """
+        Returns the root paths of the subtrees within this rule's subtree (or
+        site) that are covered by more specific rules: subtree rules of the
+        same site and content type, and nested sites.
+        """
+        root_path = (self.root_page or site.root_page).path
+        subtree_rules = get_subtree_rule_map().get((site.pk, self.content_type_id), [])
+        excluded_paths = [
+            path
+            for path, _frequency in subtree_rules
+            if path != root_path and path.startswith(root_path)
+        ]
+        excluded_paths += [
+            path
+            for path, site_id in get_site_path_index()
+            if site_id != site.pk and path.startswith(root_path)
+        ]
+        return get_subtree_roots(excluded_paths)
+
     def set_next_review_dates(self, site=None):
         """
-        Updates ``next_review_date`` for all pages of relevant type,
-        provided they have a ``last_review_date`` value and are not using
-        ``custom_review_frequency``.
+        Updates ``next_review_date`` for all pages of relevant type within the
+        rule's subtree (or the whole site), provided they have a
+        ``last_review_date`` value and are not using ``custom_review_frequency``.
+        Returns the number of pages updated.
+
+        Pages in subtrees covered by more specific rules, and pages of subclasses
+        of the rule's model, are left to their own rules, as they are when pages
+        are saved. The pages are updated with a single ranged UPDATE per table.
         """
+        if self.model_class is None:
+            # The model no longer exists
+            return 0
         site = site or self.sitesettings.site
-        to_update = []
-        for obj in (
-            self.model_class.objects.all()
-            .descendant_of(site.root_page)
-            .filter(
-                # required for calculation
-                last_review_date__isnull=False,
-                # allow these pages to maintain their own value on save
-                custom_review_frequency__isnull=True,
-            )
-            .only("id", "next_review_date")
-        ):
-            obj.next_review_date = obj.last_review_date + relativedelta(
-                months=self.frequency
+        queryset = self.model_class.objects.filter(
+            get_subtree_filter((self.root_page or site.root_page).path),
+            content_type_id=self.content_type_id,
+            # allow these pages to maintain their own value on save
+            custom_review_frequency__isnull=True,
+        )
+        if excluded_paths := self.get_excluded_paths(site):
+            queryset = queryset.exclude(
+                reduce(or_, map(get_subtree_filter, excluded_paths))
             )
-        self.model_class.objects.bulk_update(to_update, ["next_review_date"])
+        with instrument(
+            "set_next_review_dates",
+            site_id=site.pk,
+            content_type_id=self.content_type_id,
+        ) as operation:
+            operation.rows = update_next_review_dates(queryset, self.frequency)
+        return operation.rows
 
 
 @register_setting
 class PeriodicReviewFrequencySettings(ClusterableModel, BaseSiteSetting):
-    panels = [InlinePanel("frequency_rules")]
+    panels = [RecalculationStatusPanel(), InlinePanel("frequency_rules")]
 
-    def clean_frequency_rules(self):
+    @classmethod
+    def sync_frequency_rules(cls, sitesettings_ids=None):
         """
-        Called after saving to ensure rules exist for all subclasses of PeriodicReviewMixin,
-        and rules that no longer meet that criteria are deleted.
+        Ensures rules exist for all subclasses of PeriodicReviewMixin, and deletes
+        rules that no longer meet that criteria, for the settings objects with the
+        given IDs (or all of them). Uses a fixed number of queries, however
+        many rules and settings objects there are. Returns the number of rules
+        created and deleted.
         """
-        target_models = set(get_periodic_review_models())
-        covered_models = set()
+        if sitesettings_ids is None:
+            sitesettings_ids = list(cls.objects.values_list("pk", flat=True))
+        target_content_type_ids = set(get_review_content_types().ids)
+        rules = PeriodicReviewFrequencyRule.objects.filter(
+            sitesettings_id__in=sitesettings_ids
+        )
 
-        for obj in self.frequency_rules.all():
-            if obj.model_class not in target_models:
-                obj.delete()
-            else:
-                covered_models.add(obj.model_class)
-
-        for model_class in target_models:
-            if model_class not in covered_models:
-                PeriodicReviewFrequencyRule.objects.create(
-                    sitesettings=self,
-                    content_type=ContentType.objects.get_for_model(model_class),
-                    frequency=ReviewFrequencyChoices.TWELVE_MONTHS,
+        # Only site-wide rules cover a content type, but new rules
+        # are ordered after all existing ones
+        covered_content_type_ids = {}
+        max_sort_orders = {}
+        for (
+            sitesettings_id,
+            content_type_id,
+            sort_order,
+            root_page_id,
+        ) in rules.values_list(
+            "sitesettings_id", "content_type_id", "sort_order", "root_page_id"
+        ):
+            if root_page_id is None:
+                covered_content_type_ids.setdefault(sitesettings_id, set()).add(
+                    content_type_id
+                )
+            max_sort_orders[sitesettings_id] = max(
+                max_sort_orders.get(sitesettings_id, 0), sort_order or 0
+            )
+
+        deleted, _ = rules.exclude(content_type_id__in=target_content_type_ids).delete()
+
+        new_rules = []
+        for sitesettings_id in sitesettings_ids:
+            covered = covered_content_type_ids.get(sitesettings_id, set())
+            sort_order = max_sort_orders.get(sitesettings_id, -1)
+            for content_type_id in sorted(target_content_type_ids - covered):
+                sort_order += 1
+                new_rules.append(
+                    PeriodicReviewFrequencyRule(
+                        sitesettings_id=sitesettings_id,
+                        content_type_id=content_type_id,
+                        frequency=ReviewFrequencyChoices.TWELVE_MONTHS,
+                        sort_order=sort_order,
+                    )
                 )
+        if new_rules:
+            PeriodicReviewFrequencyRule.objects.bulk_create(new_rules)
+            # bulk_create() does not send post_save signals
+            invalidate_rule_map()
+        return deleted + len(new_rules)
+
+    def clean_frequency_rules(self):
+        """
+        Called after creating settings to ensure rules exist for all subclasses of
+        PeriodicReviewMixin, and rules that no longer meet that criteria are deleted.
+        This also runs for all settings after migrations, as models are added or removed.
+        """
+        with instrument("clean_frequency_rules", site_id=self.site_id) as operation:
+            operation.rows = self.sync_frequency_rules([self.pk])
 
-    def recalculate_next_review_dates(self):
+    def get_saved_frequencies(self):
+        """
+        Returns a dictionary of the frequencies currently stored in the
+        database for this site's rules, keyed by content type ID for site-wide
+        rules, and by ``(content_type_id, root_page_id)`` for subtree rules.
+        """
+        if self.pk is None:
+            return {}
+        return {
+            content_type_id
+            if root_page_id is None
+            else (
+                content_type_id,
+                root_page_id,
+            ): frequency
+            for content_type_id, root_page_id, frequency in (
+                PeriodicReviewFrequencyRule.objects.filter(
+                    sitesettings_id=self.pk
+                ).values_list("content_type_id", "root_page_id", "frequency")
+            )
+        }
+
+    def get_changed_content_type_ids(
+        self, previous_frequencies, current_frequencies=None
+    ):
+        """
+        Returns the IDs of content types whose effective review frequency differs
+        from ``previous_frequencies`` to ``current_frequencies`` (both as returned
+        by ``get_saved_frequencies()``, which is called if ``current_frequencies``
+        is not given). Content types without a site-wide rule use the default
+        frequency of 12 months, and adding or removing a subtree rule always
+        counts as a change.
+        """
+        if current_frequencies is None:
+            current_frequencies = self.get_saved_frequencies()
+        changed = set()
+        for key in previous_frequencies.keys() | current_frequencies.keys():
+            if isinstance(key, tuple):
+                content_type_id, default = key[0], None
+            else:
+                content_type_id, default = key, ReviewFrequencyChoices.TWELVE_MONTHS
+            if previous_frequencies.get(key, default) != current_frequencies.get(
+                key, default
+            ):
+                changed.add(content_type_id)
+        return changed
+
+    def recalculate_next_review_dates(self, content_type_ids=None):
         """
         Called after saving to update the 'next_review_date' value for all
         relevant pages, according to the ``rules`` defined for the site.
+        If ``content_type_ids`` is provided, only rules for those content
+        types are applied.
 
         NOTE: PageRevisions do not need updating, because pages should retain
         their live 'next_review_date' value when restored from revisions (see
         ``PeriodicReviewMixin.with_content_json()``).
+
+        Each rule only updates pages of its exact content type, so the order
+        the rules are applied in does not matter.
         """
-        # TODO: Reorder types in such a way that multiple non-abstract models in the same
-        # inheritance chain are processed in 'least -> most specific' order.
-        for rule in self.frequency_rules.all():
+        rules = self.frequency_rules.select_related("root_page")
+        if content_type_ids is not None:
+            rules = rules.filter(content_type_id__in=content_type_ids)
+        for rule in rules:
             rule.set_next_review_dates(site=self.site)
 
+    def enqueue_next_review_date_recalculation(self, content_type_ids):
+        """
+        Marks the rules for ``content_type_ids`` as pending, and enqueues a
+        background task per rule to recalculate the next review dates of its
+        pages once the current transaction is committed.
+        """
+        from .tasks import recalculate_rule_next_review_dates
+
+        rules = self.frequency_rules.filter(content_type_id__in=content_type_ids)
+        rules.update(recalculation_pending=True)
+        for rule_id in rules.values_list("pk", flat=True):
+            transaction.on_commit(
+                partial(recalculate_rule_next_review_dates.enqueue, rule_id)
+            )
+
     def save(self, *args, **kwargs):
+        adding = self._state.adding
+        previous_frequencies = self.get_saved_frequencies()
         super().save(*args, **kwargs)
-        self.clean_frequency_rules()
-        self.recalculate_next_review_dates()
+        current_frequencies = None if adding else self.get_saved_frequencies()
+        if adding or any(
+            not isinstance(key, tuple) and key not in current_frequencies
+            for key in previous_frequencies
+        ):
+            # Create the rules for new settings, and recreate site-wide
+            # rules removed from the settings, with the default frequency
+            self.clean_frequency_rules()
+            current_frequencies = None
+        if changed_content_type_ids := self.get_changed_content_type_ids(
+            previous_frequencies, current_frequencies
+        ):
+            if defer_recalculation():
+                self.enqueue_next_review_date_recalculation(changed_content_type_ids)
+            else:
+                self.recalculate_next_review_dates(changed_content_type_ids)
 
     class Meta:
         verbose_name = _("periodic review frequency")
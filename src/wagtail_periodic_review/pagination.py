@@ -0,0 +1,154 @@
+import datetime
+import math
+
+from collections.abc import Sequence
+
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+class KeysetPage(Sequence):
+    """
+    A page of a ``KeysetPaginator``, with the same interface as Django's
+    ``Page``, except that page "numbers" for other pages are cursors.
+    """
+
+    def __init__(self, object_list, number, paginator, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f"<Page {self.number}>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def next_page_number(self):
+        return self.next_cursor
+
+    def previous_page_number(self):
+        return self.previous_cursor
+
+
+class KeysetPaginator:
+    """
+    Paginates a queryset ordered by a date field and the primary key, by
+    filtering on the position of the last (or first) item of the adjacent page
+    instead of using OFFSET, so that every page costs the same to fetch.
+
+    Pages are identified by cursors such as ``3-a-20240501-123``: page 3 is
+    the page after (``a``) the item dated 2024-05-01 with primary key 123, and
+    ``b`` is the page before it. Items without a date are not paginated.
+
+    ``count`` is limited to ``count_limit`` items, if given, so that counting
+    the items of large querysets stays cheap.
+    """
+
+    def __init__(self, queryset, per_page, *, date_field, count_limit=None):
+        self.queryset = queryset.filter(**{f"{date_field}__isnull": False})
+        self.per_page = per_page
+        self.date_field = date_field
+        self.count_limit = count_limit
+
+    @cached_property
+    def _count(self):
+        queryset = self.queryset.order_by().values("pk")
+        if self.count_limit is not None:
+            # Count one more item than the limit, to tell if it was reached
+            queryset = queryset[: self.count_limit + 1]
+        return queryset.count()
+
+    @property
+    def count(self):
+        if self.count_is_limited:
+            return self.count_limit
+        return self._count
+
+    @property
+    def count_is_limited(self):
+        return self.count_limit is not None and self._count > self.count_limit
+
+    @property
+    def num_pages(self):
+        num_pages = max(1, math.ceil(self.count / self.per_page))
+        if self.count_is_limited:
+            return f"{num_pages}+"
+        return num_pages
+
+    def get_cursor(self, number, direction, item):
+        date = getattr(item, self.date_field)
+        return f"{number}-{direction}-{date:%Y%m%d}-{item.pk}"
+
+    def parse_cursor(self, cursor):
+        """
+        Returns a ``(number, direction, date, pk)`` tuple for ``cursor``, or
+        ``None`` if it is missing or invalid.
+        """
+        try:
+            number, direction, date, pk = str(cursor).split("-")
+            number, pk = int(number), int(pk)
+            date = datetime.datetime.strptime(date, "%Y%m%d").date()
+        except (TypeError, ValueError):
+            return None
+        if number < 1 or direction not in ("a", "b"):
+            return None
+        return number, direction, date, pk
+
+    def get_page(self, cursor):
+        """
+        Returns the ``KeysetPage`` for ``cursor``, or the first page if
+        ``cursor`` is missing or invalid.
+        """
+        date_field = self.date_field
+        if (position := self.parse_cursor(cursor)) is None:
+            number, direction = 1, "a"
+            queryset = self.queryset.order_by(date_field, "pk")
+        else:
+            number, direction, date, pk = position
+            if direction == "a":
+                queryset = self.queryset.filter(
+                    Q(**{f"{date_field}__gt": date})
+                    | Q(**{date_field: date, "pk__gt": pk})
+                ).order_by(date_field, "pk")
+            else:
+                queryset = self.queryset.filter(
+                    Q(**{f"{date_field}__lt": date})
+                    | Q(**{date_field: date, "pk__lt": pk})
+                ).order_by(f"-{date_field}", "-pk")
+
+        # Fetch an extra item to find out whether there are more
+        object_list = list(queryset[: self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+
+        if direction == "a":
+            has_next, has_previous = has_more, position is not None
+        else:
+            object_list.reverse()
+            has_next, has_previous = True, has_more
+            if not has_previous:
+                # Items may have been added or removed since the cursor
+                # was created, so don't rely on it for the first page
+                number = 1
+
+        next_cursor = previous_cursor = None
+        if object_list and has_next:
+            next_cursor = self.get_cursor(number + 1, "a", object_list[-1])
+        if object_list and has_previous:
+            previous_cursor = self.get_cursor(max(number - 1, 1), "b", object_list[0])
+        return KeysetPage(object_list, number, self, next_cursor, previous_cursor)
@@ -0,0 +1,31 @@
+from django.utils.text import capfirst
+from wagtail.admin.panels import Panel
+
+
+class RecalculationStatusPanel(Panel):
+    """
+    Shows the content types whose next review dates are waiting to be
+    recalculated in the background, after their review frequency changed.
+    """
+
+    class BoundPanel(Panel.BoundPanel):
+        template_name = "wagtailadmin/periodic_review/recalculation_status_panel.html"
+
+        def get_pending_content_types(self):
+            if self.instance is None or self.instance.pk is None:
+                return []
+            return [
+                capfirst(rule.model_class._meta.verbose_name)
+                for rule in self.instance.frequency_rules.filter(
+                    recalculation_pending=True
+                )
+                if rule.model_class
+            ]
+
+        def is_shown(self):
+            return super().is_shown() and bool(self.get_pending_content_types())
+
+        def get_context_data(self, parent_context=None):
+            context = super().get_context_data(parent_context)
+            context["pending_content_types"] = self.get_pending_content_types()
+            return context
@@ -0,0 +1,102 @@
+from bisect import bisect_right
+
+from django.db.models import Q
+from wagtail.models import Page
+
+
+def get_path_range(path):
+    """
+    Returns a ``(start, end)`` tuple of the paths bounding ``path`` and all its
+    descendants, for use in ``path__gte=start, path__lt=end`` filters, which can
+    use the index on ``path`` on all databases. ``end`` is ``None`` for the last
+    possible subtree.
+    """
+    alphabet = Page.alphabet
+    # Increment the path as a number in base len(alphabet), dropping any
+    # trailing digits that overflow
+    for i in range(len(path) - 1, -1, -1):
+        position = alphabet.index(path[i])
+        if position + 1 < len(alphabet):
+            return path, path[:i] + alphabet[position + 1]
+    return path, None
+
+
+def get_subtree_roots(paths):
+    """
+    Returns the sorted ``paths`` that are not descendants of another path.
+    """
+    roots = []
+    for path in sorted(set(paths)):
+        if not roots or not path.startswith(roots[-1]):
+            roots.append(path)
+    return tuple(roots)
+
+
+def get_subtree_filter(path, field="path"):
+    """
+    Returns a ``Q`` object matching the page at ``path`` and its descendants,
+    with a range filter on ``field`` (the path field of a page, or of a
+    related page).
+    """
+    start, end = get_path_range(path)
+    if end is None:
+        return Q(**{f"{field}__gte": start})
+    return Q(**{f"{field}__gte": start, f"{field}__lt": end})
+
+
+class PathPrefixIndex:
+    """
+    Maps treebeard page paths to the value of the longest of a set of path
+    prefixes they start with, such as the root paths of sites.
+
+    ``items`` is an iterable of ``(prefix, value)`` pairs. If a prefix is
+    given more than once, the first value is used.
+
+    Lookups use a binary search over the sorted prefixes, then follow
+    prefixes nested within each other, so they take O(log n) time for any
+    realistic set of prefixes.
+    """
+
+    def __init__(self, items):
+        values = {}
+        for prefix, value in items:
+            values.setdefault(prefix, value)
+        self.prefixes = sorted(values)
+        self.values = [values[prefix] for prefix in self.prefixes]
+
+        # The index of the longest other prefix each prefix starts with, or -1.
+        # Prefixes sort before the paths starting with them, so the enclosing
+        # prefixes of each prefix are on the stack when it is reached
+        self.parents = []
+        stack = []
+        for prefix in self.prefixes:
+            while stack and not prefix.startswith(self.prefixes[stack[-1]]):
+                stack.pop()
+            self.parents.append(stack[-1] if stack else -1)
+            stack.append(len(self.parents) - 1)
+
+    def __len__(self):
+        return len(self.prefixes)
+
+    def __iter__(self):
+        return zip(self.prefixes, self.values)
+
+    def find(self, path):
+        """
+        Returns the index of the longest prefix ``path`` starts with, or -1.
+        """
+        # The last prefix sorting at or before the path is either a prefix of
+        # it, or shares its longest matching prefix with it
+        index = bisect_right(self.prefixes, path) - 1
+        while index >= 0 and not path.startswith(self.prefixes[index]):
+            index = self.parents[index]
+        return index
+
+    def get(self, path, default=None):
+        """
+        Returns the value for the longest prefix ``path`` starts with,
+        or ``default`` if it doesn't start with any of them.
+        """
+        if (index := self.find(path)) < 0:
+            return default
+        return self.values[index]
@@ -0,0 +1,118 @@
+from functools import reduce
+from hashlib import md5
+from operator import or_
+from typing import NamedTuple
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+from wagtail.models import GroupPagePermission, Page
+
+from .caching import (
+    CACHE_KEY_PREFIX,
+    REVIEW_DATA_CACHE_NAME,
+    bump_cache_version,
+    get_cache_version,
+)
+from .paths import get_subtree_filter, get_subtree_roots
+
+
+EDITABLE_PATHS_CACHE_NAME = "editable_paths"
+
+
+class EditablePaths(NamedTuple):
+    # Root paths of the subtrees in which the user can change all pages
+    paths: tuple
+    # Root paths of the subtrees in which the user can change the pages they own
+    owned_paths: tuple
+
+
+def _get_editable_paths(user):
+    change_paths = []
+    add_paths = []
+    for codename, path in GroupPagePermission.objects.filter(
+        group__user=user, permission__codename__in=["change_page", "add_page"]
+    ).values_list("permission__codename", "page__path"):
+        if codename == "change_page":
+            change_paths.append(path)
+        else:
+            add_paths.append(path)
+
+    paths = get_subtree_roots(change_paths)
+    # Users with "add" permission can also change the pages they own
+    owned_paths = get_subtree_roots(
+        path for path in add_paths if not any(path.startswith(root) for root in paths)
+    )
+    return EditablePaths(paths, owned_paths)
+
+
+def get_editable_paths(user):
+    """
+    Returns the ``EditablePaths`` of the pages a non-superuser can change,
+    according to their groups' page permissions. The result is cached until
+    ``invalidate_editable_paths()`` is called.
+    """
+    key = ":".join(
+        [
+            CACHE_KEY_PREFIX,
+            EDITABLE_PATHS_CACHE_NAME,
+            get_cache_version(EDITABLE_PATHS_CACHE_NAME),
+            str(user.pk),
+        ]
+    )
+    if (editable_paths := cache.get(key)) is None:
+        editable_paths = _get_editable_paths(user)
+        cache.set(key, editable_paths, timeout=None)
+    return editable_paths
+
+
+def get_editable_pages(user):
+    """
+    Returns a queryset of the pages ``user`` can change, equivalent to
+    ``PagePermissionPolicy().instances_user_has_permission_for(user, "change")``
+    but built from the cached ``get_editable_paths()`` as path ranges.
+    """
+    if not user.is_active:
+        return Page.objects.none()
+    if user.is_superuser:
+        return Page.objects.all()
+
+    paths, owned_paths = get_editable_paths(user)
+    conditions = [get_subtree_filter(path) for path in paths] + [
+        get_subtree_filter(path) & Q(owner=user) for path in owned_paths
+    ]
+    if not conditions:
+        return Page.objects.none()
+    return Page.objects.filter(reduce(or_, conditions))
+
+
+def get_review_data_cache_key(name, user):
+    """
+    Returns the cache key for the review data ``name`` of the pages ``user``
+    can change. The key changes when review data is invalidated and when the
+    month changes, and is shared by users who can change the same pages.
+    """
+    if user.is_superuser:
+        # Superusers can change all pages, so they share the same data
+        user_key = "superuser"
+    elif (editable_paths := get_editable_paths(user)).owned_paths:
+        # The user can change the pages they own
+        user_key = f"user-{user.pk}"
+    else:
+        # Users who can change the same subtrees share the same data
+        user_key = md5(
+            "|".join(editable_paths.paths).encode(), usedforsecurity=False
+        ).hexdigest()
+    return ":".join(
+        [
+            CACHE_KEY_PREFIX,
+            name,
+            get_cache_version(REVIEW_DATA_CACHE_NAME),
+            timezone.now().date().strftime("%Y-%m"),
+            user_key,
+        ]
+    )
+
+
+def invalidate_editable_paths():
+    bump_cache_version(EDITABLE_PATHS_CACHE_NAME)
@@ -0,0 +1,100 @@
+from typing import NamedTuple
+
+
+class ReviewModel(NamedTuple):
+    model: type
+    # The number of concrete models the model inherits from, such as 1
+    # for models inheriting from Page only
+    depth: int
+    # The concrete model whose table has the review fields, which is
+    # a parent model for models inheriting from another review model
+    review_fields_model: type
+    # Whether the database calculates next_review_date
+    generated_next_review_date: bool
+
+    @property
+    def defines_review_fields(self):
+        return self.review_fields_model is self.model
+
+
+def build_review_models(models):
+    """
+    Returns a ``ReviewModel`` for each of the ``models`` using
+    ``PeriodicReviewMixin``, ordered from the least to the most specific,
+    so that models come after the models they inherit from.
+    """
+    review_models = []
+    for model in models:
+        next_review_date = model._meta.get_field("next_review_date")
+        review_models.append(
+            ReviewModel(
+                model=model,
+                depth=len(model._meta.get_parent_list()),
+                review_fields_model=next_review_date.model._meta.concrete_model,
+                generated_next_review_date=getattr(
+                    next_review_date, "generated", False
+                ),
+            )
+        )
+    # Sorting is stable, so models of the same depth keep their order
+    return tuple(sorted(review_models, key=lambda review_model: review_model.depth))
+
+
+# A (ReviewModel tuple, {model: ReviewModel}) tuple, or None until registered
+_registry = None
+
+
+def register_review_models():
+    """
+    Records the page models using ``PeriodicReviewMixin``. Called when the
+    app is ready, after all models are loaded.
+    """
+    global _registry
+
+    from wagtail.models import get_page_models
+
+    from .models import PeriodicReviewMixin
+
+    review_models = build_review_models(
+        [model for model in get_page_models() if issubclass(model, PeriodicReviewMixin)]
+    )
+    _registry = (
+        review_models,
+        {review_model.model: review_model for review_model in review_models},
+    )
+
+
+def _get_registry():
+    if _registry is None:
+        register_review_models()
+    return _registry
+
+
+def get_review_models():
+    """
+    Returns a ``ReviewModel`` for each page model using ``PeriodicReviewMixin``,
+    from the least to the most specific.
+    """
+    return _get_registry()[0]
+
+
+def get_review_model(model):
+    """
+    Returns the ``ReviewModel`` for ``model``, or ``None`` if it is not a page
+    model using ``PeriodicReviewMixin``.
+    """
+    return _get_registry()[1].get(model)
+
+
+def reset_review_models():
+    """
+    Forgets the registered models, and their content types, so that they are
+    recorded again when next used, for example after defining page models in
+    tests.
+    """
+    global _registry
+
+    from .content_types import clear_review_content_types
+
+    _registry = None
+    clear_review_content_types()
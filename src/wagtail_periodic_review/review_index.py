@@ -0,0 +1,65 @@
+from django.db import transaction
+
+from .caching import invalidate_review_data
+from .registry import get_review_models
+from .sites import get_site_path_index
+
+
+# The number of index rows created per query when rebuilding the index
+REBUILD_CHUNK_SIZE = 2000
+
+# Page fields whose values are copied to ``PageReviewIndex``
+INDEXED_PAGE_FIELDS = (
+    "content_type_id",
+    "last_review_date",
+    "next_review_date",
+)
+
+
+def update_review_index_sites(path=""):
+    """
+    Updates ``PageReviewIndex.site`` for all indexed pages within the tree
+    ``path`` (all pages by default), for example after a page move.
+    Pages belong to the site with the most specific root page above them.
+    """
+    from .models import PageReviewIndex
+
+    index_rows = PageReviewIndex.objects.filter(page__path__startswith=path)
+    index_rows.update(site=None)
+    # Root paths are sorted, so less specific sites are updated first,
+    # and pages within nested sites end up with the most specific one
+    for root_path, site_id in get_site_path_index():
+        if root_path.startswith(path):
+            index_rows.filter(page__path__startswith=root_path).update(site=site_id)
+        elif path.startswith(root_path):
+            index_rows.update(site=site_id)
+
+
+@transaction.atomic
+def rebuild_review_index():
+    """
+    Recreates ``PageReviewIndex`` rows for all pages using ``PeriodicReviewMixin``.
+    """
+    from .models import PageReviewIndex
+
+    PageReviewIndex.objects.all().delete()
+    for review_model in get_review_models():
+        if not review_model.defines_review_fields:
+            # These pages are indexed with the model defining the fields
+            continue
+        model = review_model.model
+        rows = []
+        for page_id, *values in model.objects.values_list(
+            "pk", *INDEXED_PAGE_FIELDS
+        ).iterator(chunk_size=REBUILD_CHUNK_SIZE):
+            rows.append(
+                PageReviewIndex(
+                    page_id=page_id, **dict(zip(INDEXED_PAGE_FIELDS, values))
+                )
+            )
+            if len(rows) == REBUILD_CHUNK_SIZE:
+                PageReviewIndex.objects.bulk_create(rows)
+                rows = []
+        PageReviewIndex.objects.bulk_create(rows)
+    update_review_index_sites()
+    invalidate_review_data()
@@ -0,0 +1,79 @@
+from .caching import bump_cache_version, get_memo_state
+from .paths import PathPrefixIndex
+
+
+RULES_CACHE_NAME = "rules"
+
+# A (memo state, {(site_id, content_type_id): frequency},
+# {(site_id, content_type_id): PathPrefixIndex}) tuple, replaced
+# as a whole whenever the map is rebuilt
+_rule_map = (None, {}, {})
+
+
+def _build_rule_map():
+    from .models import PeriodicReviewFrequencyRule
+
+    site_frequencies = {}
+    subtree_frequencies = {}
+    for (
+        site_id,
+        content_type_id,
+        frequency,
+        root_path,
+    ) in PeriodicReviewFrequencyRule.objects.values_list(
+        "sitesettings__site_id", "content_type_id", "frequency", "root_page__path"
+    ):
+        key = (site_id, content_type_id)
+        if root_path is None:
+            site_frequencies[key] = frequency
+        else:
+            subtree_frequencies.setdefault(key, []).append((root_path, frequency))
+    return site_frequencies, {
+        key: PathPrefixIndex(items) for key, items in subtree_frequencies.items()
+    }
+
+
+def _get_rule_maps():
+    global _rule_map
+
+    state = get_memo_state(RULES_CACHE_NAME)
+    if _rule_map[0] != state:
+        _rule_map = (state, *_build_rule_map())
+    return _rule_map[1:]
+
+
+def get_rule_map():
+    """
+    Returns a dictionary of review frequencies keyed by ``(site_id, content_type_id)``
+    for all site-wide frequency rules. The map is built with a single query and
+    kept in memory until ``invalidate_rule_map()`` is called in any process.
+    """
+    return _get_rule_maps()[0]
+
+
+def get_subtree_rule_map():
+    """
+    Returns a dictionary of ``PathPrefixIndex`` objects keyed by
+    ``(site_id, content_type_id)``, mapping the root paths of subtree
+    frequency rules to their review frequencies. Built and invalidated
+    together with ``get_rule_map()``.
+    """
+    return _get_rule_maps()[1]
+
+
+def get_rule_frequency(site_id, content_type_id, path=None):
+    """
+    Returns the review frequency of the rule for the given site and content
+    type, or ``None`` if no such rule exists. If ``path`` is given, the rule
+    for the most specific subtree containing the page at that path is
+    preferred over the site-wide rule.
+    """
+    site_frequencies, subtree_frequencies = _get_rule_maps()
+    key = (site_id, content_type_id)
+    if path is not None and key in subtree_frequencies:
+        return subtree_frequencies[key].get(path, site_frequencies.get(key))
+    return site_frequencies.get(key)
+
+
+def invalidate_rule_map():
+    bump_cache_version(RULES_CACHE_NAME)
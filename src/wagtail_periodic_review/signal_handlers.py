@@ -0,0 +1,98 @@
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
+from wagtail import signals as wagtail_signals
+from wagtail.models import GroupPagePermission, Site
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from .caching import invalidate_review_data
+from .content_types import clear_review_content_types
+from .models import (
+    PageReviewIndex,
+    PeriodicReviewFrequencyRule,
+    PeriodicReviewFrequencySettings,
+)
+from .permissions import invalidate_editable_paths
+from .review_index import rebuild_review_index, update_review_index_sites
+from .rules import invalidate_rule_map
+from .sites import invalidate_site_paths
+
+
+def invalidate_rule_map_handler(**kwargs):
+    invalidate_rule_map()
+    invalidate_review_data()
+
+
+def invalidate_review_data_handler(**kwargs):
+    invalidate_review_data()
+
+
+def invalidate_editable_paths_handler(**kwargs):
+    invalidate_editable_paths()
+
+
+def invalidate_site_paths_handler(**kwargs):
+    invalidate_site_paths()
+
+
+def update_review_index_sites_on_page_move(instance, **kwargs):
+    update_review_index_sites(instance.path)
+
+
+def update_review_index_sites_on_site_change(**kwargs):
+    update_review_index_sites()
+    # The cached review data is broken down by site
+    invalidate_review_data()
+
+
+def post_migrate_handler(using, **kwargs):
+    # Migrations may add or remove page models and their content types
+    clear_review_content_types()
+    table_names = connections[using].introspection.table_names()
+    if PeriodicReviewFrequencyRule._meta.db_table in table_names:
+        # Add and remove rules for page models added or removed since
+        PeriodicReviewFrequencySettings.sync_frequency_rules()
+    if (
+        PageReviewIndex._meta.db_table in table_names
+        and not PageReviewIndex.objects.exists()
+    ):
+        # Populate the index for projects that were using
+        # the package before the index was introduced
+        rebuild_review_index()
+
+
+def register_signal_handlers(app_config):
+    for model in (PeriodicReviewFrequencySettings, PeriodicReviewFrequencyRule):
+        post_save.connect(invalidate_rule_map_handler, sender=model)
+        post_delete.connect(invalidate_rule_map_handler, sender=model)
+
+    post_delete.connect(invalidate_review_data_handler, sender=PageReviewIndex)
+    # The dashboard panels and reports only list live pages
+    page_published.connect(invalidate_review_data_handler)
+    page_unpublished.connect(invalidate_review_data_handler)
+
+    post_save.connect(invalidate_editable_paths_handler, sender=GroupPagePermission)
+    post_delete.connect(invalidate_editable_paths_handler, sender=GroupPagePermission)
+    m2m_changed.connect(
+        invalidate_editable_paths_handler, sender=get_user_model().groups.through
+    )
+
+    # Moving a page changes the paths of its descendants, which may include
+    # site root pages. Site paths are invalidated before they are used to
+    # update the review index
+    post_page_move.connect(invalidate_site_paths_handler)
+    post_page_move.connect(invalidate_rule_map_handler)
+    post_page_move.connect(update_review_index_sites_on_page_move)
+    post_page_move.connect(invalidate_editable_paths_handler)
+    post_save.connect(invalidate_site_paths_handler, sender=Site)
+    post_delete.connect(invalidate_site_paths_handler, sender=Site)
+    post_save.connect(update_review_index_sites_on_site_change, sender=Site)
+    post_delete.connect(update_review_index_sites_on_site_change, sender=Site)
+    # Translations of site root pages belong to the same site. The signal
+    # was added in Wagtail 6.2
+    copy_for_translation_done = getattr(
+        wagtail_signals, "copy_for_translation_done", None
+    )
+    if copy_for_translation_done is not None:
+        copy_for_translation_done.connect(invalidate_site_paths_handler)
+    post_migrate.connect(post_migrate_handler, sender=app_config)
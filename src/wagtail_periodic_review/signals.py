@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+
+# Sent after an instrumented operation, such as fetching the dashboard panel
+# pages, with ``operation``: a ``ReviewOperation`` with its measurements
+review_operation_finished = Signal()
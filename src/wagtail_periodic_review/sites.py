@@ -0,0 +1,65 @@
+from django.conf import settings
+from wagtail.models import Page, Site
+
+from .caching import bump_cache_version, get_memo_state
+from .paths import PathPrefixIndex
+
+
+SITES_CACHE_NAME = "sites"
+
+# A (memo state, PathPrefixIndex) tuple, replaced as a whole whenever
+# the index is rebuilt
+_site_path_index = (None, PathPrefixIndex([]))
+
+
+def _build_site_path_index():
+    # Prefer the same site as Page.get_url_parts() for sites sharing a
+    # root page: the default site, then the first by hostname
+    sites = list(
+        Site.objects.order_by("-is_default_site", "hostname", "pk").values_list(
+            "pk", "root_page__path", "root_page__translation_key"
+        )
+    )
+    items = [(root_path, site_id) for site_id, root_path, _key in sites]
+
+    if getattr(settings, "WAGTAIL_I18N_ENABLED", False):
+        # Pages within translations of a site's root page belong to the site
+        translation_paths = {}
+        for translation_key, path in Page.objects.filter(
+            translation_key__in={key for _site_id, _path, key in sites}
+        ).values_list("translation_key", "path"):
+            translation_paths.setdefault(translation_key, []).append(path)
+        items += [
+            (path, site_id)
+            for site_id, _root_path, key in sites
+            for path in translation_paths.get(key, [])
+        ]
+
+    return PathPrefixIndex(items)
+
+
+def get_site_path_index():
+    """
+    Returns a ``PathPrefixIndex`` of site IDs by the paths of their root pages
+    (and, with ``WAGTAIL_I18N_ENABLED``, their translations). The index is built
+    with at most two queries and kept in memory until ``invalidate_site_paths()``
+    is called in any process.
+    """
+    global _site_path_index
+
+    state = get_memo_state(SITES_CACHE_NAME)
+    if _site_path_index[0] != state:
+        _site_path_index = (state, _build_site_path_index())
+    return _site_path_index[1]
+
+
+def get_site_id_for_path(path):
+    """
+    Returns the ID of the site with the most specific root page that is (or
+    is above) the page at ``path``, or ``None`` if the page is outside all sites.
+    """
+    return get_site_path_index().get(path)
+
+
+def invalidate_site_paths():
+    bump_cache_version(SITES_CACHE_NAME)
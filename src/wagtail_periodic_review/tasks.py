@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+
+try:
+    # Django 6.0+
+    from django.tasks import task
+except ImportError:
+    try:
+        # The django-tasks backport package
+        from django_tasks import task
+    except ImportError:
+        task = None
+
+
+def defer_recalculation():
+    """
+    Returns ``True`` if next review dates should be recalculated by background
+    tasks after settings changes, rather than within the request.
+    """
+    if not getattr(settings, "WAGTAIL_PERIODIC_REVIEW_DEFER_RECALCULATION", False):
+        return False
+    if task is None:
+        raise ImproperlyConfigured(
+            "WAGTAIL_PERIODIC_REVIEW_DEFER_RECALCULATION requires Django 6.0+ "
+            "or the django-tasks package."
+        )
+    return True
+
+
+def recalculate_rule_next_review_dates(rule_id):
+    """
+    Updates ``next_review_date`` for the pages covered by a frequency rule,
+    using the rule's current frequency, so running it more than once (or after
+    a later change) gives the same result. Returns the number of pages updated.
+    """
+    from .models import PeriodicReviewFrequencyRule
+
+    try:
+        rule = PeriodicReviewFrequencyRule.objects.select_related(
+            "sitesettings__site"
+        ).get(pk=rule_id)
+    except PeriodicReviewFrequencyRule.DoesNotExist:
+        return 0
+
+    updated = rule.set_next_review_dates()
+    # Leave the rule pending if its frequency changed while this was running,
+    # as another task will have been enqueued for the new frequency
+    PeriodicReviewFrequencyRule.objects.filter(
+        pk=rule.pk, frequency=rule.frequency
+    ).update(recalculation_pending=False)
+    return updated
+
+
+if task is not None:
+    recalculate_rule_next_review_dates = task()(recalculate_rule_next_review_dates)
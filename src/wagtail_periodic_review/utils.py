@@ -1,82 +1,291 @@
-from functools import lru_cache
+import datetime
+
+from typing import NamedTuple, Optional
 
 from django.core.exceptions import FieldError
-from django.db.models import F, Q
-from django.db.models.functions import Coalesce
+from django.db import connections
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import RowNumber, TruncMonth
 from django.utils import timezone
-from wagtail.models import Page, get_page_models
+from wagtail.models import Page
+
+from .caching import invalidate_review_data
+from .dates import add_months, add_months_to_ordinals
+from .expressions import AddMonths
+from .registry import get_review_model, get_review_models
+
+
+# The number of rows fetched and written per query when
+# next review dates have to be calculated in Python
+RECALCULATION_CHUNK_SIZE = 2000
+
+# get_review_dashboard_data() buckets
+OVERDUE = "overdue"
+THIS_MONTH = "this_month"
+
+
+class ReviewBucket(NamedTuple):
+    pages: list
+    total: int
+
+
+class ForecastBucket(NamedTuple):
+    # The first day of the month the reviews are due in
+    month: datetime.date
+    content_type_id: int
+    # None for pages outside all sites
+    site_id: Optional[int]
+    count: int
 
 
-@lru_cache(maxsize=None)
 def get_periodic_review_models():
-    from .models import PeriodicReviewMixin
+    """
+    Returns the page models using ``PeriodicReviewMixin``, with models
+    after the models they inherit from.
+    """
+    return [review_model.model for review_model in get_review_models()]
 
-    return [m for m in get_page_models() if issubclass(m, PeriodicReviewMixin)]
+
+def has_generated_next_review_date(model):
+    """
+    Returns whether the database calculates ``next_review_date`` for
+    ``model``, as it does for models using ``GeneratedReviewDateMixin``.
+    """
+    if review_model := get_review_model(model):
+        return review_model.generated_next_review_date
+    return getattr(model._meta.get_field("next_review_date"), "generated", False)
 
 
 def add_review_date_annotations(queryset):
+    """
+    Annotates a ``Page`` queryset with the ``last_review_date`` and
+    ``next_review_date`` of each page, from ``PageReviewIndex``.
+    """
     if queryset.model is not Page:
         return queryset
 
-    if not (periodic_review_models := get_periodic_review_models()):
+    if not get_periodic_review_models():
         return queryset
 
-    last_review_date_fields = []
-    next_review_date_fields = []
-    for model in periodic_review_models:
-        last_review_date_fields.append(f"{model.__name__.lower()}__last_review_date")
-        next_review_date_fields.append(f"{model.__name__.lower()}__next_review_date")
-
-    if len(last_review_date_fields) > 1:
-        return queryset.annotate(
-            last_review_date=Coalesce(*last_review_date_fields),
-            next_review_date=Coalesce(*next_review_date_fields),
-        )
-
     return queryset.annotate(
-        last_review_date=F(last_review_date_fields[0]),
-        next_review_date=F(next_review_date_fields[0]),
+        last_review_date=F("review_index__last_review_date"),
+        next_review_date=F("review_index__next_review_date"),
     )
 
 
 def filter_across_subtypes(queryset, **filters):
+    """
+    Filters a ``Page`` queryset by ``PageReviewIndex`` field values, which
+    cover all pages using ``PeriodicReviewMixin``, whatever their type.
+    """
     if queryset.model is not Page:
         return queryset
 
-    if not (periodic_review_models := get_periodic_review_models()):
+    if not get_periodic_review_models():
         return queryset.none()
 
-    q = Q()
-    for page_type in periodic_review_models:
-        q |= Q(
-            **{
-                f"{page_type.__name__.lower()}__{key}": value
-                for key, value in filters.items()
-            }
-        )
-    return queryset.filter(q)
+    return queryset.filter(
+        **{f"review_index__{key}": value for key, value in filters.items()}
+    )
+
+
+def get_month_range(date):
+    """
+    Returns the first day of the month containing ``date`` and the first day
+    of the following month, for use in half-open range filters (which, unlike
+    ``__year`` and ``__month`` lookups, can use indexes on date columns).
+    """
+    month_start = date.replace(day=1)
+    return month_start, (month_start + datetime.timedelta(days=31)).replace(day=1)
 
 
 def review_overdue(queryset):
-    month_start = timezone.now().date().replace(day=1)
-    queryset = filter_across_subtypes(
-        queryset, next_review_date__isnull=False, next_review_date__lt=month_start
-    )
+    month_start, _ = get_month_range(timezone.now().date())
+    queryset = filter_across_subtypes(queryset, next_review_date__lt=month_start)
     try:
         return add_review_date_annotations(queryset).order_by("-next_review_date")
     except FieldError:
         return queryset
 
 
+def get_review_dashboard_data(queryset, limit=10):
+    """
+    Returns a ``ReviewBucket`` of the first ``limit`` pages in the ``Page``
+    ``queryset`` that are overdue a review, and another for those due a review
+    this month, keyed by ``OVERDUE`` and ``THIS_MONTH``. Each bucket also has
+    the total number of matching pages.
+
+    Both buckets are fetched in a single query, with pages ranked within their
+    bucket and counted using window functions over ``PageReviewIndex``.
+    """
+    buckets = {OVERDUE: ReviewBucket([], 0), THIS_MONTH: ReviewBucket([], 0)}
+    if queryset.model is not Page:
+        return buckets
+
+    month_start, next_month_start = get_month_range(timezone.now().date())
+    next_review_date = F("review_index__next_review_date")
+    is_overdue = Q(review_index__next_review_date__lt=month_start)
+    queryset = add_review_date_annotations(
+        filter_across_subtypes(queryset, next_review_date__lt=next_month_start)
+    ).annotate(
+        review_bucket=Case(
+            When(is_overdue, then=Value(OVERDUE)), default=Value(THIS_MONTH)
+        )
+    )
+    bucket = [F("review_bucket")]
+    pages = (
+        queryset.annotate(
+            # Most recently overdue and soonest due first
+            bucket_rank=Case(
+                When(
+                    is_overdue,
+                    then=Window(
+                        RowNumber(),
+                        partition_by=bucket,
+                        order_by=[next_review_date.desc(), F("pk").asc()],
+                    ),
+                ),
+                default=Window(
+                    RowNumber(),
+                    partition_by=bucket,
+                    order_by=[next_review_date.asc(), F("pk").asc()],
+                ),
+            ),
+            bucket_total=Window(Count("pk"), partition_by=bucket),
+        )
+        .filter(bucket_rank__lte=limit)
+        .order_by("review_bucket", "bucket_rank")
+    )
+    for page in pages:
+        bucket_pages, _total = buckets[page.review_bucket]
+        bucket_pages.append(page)
+        buckets[page.review_bucket] = ReviewBucket(bucket_pages, page.bucket_total)
+    return buckets
+
+
 def for_review_this_month(queryset):
-    today = timezone.now().date()
+    month_start, next_month_start = get_month_range(timezone.now().date())
     queryset = filter_across_subtypes(
         queryset,
-        next_review_date__isnull=False,
-        next_review_date__year=today.year,
-        next_review_date__month=today.month,
+        next_review_date__gte=month_start,
+        next_review_date__lt=next_month_start,
     )
     try:
         return add_review_date_annotations(queryset).order_by("next_review_date")
     except FieldError:
         return queryset
+
+
+def review_forecast(queryset, months=12):
+    """
+    Returns a list of ``ForecastBucket`` with the number of pages in the
+    ``Page`` ``queryset`` due a review in each of the ``months`` months from
+    the start of the current month, by content type and site, ordered by month.
+    Months, content types and sites without any pages due are left out.
+
+    The buckets are counted in a single query, grouping ``PageReviewIndex``
+    rows within a range of next review dates by month.
+    """
+    if queryset.model is not Page:
+        return []
+
+    month_start, _ = get_month_range(timezone.now().date())
+    queryset = filter_across_subtypes(
+        queryset,
+        next_review_date__gte=month_start,
+        next_review_date__lt=add_months(month_start, months),
+    )
+    return [
+        ForecastBucket(*row)
+        for row in queryset.annotate(
+            review_month=TruncMonth("review_index__next_review_date")
+        )
+        .order_by()
+        .values_list(
+            "review_month", "review_index__content_type_id", "review_index__site_id"
+        )
+        .annotate(count=Count("pk"))
+        .order_by(
+            "review_month", "review_index__content_type_id", "review_index__site_id"
+        )
+    ]
+
+
+def update_next_review_dates(queryset, frequency):
+    """
+    Sets ``next_review_date`` to ``last_review_date`` + ``frequency`` months
+    for all items in ``queryset`` that have a ``last_review_date`` (and their
+    ``PageReviewIndex`` entries), and returns the number of pages updated.
+
+    Where the database supports it, this is a single UPDATE statement per
+    table. Other backends fall back to calculating dates in Python, in chunks,
+    so that only the primary keys and dates are ever loaded into memory.
+    For models with a generated ``next_review_date``, ``review_frequency`` is
+    updated for all items instead, and the index entries are copied from the
+    generated dates.
+    """
+    from .models import PageReviewIndex
+
+    if has_generated_next_review_date(queryset.model):
+        # Keep the frequency of pages without a last review date up to date too,
+        # for when one is set
+        index_rows = PageReviewIndex.objects.filter(page__in=queryset.values("pk"))
+        updated = queryset.update(review_frequency=frequency)
+        index_rows.update(
+            next_review_date=Subquery(
+                queryset.model._base_manager.filter(pk=OuterRef("page_id")).values(
+                    "next_review_date"
+                )
+            )
+        )
+        invalidate_review_data()
+        return updated
+
+    queryset = queryset.filter(last_review_date__isnull=False)
+    index_rows = PageReviewIndex.objects.filter(page__in=queryset.values("pk"))
+    if connections[queryset.db].vendor in AddMonths.supported_vendors:
+        next_review_date = AddMonths(F("last_review_date"), frequency)
+        index_rows.update(next_review_date=next_review_date)
+        updated = queryset.update(next_review_date=next_review_date)
+        invalidate_review_data()
+        return updated
+
+    model = queryset.model
+    queryset = queryset.order_by("pk").values_list("pk", "last_review_date")
+    updated = 0
+    last_pk = None
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        page_ids, ordinals = [], []
+        for pk, date in chunk[:RECALCULATION_CHUNK_SIZE]:
+            page_ids.append(pk)
+            ordinals.append(date.toordinal())
+        if not page_ids:
+            invalidate_review_data()
+            return updated
+        rows = [
+            (pk, datetime.date.fromordinal(ordinal))
+            for pk, ordinal in zip(
+                page_ids, add_months_to_ordinals(ordinals, frequency)
+            )
+        ]
+        model._base_manager.bulk_update(
+            [model(pk=pk, next_review_date=date) for pk, date in rows],
+            ["next_review_date"],
+        )
+        PageReviewIndex.objects.bulk_update(
+            [PageReviewIndex(page_id=pk, next_review_date=date) for pk, date in rows],
+            ["next_review_date"],
+        )
+        updated += len(rows)
+        last_pk = rows[-1][0]
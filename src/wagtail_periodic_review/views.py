@@ -1,11 +1,36 @@
+import csv
+
+from collections import Counter, defaultdict
+from hashlib import md5
+from tempfile import TemporaryFile
+
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import FieldError
+from django.http import FileResponse
+from django.utils import timezone
+from django.utils.formats import number_format
 from django.utils.translation import gettext as _
+from django.views.generic import TemplateView
+from openpyxl import Workbook
 from wagtail import VERSION as WAGTAIL_VERSION
+from wagtail.admin.views.generic.base import WagtailAdminTemplateMixin
+from wagtail.admin.views.mixins import Echo, ExcelDateFormatter
 from wagtail.admin.views.reports import PageReportView
-from wagtail.permission_policies.pages import PagePermissionPolicy
+from wagtail.models import Site
 
+from .content_types import get_review_content_types
+from .dates import add_months
 from .filters import PeriodicReviewFilterSet
-from .utils import add_review_date_annotations, filter_across_subtypes
+from .instrumentation import instrument
+from .pagination import KeysetPaginator
+from .permissions import get_editable_pages, get_review_data_cache_key
+from .utils import (
+    add_review_date_annotations,
+    filter_across_subtypes,
+    get_month_range,
+    review_forecast,
+)
 
 
 def _adapt_wagtail_report_attributes(cls):
@@ -43,17 +68,278 @@ class PeriodicReviewContentReport(PageReportView):
 
     filterset_class = PeriodicReviewFilterSet
 
+    export_filename = "periodic-review-report"
+    list_export = [
+        "title",
+        "content_type",
+        "status_string",
+        "last_review_date",
+        "next_review_date",
+    ]
+    export_headings = {
+        "content_type": _("Type"),
+        "status_string": _("Status"),
+        "last_review_date": _("Last reviewed"),
+        "next_review_date": _("Next review due"),
+    }
+    # The page values fetched for each exported row
+    export_values = (
+        "title",
+        "content_type_id",
+        "live",
+        "has_unpublished_changes",
+        "expired",
+        "last_review_date",
+        "next_review_date",
+    )
+    # The number of rows fetched from the database at a time when exporting
+    export_chunk_size = 2000
+    # Report pages are fetched by their position in the (next_review_date, pk)
+    # order rather than with OFFSET, and only up to this many pages are counted
+    count_limit = 10000
+    # The number of seconds the filter choice counts are cached for
+    facet_cache_timeout = 60
+
     def _get_editable_pages(self):
-        return PagePermissionPolicy().instances_user_has_permission_for(
-            self.request.user, "change"
-        )
+        return get_editable_pages(self.request.user)
 
     def get_queryset(self):
         queryset = filter_across_subtypes(
             self._get_editable_pages(),
             last_review_date__isnull=False,
         )
+        # Annotate and prefetch the page status used by each row, to avoid
+        # additional queries per page
+        queryset = (
+            queryset.prefetch_workflow_states()
+            .annotate_approved_schedule()
+            .annotate_site_root_state()
+        )
         try:
-            return add_review_date_annotations(queryset).order_by("next_review_date")
+            return add_review_date_annotations(queryset).order_by(
+                "next_review_date", "pk"
+            )
         except FieldError:
             return queryset
+
+    def get_facet_counts(self, filters):
+        """
+        Returns the filter choice counts for the pages the user can change,
+        cached briefly per combination of filter values.
+        """
+        filter_values = repr(sorted(filters.form.cleaned_data.items()))
+        cache_key = get_review_data_cache_key(
+            "facets-" + md5(filter_values.encode(), usedforsecurity=False).hexdigest(),
+            self.request.user,
+        )
+        counts = cache.get(cache_key)
+        if counts is None:
+            counts = filters.get_facet_counts(self.get_queryset())
+            cache.set(cache_key, counts, self.facet_cache_timeout)
+        return counts
+
+    def get_context_data(self, *args, **kwargs):
+        context = super().get_context_data(*args, **kwargs)
+        filters = context.get("filters")
+        # Only count the choices when the filters are rendered
+        if (
+            filters is not None
+            and filters.is_valid()
+            and (
+                not getattr(self, "results_only", False)
+                or context.get("render_filters_fragment")
+            )
+        ):
+            filters.set_facet_counts(self.get_facet_counts(filters))
+        paginator = context.get("paginator")
+        if getattr(paginator, "count_is_limited", False):
+            # The page count ends with "+", and the number of pages is shown
+            # as more than the limit
+            context["limited_count"] = number_format(
+                paginator.count, force_grouping=True
+            )
+        return context
+
+    def paginate_queryset(self, queryset, page_size):
+        with instrument("report_page") as operation:
+            paginator, page, object_list, is_paginated = self._paginate_queryset(
+                queryset, page_size
+            )
+            operation.rows = len(object_list)
+        return paginator, page, object_list, is_paginated
+
+    def _paginate_queryset(self, queryset, page_size):
+        if "next_review_date" not in queryset.query.annotations:
+            # There are no pages using PeriodicReviewMixin to paginate
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            date_field="next_review_date",
+            count_limit=self.count_limit,
+        )
+        page = paginator.get_page(self.request.GET.get(self.page_kwarg))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get(self, request, *args, **kwargs):
+        if self.is_export:
+            # Skip building the listing context, which is not used for exports
+            queryset = self.get_filtered_queryset()
+            if WAGTAIL_VERSION < (6, 1):
+                # get_filtered_queryset() returned (filters, queryset) before 6.1
+                _filters, queryset = queryset
+            return self.as_spreadsheet(queryset, request.GET.get("export"))
+        return super().get(request, *args, **kwargs)
+
+    def get_export_rows(self, queryset):
+        """
+        Yields a dictionary of ``export_values`` for each page in ``queryset``,
+        fetched in chunks rather than as page instances, so that memory use does
+        not grow with the size of the report.
+        """
+        return queryset.values(*self.export_values).iterator(
+            chunk_size=self.export_chunk_size
+        )
+
+    def to_row_dict(self, item):
+        if item["live"]:
+            status = _("live + draft") if item["has_unpublished_changes"] else _("live")
+        else:
+            status = _("expired") if item["expired"] else _("draft")
+        return {
+            "title": item["title"],
+            "content_type": get_review_content_types().labels.get(
+                item["content_type_id"], ""
+            ),
+            "status_string": status,
+            "last_review_date": item["last_review_date"],
+            "next_review_date": item["next_review_date"],
+        }
+
+    def stream_csv(self, queryset):
+        writer = csv.DictWriter(Echo(), fieldnames=self.list_export)
+        yield writer.writerow(
+            {field: self.get_heading(queryset, field) for field in self.list_export}
+        )
+        for item in self.get_export_rows(queryset):
+            yield self.write_csv_row(writer, self.to_row_dict(item))
+
+    def write_xlsx(self, queryset, output):
+        workbook = Workbook(write_only=True, iso_dates=True)
+        worksheet = workbook.create_sheet(title="Sheet1")
+        worksheet.append(
+            self.get_heading(queryset, field) for field in self.list_export
+        )
+        date_format = ExcelDateFormatter().get()
+        for item in self.get_export_rows(queryset):
+            worksheet.append(
+                self.generate_xlsx_row(
+                    worksheet, self.to_row_dict(item), date_format=date_format
+                )
+            )
+        workbook.save(output)
+
+    def write_xlsx_response(self, queryset):
+        # XLSX files can only be written in full, so write to a temporary
+        # file on disk, which the response then streams in blocks
+        output = TemporaryFile()
+        self.write_xlsx(queryset, output)
+        output.seek(0)
+        return FileResponse(
+            output,
+            as_attachment=True,
+            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            filename=f"{self.get_filename()}.xlsx",
+        )
+
+
+class ReviewForecastView(WagtailAdminTemplateMixin, TemplateView):
+    """
+    Shows how many of the live pages the user can change are due a review in
+    each of the coming ``months``, in total, by content type and by site.
+    """
+
+    page_title = _("Review forecast")
+    header_icon = "wpr-calendar-stats"
+    template_name = "reports/review_forecast.html"
+    months = 12
+
+    def get_forecast(self):
+        """
+        Returns ``review_forecast()`` for the live pages the user can change,
+        cached like the dashboard panels until the month or review dates change.
+        """
+        timeout = getattr(
+            settings, "WAGTAIL_PERIODIC_REVIEW_DASHBOARD_CACHE_TIMEOUT", 300
+        )
+        with instrument("review_forecast") as operation:
+            cache_key = get_review_data_cache_key(
+                f"forecast-{self.months}", self.request.user
+            )
+            forecast = cache.get(cache_key) if timeout else None
+            if forecast is None:
+                forecast = review_forecast(
+                    get_editable_pages(self.request.user).live(), months=self.months
+                )
+                if timeout:
+                    cache.set(cache_key, forecast, timeout)
+            operation.rows = len(forecast)
+        return forecast
+
+    def get_breakdown(self, counts, labels, months):
+        # Rows of (label, counts per month, total), sorted by label. Sites
+        # missing from the labels are not in a site, or have been deleted
+        rows = [
+            (
+                labels.get(key, _("Not in a site")),
+                [counts[key][month] for month in months],
+            )
+            for key in counts
+        ]
+        return [(label, row, sum(row)) for label, row in sorted(rows)]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        month_start, _next_month_start = get_month_range(timezone.now().date())
+        months = [add_months(month_start, i) for i in range(self.months)]
+
+        totals = dict.fromkeys(months, 0)
+        by_content_type = defaultdict(Counter)
+        by_site = defaultdict(Counter)
+        for bucket in self.get_forecast():
+            totals[bucket.month] += bucket.count
+            by_content_type[bucket.content_type_id][bucket.month] += bucket.count
+            by_site[bucket.site_id][bucket.month] += bucket.count
+
+        review_content_types = get_review_content_types()
+        content_type_labels = {
+            content_type_id: review_content_types.labels.get(
+                content_type_id, _("Unknown")
+            )
+            for content_type_id in by_content_type
+        }
+        site_labels = {
+            site_id: str(site)
+            for site_id, site in Site.objects.in_bulk(
+                [site_id for site_id in by_site if site_id is not None]
+            ).items()
+        }
+
+        max_total = max(totals.values())
+        context.update(
+            {
+                "months": months,
+                "chart": [
+                    (month, total, round(total * 100 / max_total) if max_total else 0)
+                    for month, total in totals.items()
+                ],
+                "total": sum(totals.values()),
+                "monthly_totals": list(totals.values()),
+                "content_type_rows": self.get_breakdown(
+                    by_content_type, content_type_labels, months
+                ),
+                "site_rows": self.get_breakdown(by_site, site_labels, months),
+            }
+        )
+        return context
@@ -1,16 +1,55 @@
 from collections.abc import Mapping
 from typing import Any
 
+from django.conf import settings
+from django.core.cache import cache
 from django.urls import path, reverse
 from django.utils.translation import gettext as _
 from wagtail import VERSION as WAGTAIL_VERSION
 from wagtail import hooks
 from wagtail.admin.menu import MenuItem
 from wagtail.admin.ui.components import Component
-from wagtail.permission_policies.pages import PagePermissionPolicy
 
-from .utils import for_review_this_month, review_overdue
-from .views import PeriodicReviewContentReport
+from .bulk_actions import MARK_AS_REVIEWED_LOG_ACTION, MarkAsReviewedBulkAction
+from .instrumentation import instrument
+from .permissions import get_editable_pages, get_review_data_cache_key
+from .utils import OVERDUE, THIS_MONTH, get_review_dashboard_data
+from .views import PeriodicReviewContentReport, ReviewForecastView
+
+
+# The number of pages listed in each dashboard panel
+DASHBOARD_PANEL_PAGE_LIMIT = 10
+
+
+def get_dashboard_cache_key(user):
+    return get_review_data_cache_key("dashboard", user)
+
+
+def get_dashboard_data(request):
+    """
+    Returns ``get_review_dashboard_data()`` for the live pages the user can
+    change, shared by the dashboard panels in the request. The data is cached
+    per user for ``WAGTAIL_PERIODIC_REVIEW_DASHBOARD_CACHE_TIMEOUT`` seconds,
+    until the month changes or review dates change.
+    """
+    if hasattr(request, "_periodic_review_dashboard_data"):
+        return request._periodic_review_dashboard_data
+
+    timeout = getattr(settings, "WAGTAIL_PERIODIC_REVIEW_DASHBOARD_CACHE_TIMEOUT", 300)
+    with instrument("dashboard_data") as operation:
+        cache_key = get_dashboard_cache_key(request.user)
+        data = cache.get(cache_key) if timeout else None
+        if data is None:
+            data = get_review_dashboard_data(
+                get_editable_pages(request.user).live(),
+                limit=DASHBOARD_PANEL_PAGE_LIMIT,
+            )
+            if timeout:
+                cache.set(cache_key, data, timeout)
+        operation.rows = sum(len(bucket.pages) for bucket in data.values())
+
+    request._periodic_review_dashboard_data = data
+    return data
 
 
 class BaseHomePanel(Component):
@@ -19,17 +58,18 @@ class BaseHomePanel(Component):
     description_icon = "info-circle"
     description_css_class = "help-info"
     template_name = "wagtailadmin/periodic_review/home_panel.html"
+    # The get_review_dashboard_data() bucket listed by the panel
+    bucket = None
 
     def __init__(self, request):
         self.request = request
 
-    def get_page_list(self):
-        return PagePermissionPolicy().instances_user_has_permission_for(
-            self.request.user, "change"
-        )
+    def get_bucket(self):
+        return get_dashboard_data(self.request)[self.bucket]
 
     def get_context_data(self, parent_context: Mapping[str, Any]) -> Mapping[str, Any]:
         context = super().get_context_data(parent_context)
+        bucket = self.get_bucket()
         context.update(
             {
                 "request": self.request,
@@ -37,7 +77,8 @@ class BaseHomePanel(Component):
                 "description": self.description,
                 "description_icon": self.description_icon,
                 "description_css_class": self.description_css_class,
-                "page_list": self.get_page_list(),
+                "page_list": bucket.pages,
+                "more_count": bucket.total - len(bucket.pages),
             }
         )
         return context
@@ -49,10 +90,7 @@ class OverdueReviewsPanel(BaseHomePanel):
     description_css_class = "help-critical"
     description_icon = "warning"
     order = 200
-
-    def get_page_list(self):
-        all_pages = super().get_page_list()
-        return review_overdue(all_pages.live())[:10]
+    bucket = OVERDUE
 
 
 class ForReviewThisMonthPanel(BaseHomePanel):
@@ -61,10 +99,7 @@ class ForReviewThisMonthPanel(BaseHomePanel):
     description_css_class = "help-warning"
     description_icon = "help"
     order = 201
-
-    def get_page_list(self):
-        all_pages = super().get_page_list()
-        return for_review_this_month(all_pages.live())[:10]
+    bucket = THIS_MONTH
 
 
 @hooks.register("construct_homepage_panels")
@@ -73,6 +108,16 @@ def add_review_panels(request, panels):
     panels.append(ForReviewThisMonthPanel(request))
 
 
+hooks.register("register_bulk_action", MarkAsReviewedBulkAction)
+
+
+@hooks.register("register_log_actions")
+def register_log_actions(actions):
+    actions.register_action(
+        MARK_AS_REVIEWED_LOG_ACTION, _("Mark as reviewed"), _("Marked as reviewed")
+    )
+
+
 @hooks.register("register_reports_menu_item")
 def register_report_menu_item():
     return MenuItem(
@@ -83,6 +128,16 @@ def register_report_menu_item():
     )
 
 
+@hooks.register("register_reports_menu_item")
+def register_forecast_menu_item():
+    return MenuItem(
+        _("Review forecast"),
+        reverse("wagtail_periodic_review_forecast"),
+        icon_name=ReviewForecastView.header_icon,
+        order=801,
+    )
+
+
 @hooks.register("register_admin_urls")
 def register_report_url():
     urls = [
@@ -90,7 +145,12 @@ def register_report_url():
             "reports/periodic-review/",
             PeriodicReviewContentReport.as_view(),
             name="wagtail_periodic_review_report",
-        )
+        ),
+        path(
+            "reports/review-forecast/",
+            ReviewForecastView.as_view(),
+            name="wagtail_periodic_review_forecast",
+        ),
     ]
 
     if WAGTAIL_VERSION >= (6, 2):
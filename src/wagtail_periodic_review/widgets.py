@@ -1,28 +1,23 @@
-from django.contrib.contenttypes.models import ContentType
 from django.forms import Select
 from django.forms.models import ModelChoiceIterator
-from django.utils.functional import cached_property
 
-from .utils import get_periodic_review_models
+from .content_types import get_review_content_types
 
 
 class PeriodicReviewContentTypeSelect(Select):
     """
     Custom Widget that limits ContentType options provided by ModelChoiceFields to
-    those that represent subclasses of PeriodicReviewMixin.
+    those that represent subclasses of PeriodicReviewMixin, labelled with the
+    model's verbose name.
     """
 
     def __init__(self, *args, **kwargs):
         self._choices = None
         super().__init__(*args, **kwargs)
 
-    @cached_property
+    @property
     def relevant_object_ids(self):
-        ids = []
-        for model in get_periodic_review_models():
-            ct = ContentType.objects.get_for_model(model)
-            ids.append(ct.id)
-        return ids
+        return get_review_content_types().ids
 
     @property
     def choices(self):
@@ -31,18 +26,8 @@ class PeriodicReviewContentTypeSelect(Select):
     @choices.setter
     def choices(self, value):
         if isinstance(value, ModelChoiceIterator):
-            value.queryset = value.queryset.filter(id__in=self.relevant_object_ids)
+            # Use the in-memory content types rather than querying them
+            empty_label = value.field.empty_label
+            value = [("", empty_label)] if empty_label is not None else []
+            value += get_review_content_types().choices
         self._choices = value
-
-    def create_option(
-        self, name, value, label, selected, index, subindex=None, attrs=None
-    ):
-        """
-        Overrides ``Select.create_option()`` to simplify the "appname | model class" labels
-        returned by ``ContentType.__str__()``.
-        """
-        label = label.split("|").pop().strip()  # use model name only
-        label = label[0].upper() + label[1:]  # uppercase first character
-        return super().create_option(
-            name, value, label, selected, index, subindex, attrs
-        )
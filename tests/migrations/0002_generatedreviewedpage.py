@@ -0,0 +1,81 @@
+# Generated by Django 5.1.15 on 2026-10-18 15:03
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+import wagtail_periodic_review.expressions
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests", "0001_initial"),
+        ("wagtailcore", "0083_workflowcontenttype"),
+    ]
+
+    # GeneratedField requires Django 5.0+
+    operations = (
+        [
+            migrations.CreateModel(
+                name="GeneratedReviewedPage",
+                fields=[
+                    (
+                        "page_ptr",
+                        models.OneToOneField(
+                            auto_created=True,
+                            on_delete=django.db.models.deletion.CASCADE,
+                            parent_link=True,
+                            primary_key=True,
+                            serialize=False,
+                            to="wagtailcore.page",
+                        ),
+                    ),
+                    (
+                        "last_review_date",
+                        models.DateField(blank=True, null=True),
+                    ),
+                    (
+                        "current_version_ref",
+                        models.CharField(
+                            blank=True,
+                            max_length=20,
+                            verbose_name="current version ref",
+                        ),
+                    ),
+                    (
+                        "current_version_compiled_by",
+                        models.CharField(
+                            blank=True,
+                            max_length=255,
+                            verbose_name="current version compiled by",
+                        ),
+                    ),
+                    (
+                        "custom_review_frequency",
+                        models.PositiveIntegerField(editable=False, null=True),
+                    ),
+                    (
+                        "review_frequency",
+                        models.PositiveIntegerField(default=12, editable=False),
+                    ),
+                    (
+                        "next_review_date",
+                        models.GeneratedField(
+                            db_persist=True,
+                            expression=wagtail_periodic_review.expressions.AddMonths(
+                                models.F("last_review_date"),
+                                models.F("review_frequency"),
+                            ),
+                            output_field=models.DateField(null=True),
+                        ),
+                    ),
+                ],
+                options={
+                    "abstract": False,
+                },
+                bases=("wagtailcore.page", models.Model),
+            ),
+        ]
+        if hasattr(models, "GeneratedField")
+        else []
+    )
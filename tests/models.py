@@ -16,3 +16,10 @@ class NonPageModel(models.Model):
 
     def __str__(self):
         return self.name
+
+
+if hasattr(models, "GeneratedField"):
+    from wagtail_periodic_review.models import GeneratedReviewDateMixin
+
+    class GeneratedReviewedPage(GeneratedReviewDateMixin, Page):
+        settings_panels = GeneratedReviewDateMixin.review_panels + Page.settings_panels
@@ -0,0 +1,160 @@
+import datetime
+
+from django.test import TestCase
+from django.urls import reverse
+from wagtail.models import PageLogEntry, Site
+from wagtail.test.utils import WagtailTestUtils
+
+from tests.models import ReviewedPage, SimplePage
+from wagtail_periodic_review.bulk_actions import (
+    MARK_AS_REVIEWED_LOG_ACTION,
+    mark_as_reviewed,
+)
+from wagtail_periodic_review.models import (
+    PageReviewIndex,
+    PeriodicReviewFrequencySettings,
+    ReviewFrequencyChoices,
+)
+from wagtail_periodic_review.rules import invalidate_rule_map
+
+
+class TestMarkAsReviewed(WagtailTestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.addClassCleanup(invalidate_rule_map)
+        cls.site = Site.objects.get(is_default_site=True)
+        settings = PeriodicReviewFrequencySettings.objects.create(site=cls.site)
+        settings.frequency_rules.update(frequency=ReviewFrequencyChoices.THREE_MONTHS)
+
+        cls.pages = [
+            cls.site.root_page.add_child(
+                instance=ReviewedPage(
+                    title=f"Page {i}",
+                    slug=f"page-{i}",
+                    last_review_date=datetime.date(2023, 1, 1),
+                )
+            )
+            for i in range(3)
+        ]
+        cls.custom_page = cls.site.root_page.add_child(
+            instance=ReviewedPage(
+                title="Custom",
+                slug="custom",
+                custom_review_frequency=ReviewFrequencyChoices.SIX_MONTHS,
+            )
+        )
+        cls.simple_page = cls.site.root_page.add_child(
+            instance=SimplePage(title="Simple", slug="simple")
+        )
+
+    def setUp(self):
+        self.addCleanup(invalidate_rule_map)
+
+    def test_mark_as_reviewed(self):
+        pages = [*self.pages, self.custom_page, self.simple_page]
+        review_date = datetime.date(2024, 8, 31)
+
+        updated = mark_as_reviewed(
+            pages,
+            review_date,
+            current_version_ref="v2",
+            current_version_compiled_by="Editor",
+        )
+
+        self.assertEqual(updated, 4)
+        expected_dates = {
+            **{page.pk: datetime.date(2024, 11, 30) for page in self.pages},
+            self.custom_page.pk: datetime.date(2025, 2, 28),
+        }
+        self.assertEqual(
+            {
+                page.pk: page.next_review_date
+                for page in ReviewedPage.objects.filter(
+                    last_review_date=review_date,
+                    current_version_ref="v2",
+                    current_version_compiled_by="Editor",
+                )
+            },
+            expected_dates,
+        )
+        self.assertEqual(
+            dict(
+                PageReviewIndex.objects.filter(
+                    last_review_date=review_date
+                ).values_list("page_id", "next_review_date")
+            ),
+            expected_dates,
+        )
+
+        log_entries = PageLogEntry.objects.filter(action=MARK_AS_REVIEWED_LOG_ACTION)
+        self.assertEqual(
+            set(log_entries.values_list("page_id", flat=True)), set(expected_dates)
+        )
+        self.assertEqual(len(set(log_entries.values_list("uuid", flat=True))), 1)
+        self.assertEqual(log_entries.first().data["current_version_ref"], "v2")
+
+    def test_query_count_does_not_grow_with_pages(self):
+        # Fetch the rule map, which is only queried once per process
+        ReviewedPage.objects.get(pk=self.pages[0].pk).get_review_frequency()
+
+        # Frequencies, an UPDATE for the pages and the index per frequency,
+        # and the log entries, in a savepoint
+        with self.assertNumQueries(8):
+            mark_as_reviewed([*self.pages, self.custom_page], datetime.date.today())
+
+    def test_page_missing_from_index(self):
+        PageReviewIndex.objects.filter(page=self.pages[0]).delete()
+        review_date = datetime.date(2024, 8, 31)
+
+        mark_as_reviewed([self.pages[0]], review_date)
+
+        # The page gets the site's rule frequency, rather than the default
+        page = ReviewedPage.objects.get(pk=self.pages[0].pk)
+        self.assertEqual(page.next_review_date, datetime.date(2024, 11, 30))
+        index = PageReviewIndex.objects.get(page=page)
+        self.assertEqual(index.site_id, self.site.pk)
+        self.assertEqual(index.content_type_id, page.content_type_id)
+        self.assertEqual(index.last_review_date, review_date)
+        self.assertEqual(index.next_review_date, datetime.date(2024, 11, 30))
+
+    def test_page_with_unpublished_changes(self):
+        page = ReviewedPage.objects.get(pk=self.pages[0].pk)
+        page.title = "Draft"
+        revision = page.save_revision()
+        review_date = datetime.date(2024, 8, 31)
+
+        mark_as_reviewed([page], review_date, current_version_ref="v2")
+        revision.refresh_from_db()
+        revision.publish()
+
+        page.refresh_from_db()
+        self.assertEqual(page.title, "Draft")
+        self.assertEqual(page.last_review_date, review_date)
+        self.assertEqual(page.next_review_date, datetime.date(2024, 11, 30))
+        self.assertEqual(page.current_version_ref, "v2")
+
+    def test_bulk_action(self):
+        self.login()
+        url = reverse(
+            "wagtail_bulk_action", args=("wagtailcore", "page", "mark_as_reviewed")
+        )
+        url += f"?id={self.pages[0].pk}&id={self.simple_page.pk}"
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(
+            response,
+            "wagtailadmin/periodic_review/bulk_actions/confirm_bulk_mark_as_reviewed.html",
+        )
+        self.assertContains(response, "This page cannot be marked as reviewed")
+
+        response = self.client.post(
+            url,
+            {"last_review_date": "2024-08-31", "current_version_ref": "v2"},
+        )
+        self.assertEqual(response.status_code, 302)
+
+        page = ReviewedPage.objects.get(pk=self.pages[0].pk)
+        self.assertEqual(page.last_review_date, datetime.date(2024, 8, 31))
+        self.assertEqual(page.next_review_date, datetime.date(2024, 11, 30))
+        self.assertEqual(page.current_version_ref, "v2")
@@ -0,0 +1,33 @@
+from django.db import DatabaseError, transaction
+from django.test import TestCase
+
+from wagtail_periodic_review.caching import (
+    bump_cache_version,
+    get_cache_version,
+    get_memo_state,
+    get_pending_bumps,
+)
+
+
+class TestPendingBumps(TestCase):
+    def test_committed_bumps(self):
+        version = get_cache_version("test")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_cache_version("test")
+            self.assertEqual(len(get_pending_bumps("test")), 1)
+            self.assertNotEqual(get_cache_version("test"), version)
+
+        self.assertEqual(get_pending_bumps("test"), frozenset())
+
+    def test_rolled_back_bumps(self):
+        state = get_memo_state("test")
+
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            bump_cache_version("test")
+            self.assertNotEqual(get_memo_state("test"), state)
+            transaction_state = get_memo_state("test")
+            raise DatabaseError
+
+        self.assertEqual(get_pending_bumps("test"), frozenset())
+        self.assertNotEqual(get_memo_state("test"), transaction_state)
@@ -0,0 +1,151 @@
+import datetime
+import json
+import os
+import tempfile
+
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from wagtail.models import Site
+
+from tests.models import ReviewedPage, SimplePage
+from wagtail_periodic_review.models import (
+    PageReviewIndex,
+    PeriodicReviewFrequencyRule,
+    PeriodicReviewFrequencySettings,
+    ReviewFrequencyChoices,
+)
+from wagtail_periodic_review.rules import invalidate_rule_map
+from wagtail_periodic_review.sites import invalidate_site_paths
+
+
+class TestRecalculateReviewDatesCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.addClassCleanup(invalidate_rule_map)
+        cls.site = Site.objects.get(is_default_site=True)
+        cls.pages = []
+        for i in range(3):
+            page = ReviewedPage(
+                title=f"Reviewed {i}",
+                slug=f"reviewed-{i}",
+                last_review_date=datetime.date(2024, 1, 31),
+            )
+            cls.site.root_page.add_child(instance=page)
+            cls.pages.append(page)
+
+        settings = PeriodicReviewFrequencySettings.objects.create(site=cls.site)
+        # Change the frequency without recalculating review dates
+        settings.frequency_rules.update(frequency=ReviewFrequencyChoices.ONE_MONTH)
+        invalidate_rule_map()
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.checkpoint_path = os.path.join(temp_dir.name, "checkpoint.json")
+
+    def call_command(self, *args):
+        call_command("recalculate_review_dates", *args, stdout=StringIO())
+
+    def get_next_review_dates(self):
+        return [
+            ReviewedPage.objects.get(pk=page.pk).next_review_date for page in self.pages
+        ]
+
+    def test_recalculate(self):
+        self.call_command("--chunk-size", "2", "--checkpoint", self.checkpoint_path)
+
+        self.assertEqual(self.get_next_review_dates(), [datetime.date(2024, 2, 29)] * 3)
+        self.assertEqual(
+            set(PageReviewIndex.objects.values_list("next_review_date", flat=True)),
+            {datetime.date(2024, 2, 29)},
+        )
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_resume(self):
+        with open(self.checkpoint_path, "w") as f:
+            json.dump(
+                {
+                    "site_id": self.site.pk,
+                    "content_type_id": self.pages[0].content_type_id,
+                    "last_pk": self.pages[1].pk,
+                },
+                f,
+            )
+
+        self.call_command("--checkpoint", self.checkpoint_path, "--resume")
+
+        self.assertEqual(
+            self.get_next_review_dates(),
+            [
+                datetime.date(2025, 1, 31),
+                datetime.date(2025, 1, 31),
+                datetime.date(2024, 2, 29),
+            ],
+        )
+
+    def test_filters(self):
+        self.call_command("--site", str(self.site.pk + 1))
+        self.call_command("--content-type", "tests.simplepage")
+        self.assertEqual(self.get_next_review_dates(), [datetime.date(2025, 1, 31)] * 3)
+
+        self.call_command(
+            "--site", str(self.site.pk), "--content-type", "tests.ReviewedPage"
+        )
+        self.assertEqual(self.get_next_review_dates(), [datetime.date(2024, 2, 29)] * 3)
+
+    def test_subtree_rules(self):
+        self.addCleanup(invalidate_rule_map)
+        self.addCleanup(invalidate_site_paths)
+        section = self.site.root_page.add_child(
+            instance=SimplePage(title="Section", slug="section")
+        )
+        self.pages[0].move(section, pos="last-child")
+        settings = PeriodicReviewFrequencySettings.objects.get(site=self.site)
+        PeriodicReviewFrequencyRule.objects.create(
+            sitesettings=settings,
+            content_type_id=settings.frequency_rules.get(
+                content_type__model="reviewedpage"
+            ).content_type_id,
+            root_page=section,
+            frequency=ReviewFrequencyChoices.SIX_MONTHS,
+        )
+
+        self.call_command()
+
+        self.assertEqual(
+            self.get_next_review_dates(),
+            [datetime.date(2024, 7, 31)] + [datetime.date(2024, 2, 29)] * 2,
+        )
+
+    def test_nested_sites(self):
+        self.addCleanup(invalidate_rule_map)
+        self.addCleanup(invalidate_site_paths)
+        section = self.site.root_page.add_child(
+            instance=SimplePage(title="Section", slug="section")
+        )
+        self.pages[0].move(section, pos="last-child")
+        nested_site = Site.objects.create(
+            hostname="nested.example.com", root_page=section
+        )
+        settings = PeriodicReviewFrequencySettings.objects.create(site=nested_site)
+        settings.frequency_rules.update(frequency=ReviewFrequencyChoices.SIX_MONTHS)
+        invalidate_rule_map()
+
+        # Pages in the nested site are left to the nested site's rules
+        self.call_command("--site", str(self.site.pk))
+        self.assertEqual(
+            self.get_next_review_dates(),
+            [datetime.date(2025, 1, 31)] + [datetime.date(2024, 2, 29)] * 2,
+        )
+
+        self.call_command("--site", str(nested_site.pk))
+        self.assertEqual(
+            self.get_next_review_dates(),
+            [datetime.date(2024, 7, 31)] + [datetime.date(2024, 2, 29)] * 2,
+        )
+
+    def test_unknown_content_type(self):
+        with self.assertRaisesMessage(CommandError, "Unknown content type 'tests'"):
+            self.call_command("--content-type", "tests")
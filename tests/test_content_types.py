@@ -0,0 +1,70 @@
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_migrate
+from django.test import TestCase
+
+from tests.models import ReviewedPage
+from wagtail_periodic_review.content_types import (
+    clear_review_content_types,
+    get_review_content_types,
+)
+from wagtail_periodic_review.filters import PeriodicReviewFilterSet
+from wagtail_periodic_review.models import PeriodicReviewFrequencyRule
+from wagtail_periodic_review.registry import reset_review_models
+from wagtail_periodic_review.utils import get_periodic_review_models
+from wagtail_periodic_review.widgets import PeriodicReviewContentTypeSelect
+
+
+class TestReviewContentTypes(TestCase):
+    def setUp(self):
+        self.addCleanup(clear_review_content_types)
+
+    def test_content_types(self):
+        content_types = get_review_content_types()
+        content_type = ContentType.objects.get_for_model(ReviewedPage)
+
+        self.assertEqual(list(content_types.by_model), get_periodic_review_models())
+        self.assertEqual(content_types.by_model[ReviewedPage], content_type)
+        self.assertIn(content_type.pk, content_types.ids)
+        self.assertEqual(content_types.labels[content_type.pk], "Reviewed page")
+        self.assertIn((content_type.pk, "Reviewed page"), content_types.choices)
+
+    def test_no_queries_once_built(self):
+        get_review_content_types()
+        ContentType.objects.clear_cache()
+
+        with self.assertNumQueries(0):
+            filterset = PeriodicReviewFilterSet()
+            filterset.form.fields["content_type"].widget.render("content_type", None)
+
+            field = PeriodicReviewFrequencyRule._meta.get_field("content_type")
+            form_field = field.formfield(widget=PeriodicReviewContentTypeSelect)
+            form_field.widget.render("content_type", None)
+
+    def test_widget_choices(self):
+        field = PeriodicReviewFrequencyRule._meta.get_field("content_type")
+        widget = field.formfield(widget=PeriodicReviewContentTypeSelect).widget
+
+        self.assertEqual(
+            widget.choices, [("", "---------"), *get_review_content_types().choices]
+        )
+
+    def test_cleared_after_migrations(self):
+        content_types = get_review_content_types()
+
+        post_migrate.send(
+            sender=apps.get_app_config("wagtail_periodic_review"),
+            app_config=apps.get_app_config("wagtail_periodic_review"),
+            verbosity=0,
+            interactive=False,
+            using="default",
+        )
+
+        self.assertIsNot(get_review_content_types(), content_types)
+
+    def test_cleared_with_review_models(self):
+        content_types = get_review_content_types()
+
+        reset_review_models()
+
+        self.assertIsNot(get_review_content_types(), content_types)
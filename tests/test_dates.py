@@ -0,0 +1,106 @@
+import datetime
+
+from unittest import mock, skipIf
+
+from dateutil.relativedelta import relativedelta
+from django.test import SimpleTestCase
+
+from wagtail_periodic_review import dates
+from wagtail_periodic_review.dates import add_months, add_months_to_ordinals
+from wagtail_periodic_review.models import ReviewFrequencyChoices
+
+
+def get_days(start_year, end_year):
+    """
+    Yields every date from the start of ``start_year`` to the end of ``end_year``.
+    """
+    value = datetime.date(start_year, 1, 1)
+    end = datetime.date(end_year, 12, 31)
+    while value <= end:
+        yield value
+        value += datetime.timedelta(days=1)
+
+
+# Every day of four-year leap cycles, and of years around
+# century years with (2000) and without (1900, 2100) a leap day
+TEST_DAYS = [
+    *get_days(1899, 1901),
+    *get_days(1999, 2001),
+    *get_days(2023, 2028),
+    *get_days(2099, 2101),
+]
+
+
+class TestAddMonths(SimpleTestCase):
+    def test_matches_relativedelta(self):
+        for months in ReviewFrequencyChoices.values:
+            with self.subTest(months=months):
+                for value in TEST_DAYS:
+                    expected = value + relativedelta(months=months)
+                    if add_months(value, months) != expected:
+                        self.fail(f"{value} + {months} months should be {expected}")
+
+    def test_negative_months(self):
+        for months in (-1, -2, -12, -13, -48):
+            with self.subTest(months=months):
+                for value in get_days(2023, 2024):
+                    self.assertEqual(
+                        add_months(value, months), value + relativedelta(months=months)
+                    )
+
+    def test_datetime(self):
+        value = datetime.datetime(2024, 1, 31, 12, 30)
+        self.assertEqual(add_months(value, 1), datetime.datetime(2024, 2, 29, 12, 30))
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            add_months(datetime.date(9999, 12, 1), 1)
+
+
+class TestAddMonthsToOrdinals(SimpleTestCase):
+    ordinals = [value.toordinal() for value in TEST_DAYS]
+
+    def assertMatchesRelativedelta(self, results, months):
+        for ordinal, result, months_to_add in zip(self.ordinals, results, months):
+            value = datetime.date.fromordinal(ordinal)
+            expected = value + relativedelta(months=months_to_add)
+            if datetime.date.fromordinal(result) != expected:
+                self.fail(f"{value} + {months_to_add} months should be {expected}")
+
+    def test_months_for_all_dates(self):
+        for months in ReviewFrequencyChoices.values:
+            with self.subTest(months=months):
+                results = add_months_to_ordinals(self.ordinals, months, use_numpy=False)
+                self.assertMatchesRelativedelta(results, [months] * len(results))
+
+    def test_months_for_each_date(self):
+        choices = ReviewFrequencyChoices.values
+        months = [choices[i % len(choices)] for i in range(len(self.ordinals))]
+        results = add_months_to_ordinals(self.ordinals, months, use_numpy=False)
+        self.assertMatchesRelativedelta(results, months)
+
+    def test_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            add_months_to_ordinals(self.ordinals, [1, 2])
+
+    @mock.patch.object(dates, "np", None)
+    def test_numpy_not_installed(self):
+        self.assertEqual(
+            add_months_to_ordinals(self.ordinals, 1),
+            add_months_to_ordinals(self.ordinals, 1, use_numpy=False),
+        )
+        with self.assertRaises(ImportError):
+            add_months_to_ordinals(self.ordinals, 1, use_numpy=True)
+
+    @skipIf(dates.np is None, "NumPy is not installed")
+    def test_numpy(self):
+        for months in ReviewFrequencyChoices.values:
+            with self.subTest(months=months):
+                results = add_months_to_ordinals(self.ordinals, months, use_numpy=True)
+                self.assertMatchesRelativedelta(results, [months] * len(results))
+
+        choices = ReviewFrequencyChoices.values
+        months = [choices[i % len(choices)] for i in range(len(self.ordinals))]
+        results = add_months_to_ordinals(self.ordinals, months, use_numpy=True)
+        self.assertIsInstance(results, list)
+        self.assertMatchesRelativedelta(results, months)
@@ -0,0 +1,147 @@
+import datetime
+
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from django.urls import reverse
+from wagtail.models import Site
+from wagtail.test.utils import WagtailTestUtils
+
+from tests.models import ReviewedPage
+from wagtail_periodic_review import instrumentation
+from wagtail_periodic_review.instrumentation import instrument
+from wagtail_periodic_review.models import (
+    PeriodicReviewFrequencyRule,
+    PeriodicReviewFrequencySettings,
+)
+from wagtail_periodic_review.rules import invalidate_rule_map
+from wagtail_periodic_review.signals import review_operation_finished
+from wagtail_periodic_review.utils import get_periodic_review_models
+
+
+def run_operation(name, rows, **kwargs):
+    with instrument(name, **kwargs) as operation:
+        operation.rows = rows
+
+
+class TestInstrumentation(WagtailTestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.addClassCleanup(invalidate_rule_map)
+        cls.site = Site.objects.get(is_default_site=True)
+        cls.content_type_id = ContentType.objects.get_for_model(ReviewedPage).pk
+        for i in range(2):
+            cls.site.root_page.add_child(
+                instance=ReviewedPage(
+                    title=f"Page {i}",
+                    slug=f"page-{i}",
+                    last_review_date=datetime.date(2020, 1, 1),
+                )
+            )
+
+    def setUp(self):
+        self.addCleanup(invalidate_rule_map)
+        self.operations = []
+        review_operation_finished.connect(self.receiver)
+        self.addCleanup(review_operation_finished.disconnect, self.receiver)
+
+    def receiver(self, sender, operation, **kwargs):
+        self.operations.append(operation)
+
+    def get_operations(self, name):
+        return [operation for operation in self.operations if operation.name == name]
+
+    def test_instrument(self):
+        with instrument("test", site_id=1, content_type_id=2) as operation:
+            ReviewedPage.objects.count()
+            ReviewedPage.objects.count()
+            operation.rows = 2
+
+        self.assertEqual(self.operations, [operation])
+        self.assertEqual(
+            operation.as_dict(),
+            {
+                "operation": "test",
+                "site_id": 1,
+                "content_type_id": 2,
+                "rows": 2,
+                "duration": operation.duration,
+                "query_count": 2,
+            },
+        )
+        self.assertGreater(operation.duration, 0)
+
+    def test_logging(self):
+        with self.assertLogs(instrumentation.logger, "DEBUG") as logs:
+            run_operation("test", rows=3)
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertRegex(
+            logs.records[0].getMessage(),
+            r"^test took [\d.]+ ms, with 0 queries and 3 rows$",
+        )
+        self.assertEqual(logs.records[0].review_operation["rows"], 3)
+
+    @mock.patch.object(instrumentation, "tracer")
+    def test_opentelemetry_span(self, tracer):
+        span = tracer.start_as_current_span.return_value.__enter__.return_value
+
+        run_operation("test", site_id=1, rows=3)
+
+        tracer.start_as_current_span.assert_called_once_with(
+            "wagtail_periodic_review.test"
+        )
+        span.set_attributes.assert_called_once_with(
+            {
+                "wagtail_periodic_review.site_id": 1,
+                "wagtail_periodic_review.rows": 3,
+                "wagtail_periodic_review.query_count": 0,
+            }
+        )
+
+    def test_disabled(self):
+        review_operation_finished.disconnect(self.receiver)
+        with instrument("test") as operation:
+            ReviewedPage.objects.count()
+
+        self.assertIsNone(operation.duration)
+        self.assertEqual(operation.query_count, 0)
+
+    def test_set_next_review_dates(self):
+        settings = PeriodicReviewFrequencySettings.objects.create(site=self.site)
+        rule = PeriodicReviewFrequencyRule.objects.get(
+            sitesettings=settings, content_type__model="reviewedpage"
+        )
+
+        rule.set_next_review_dates()
+
+        [operation] = self.get_operations("set_next_review_dates")
+        self.assertEqual(operation.site_id, self.site.pk)
+        self.assertEqual(operation.content_type_id, self.content_type_id)
+        self.assertEqual(operation.rows, 2)
+        self.assertGreater(operation.query_count, 0)
+
+    def test_clean_frequency_rules(self):
+        settings = PeriodicReviewFrequencySettings.objects.create(site=self.site)
+
+        [operation] = self.get_operations("clean_frequency_rules")
+        self.assertEqual(operation.site_id, self.site.pk)
+        self.assertEqual(operation.rows, len(get_periodic_review_models()))
+
+        settings.clean_frequency_rules()
+
+        self.assertEqual(self.get_operations("clean_frequency_rules")[1].rows, 0)
+
+    def test_dashboard_and_report(self):
+        self.login()
+
+        self.client.get(reverse("wagtailadmin_home"))
+        [operation] = self.get_operations("dashboard_data")
+        self.assertEqual(operation.rows, 2)
+        self.assertGreater(operation.query_count, 0)
+
+        self.client.get(reverse("wagtail_periodic_review_report"))
+        [operation] = self.get_operations("report_page")
+        self.assertEqual(operation.rows, 2)
+        self.assertGreater(operation.query_count, 0)
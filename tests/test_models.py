@@ -0,0 +1,698 @@
+import datetime
+
+from unittest import mock, skipIf
+
+from dateutil.relativedelta import relativedelta
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import DatabaseError, connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from wagtail.models import Page, Site
+from wagtail.test.utils import WagtailTestUtils
+from wagtail.test.utils.form_data import inline_formset, nested_form_data
+
+from tests.models import ReviewedPage, SimplePage
+from wagtail_periodic_review.bulk_actions import mark_as_reviewed
+from wagtail_periodic_review.expressions import AddMonths
+from wagtail_periodic_review.models import (
+    PageReviewIndex,
+    PeriodicReviewFrequencyRule,
+    PeriodicReviewFrequencySettings,
+    ReviewFrequencyChoices,
+)
+from wagtail_periodic_review.rules import (
+    get_rule_frequency,
+    get_rule_map,
+    invalidate_rule_map,
+)
+from wagtail_periodic_review.sites import invalidate_site_paths
+from wagtail_periodic_review.tasks import recalculate_rule_next_review_dates, task
+from wagtail_periodic_review.utils import get_periodic_review_models
+
+
+try:
+    from tests.models import GeneratedReviewedPage
+except ImportError:  # Django < 5.0
+    GeneratedReviewedPage = None
+
+
+class TestAddMonths(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.page = ReviewedPage(title="Reviewed", slug="reviewed")
+        Site.objects.get(is_default_site=True).root_page.add_child(instance=cls.page)
+
+    def test_matches_relativedelta(self):
+        for value in (
+            datetime.date(2024, 1, 15),
+            datetime.date(2024, 1, 31),
+            datetime.date(2023, 2, 28),
+            datetime.date(2024, 2, 29),
+            datetime.date(2024, 8, 31),
+            datetime.date(2024, 12, 31),
+        ):
+            ReviewedPage.objects.filter(pk=self.page.pk).update(last_review_date=value)
+            for months in ReviewFrequencyChoices.values:
+                with self.subTest(date=value, months=months):
+                    result = (
+                        ReviewedPage.objects.filter(pk=self.page.pk)
+                        .annotate(next_date=AddMonths("last_review_date", months))
+                        .values_list("next_date", flat=True)
+                        .get()
+                    )
+                    self.assertEqual(result, value + relativedelta(months=months))
+
+
+class TestSetNextReviewDates(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.addClassCleanup(invalidate_rule_map)
+        cls.site = Site.objects.get(is_default_site=True)
+        cls.settings = PeriodicReviewFrequencySettings.objects.create(site=cls.site)
+        cls.rule = PeriodicReviewFrequencyRule.objects.get(
+            sitesettings=cls.settings, content_type__model="reviewedpage"
+        )
+
+        cls.page = ReviewedPage(
+            title="Reviewed",
+            slug="reviewed",
+            last_review_date=datetime.date(2024, 1, 31),
+        )
+        cls.site.root_page.add_child(instance=cls.page)
+        cls.page_custom = ReviewedPage(
+            title="Custom",
+            slug="custom",
+            last_review_date=datetime.date(2024, 1, 31),
+            custom_review_frequency=ReviewFrequencyChoices.SIX_MONTHS,
+        )
+        cls.site.root_page.add_child(instance=cls.page_custom)
+        cls.page_not_reviewed = ReviewedPage(title="Not reviewed", slug="not-reviewed")
+        cls.site.root_page.add_child(instance=cls.page_not_reviewed)
+
+    def assertNextReviewDates(self, expected):
+        self.assertEqual(
+            dict(ReviewedPage.objects.values_list("pk", "next_review_date")),
+            expected,
+        )
+
+    def test_set_next_review_dates(self):
+        self.rule.frequency = ReviewFrequencyChoices.ONE_MONTH
+        with self.assertNumQueries(2):
+            self.assertEqual(self.rule.set_next_review_dates(site=self.site), 1)
+
+        self.assertNextReviewDates(
+            {
+                self.page.pk: datetime.date(2024, 2, 29),
+                self.page_custom.pk: datetime.date(2024, 7, 31),
+                self.page_not_reviewed.pk: None,
+            }
+        )
+
+    def test_set_next_review_dates_without_database_date_arithmetic(self):
+        self.rule.frequency = ReviewFrequencyChoices.ONE_MONTH
+        with mock.patch.object(AddMonths, "supported_vendors", frozenset()):
+            self.assertEqual(self.rule.set_next_review_dates(site=self.site), 1)
+
+        self.assertNextReviewDates(
+            {
+                self.page.pk: datetime.date(2024, 2, 29),
+                self.page_custom.pk: datetime.date(2024, 7, 31),
+                self.page_not_reviewed.pk: None,
+            }
+        )
+
+
+@skipIf(GeneratedReviewedPage is None, "Requires Django 5.0+")
+class TestGeneratedReviewDate(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.addClassCleanup(invalidate_rule_map)
+        cls.site = Site.objects.get(is_default_site=True)
+        cls.settings = PeriodicReviewFrequencySettings.objects.create(site=cls.site)
+        cls.rule = cls.settings.frequency_rules.get(
+            content_type__model="generatedreviewedpage"
+        )
+        cls.page = cls.site.root_page.add_child(
+            instance=GeneratedReviewedPage(
+                title="Generated",
+                slug="generated",
+                last_review_date=datetime.date(2024, 1, 31),
+            )
+        )
+
+    def setUp(self):
+        self.addCleanup(invalidate_rule_map)
+
+    def assertNextReviewDate(self, expected):
+        self.assertEqual(
+            GeneratedReviewedPage.objects.get(pk=self.page.pk).next_review_date,
+            expected,
+        )
+
+    def test_save(self):
+        self.assertEqual(self.page.review_frequency, 12)
+        self.assertEqual(self.page.next_review_date, datetime.date(2025, 1, 31))
+
+        page = GeneratedReviewedPage.objects.get(pk=self.page.pk)
+        page.custom_review_frequency = ReviewFrequencyChoices.ONE_MONTH
+        page.save()
+
+        self.assertNextReviewDate(datetime.date(2024, 2, 29))
+        self.assertEqual(
+            PageReviewIndex.objects.get(page=page).next_review_date,
+            datetime.date(2024, 2, 29),
+        )
+
+    def test_save_update_fields(self):
+        self.rule.frequency = ReviewFrequencyChoices.SIX_MONTHS
+        self.rule.save()
+        invalidate_rule_map()
+
+        page = GeneratedReviewedPage.objects.get(pk=self.page.pk)
+        page.last_review_date = datetime.date(2024, 2, 29)
+        page.save(update_fields=["last_review_date"])
+
+        page.refresh_from_db()
+        self.assertEqual(page.review_frequency, ReviewFrequencyChoices.SIX_MONTHS)
+        self.assertEqual(page.next_review_date, datetime.date(2024, 8, 29))
+        self.assertEqual(
+            PageReviewIndex.objects.get(page=page).next_review_date,
+            page.next_review_date,
+        )
+
+    def test_queryset_update(self):
+        GeneratedReviewedPage.objects.filter(pk=self.page.pk).update(
+            last_review_date=datetime.date(2024, 2, 29)
+        )
+
+        self.assertNextReviewDate(datetime.date(2025, 2, 28))
+
+    def test_mark_as_reviewed(self):
+        mark_as_reviewed([self.page], datetime.date(2024, 8, 31))
+
+        self.assertNextReviewDate(datetime.date(2025, 8, 31))
+        self.assertEqual(
+            PageReviewIndex.objects.get(page=self.page).next_review_date,
+            datetime.date(2025, 8, 31),
+        )
+
+    def test_set_next_review_dates(self):
+        get_rule_map()
+        self.rule.frequency = ReviewFrequencyChoices.SIX_MONTHS
+        with self.assertNumQueries(2):
+            self.assertEqual(self.rule.set_next_review_dates(site=self.site), 1)
+
+        self.assertNextReviewDate(datetime.date(2024, 7, 31))
+        self.assertEqual(
+            PageReviewIndex.objects.get(page=self.page).next_review_date,
+            datetime.date(2024, 7, 31),
+        )
+
+
+class TestPeriodicReviewFrequencySettings(WagtailTestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.site = Site.objects.get(is_default_site=True)
+        cls.page = ReviewedPage(
+            title="Reviewed",
+            slug="reviewed",
+            last_review_date=datetime.date(2024, 1, 31),
+        )
+        cls.site.root_page.add_child(instance=cls.page)
+
+    def setUp(self):
+        self.addCleanup(invalidate_rule_map)
+
+    def get_page_updates(self, queries):
+        return [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith(f'UPDATE "{ReviewedPage._meta.db_table}"')
+        ]
+
+    def test_creating_settings_does_not_update_pages(self):
+        with CaptureQueriesContext(connection) as queries:
+            settings = PeriodicReviewFrequencySettings.objects.create(site=self.site)
+
+        self.assertEqual(
+            settings.frequency_rules.count(), len(get_periodic_review_models())
+        )
+        self.assertEqual(self.get_page_updates(queries), [])
+
+    def test_unchanged_save_does_not_update_pages(self):
+        settings = PeriodicReviewFrequencySettings.objects.create(site=self.site)
+        settings = PeriodicReviewFrequencySettings.objects.get(pk=settings.pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            settings.save()
+
+        self.assertEqual(self.get_page_updates(queries), [])
+
+    def test_changed_frequency_updates_pages(self):
+        settings = PeriodicReviewFrequencySettings.objects.create(site=self.site)
+        rule = settings.frequency_rules.get(content_type__model="reviewedpage")
+        rule.frequency = ReviewFrequencyChoices.THREE_MONTHS
+        settings.frequency_rules = [rule]
+
+        with CaptureQueriesContext(connection) as queries:
+            settings.save()
+
+        self.assertEqual(len(self.get_page_updates(queries)), 1)
+        self.page.refresh_from_db()
+        self.assertEqual(self.page.next_review_date, datetime.date(2024, 4, 30))
+
+    def test_deleting_rule_in_settings_form(self):
+        settings = PeriodicReviewFrequencySettings.objects.create(site=self.site)
+        settings.frequency_rules.filter(content_type__model="reviewedpage").update(
+            frequency=ReviewFrequencyChoices.THREE_MONTHS
+        )
+        settings.recalculate_next_review_dates()
+        self.page.refresh_from_db()
+        self.assertEqual(self.page.next_review_date, datetime.date(2024, 4, 30))
+        self.login()
+
+        rules = list(settings.frequency_rules.all())
+        response = self.client.post(
+            reverse(
+                "wagtailsettings:edit",
+                args=[
+                    settings._meta.app_label,
+                    settings._meta.model_name,
+                    self.site.pk,
+                ],
+            ),
+            nested_form_data(
+                {
+                    "frequency_rules": inline_formset(
+                        [
+                            {
+                                "id": rule.pk,
+                                "content_type": rule.content_type_id,
+                                "frequency": rule.frequency,
+                                "root_page": "",
+                                "ORDER": rule.sort_order,
+                                "DELETE": rule.content_type.model == "reviewedpage",
+                            }
+                            for rule in rules
+                        ],
+                        initial=len(rules),
+                    )
+                }
+            ),
+        )
+        self.assertEqual(response.status_code, 302)
+
+        # The rule is recreated with the default frequency, which the
+        # pages are updated to
+        rule = settings.frequency_rules.get(content_type__model="reviewedpage")
+        self.assertEqual(rule.frequency, ReviewFrequencyChoices.TWELVE_MONTHS)
+        self.page.refresh_from_db()
+        self.assertEqual(self.page.next_review_date, datetime.date(2025, 1, 31))
+
+    def test_get_changed_content_type_ids(self):
+        settings = PeriodicReviewFrequencySettings.objects.create(site=self.site)
+        rule = settings.frequency_rules.get(content_type__model="reviewedpage")
+
+        self.assertEqual(
+            settings.get_changed_content_type_ids({rule.content_type_id: 12}), set()
+        )
+        self.assertEqual(
+            settings.get_changed_content_type_ids({rule.content_type_id: 6}),
+            {rule.content_type_id},
+        )
+        # content types without a rule use the default frequency
+        self.assertEqual(settings.get_changed_content_type_ids({}), set())
+
+
+class TestRuleMap(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.addClassCleanup(invalidate_rule_map)
+        cls.site = Site.objects.get(is_default_site=True)
+        cls.settings = PeriodicReviewFrequencySettings.objects.create(site=cls.site)
+        cls.rule = cls.settings.frequency_rules.get(content_type__model="reviewedpage")
+        cls.page = ReviewedPage(
+            title="Reviewed",
+            slug="reviewed",
+            last_review_date=datetime.date(2024, 1, 31),
+        )
+        cls.site.root_page.add_child(instance=cls.page)
+
+    def setUp(self):
+        self.addCleanup(invalidate_rule_map)
+
+    def test_get_rule_map(self):
+        rule_map = get_rule_map()
+        self.assertEqual(len(rule_map), len(get_periodic_review_models()))
+        self.assertEqual(
+            rule_map[(self.site.pk, self.rule.content_type_id)], self.rule.frequency
+        )
+
+    def test_get_review_frequency_does_not_query_rules(self):
+        page = ReviewedPage.objects.get(pk=self.page.pk)
+        page.get_review_frequency()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                page.get_review_frequency(), ReviewFrequencyChoices.TWELVE_MONTHS
+            )
+
+    def test_saving_rule_invalidates_map(self):
+        get_rule_map()
+        self.rule.frequency = ReviewFrequencyChoices.ONE_MONTH
+        self.rule.save()
+
+        page = ReviewedPage.objects.get(pk=self.page.pk)
+        self.assertEqual(page.get_review_frequency(), ReviewFrequencyChoices.ONE_MONTH)
+
+    def test_deleting_settings_invalidates_map(self):
+        get_rule_map()
+        self.settings.delete()
+
+        self.assertEqual(get_rule_map(), {})
+
+    def test_rolled_back_rules_are_not_kept(self):
+        get_rule_map()
+        key = (self.site.pk, self.rule.content_type_id)
+
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            self.rule.frequency = ReviewFrequencyChoices.THREE_MONTHS
+            self.rule.save()
+            self.assertEqual(get_rule_map()[key], ReviewFrequencyChoices.THREE_MONTHS)
+            raise DatabaseError
+
+        self.assertEqual(get_rule_map()[key], ReviewFrequencyChoices.TWELVE_MONTHS)
+
+        # The map is kept once rebuilt
+        with self.assertNumQueries(0):
+            get_rule_map()
+
+
+class TestSubtreeRules(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.addClassCleanup(invalidate_rule_map)
+        cls.site = Site.objects.get(is_default_site=True)
+        cls.settings = PeriodicReviewFrequencySettings.objects.create(site=cls.site)
+        cls.rule = cls.settings.frequency_rules.get(content_type__model="reviewedpage")
+
+        cls.policies = cls.site.root_page.add_child(
+            instance=SimplePage(title="Policies", slug="policies")
+        )
+        cls.archive = cls.policies.add_child(
+            instance=SimplePage(title="Archive", slug="archive")
+        )
+        cls.pages = {}
+        for parent, slug in (
+            (cls.site.root_page, "home-page"),
+            (cls.policies, "policy"),
+            (cls.archive, "archived-policy"),
+        ):
+            cls.pages[slug] = parent.add_child(
+                instance=ReviewedPage(
+                    title=slug,
+                    slug=slug,
+                    last_review_date=datetime.date(2024, 1, 31),
+                )
+            )
+
+        cls.policies_rule = PeriodicReviewFrequencyRule.objects.create(
+            sitesettings=cls.settings,
+            content_type_id=cls.rule.content_type_id,
+            root_page=cls.policies,
+            frequency=ReviewFrequencyChoices.THREE_MONTHS,
+        )
+        cls.archive_rule = PeriodicReviewFrequencyRule.objects.create(
+            sitesettings=cls.settings,
+            content_type_id=cls.rule.content_type_id,
+            root_page=cls.archive,
+            frequency=ReviewFrequencyChoices.TWO_YEARS,
+        )
+
+    def setUp(self):
+        self.addCleanup(invalidate_rule_map)
+
+    def assertNextReviewDates(self, expected):
+        self.assertEqual(
+            {
+                slug: ReviewedPage.objects.get(pk=page.pk).next_review_date
+                for slug, page in self.pages.items()
+            },
+            expected,
+        )
+
+    def test_get_rule_frequency(self):
+        content_type_id = self.rule.content_type_id
+        for path, expected in (
+            (None, ReviewFrequencyChoices.TWELVE_MONTHS),
+            (self.pages["home-page"].path, ReviewFrequencyChoices.TWELVE_MONTHS),
+            (self.policies.path, ReviewFrequencyChoices.THREE_MONTHS),
+            (self.pages["policy"].path, ReviewFrequencyChoices.THREE_MONTHS),
+            (self.pages["archived-policy"].path, ReviewFrequencyChoices.TWO_YEARS),
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(
+                    get_rule_frequency(self.site.pk, content_type_id, path), expected
+                )
+        # Subtree rules are not in the site-wide map
+        self.assertEqual(len(get_rule_map()), len(get_periodic_review_models()))
+
+    def test_page_save_uses_most_specific_rule(self):
+        page = ReviewedPage.objects.get(pk=self.pages["archived-policy"].pk)
+        self.assertEqual(page.get_review_frequency_rule(), self.archive_rule)
+
+        page.last_review_date = datetime.date(2024, 3, 1)
+        page.save()
+
+        self.assertEqual(page.next_review_date, datetime.date(2026, 3, 1))
+
+    def test_set_next_review_dates_skips_more_specific_rules(self):
+        get_rule_map()
+        self.rule.frequency = ReviewFrequencyChoices.ONE_MONTH
+        # The rule map provides the subtrees to skip
+        with self.assertNumQueries(2):
+            self.assertEqual(self.rule.set_next_review_dates(site=self.site), 1)
+        self.policies_rule.frequency = ReviewFrequencyChoices.SIX_MONTHS
+        self.assertEqual(self.policies_rule.set_next_review_dates(site=self.site), 1)
+
+        self.assertNextReviewDates(
+            {
+                "home-page": datetime.date(2024, 2, 29),
+                "policy": datetime.date(2024, 7, 31),
+                # Unchanged since the page was created, before the rules
+                "archived-policy": datetime.date(2025, 1, 31),
+            }
+        )
+
+    def test_set_next_review_dates_skips_nested_sites(self):
+        self.addCleanup(invalidate_site_paths)
+        Site.objects.create(hostname="archive.example.com", root_page=self.archive)
+        self.archive_rule.delete()
+
+        self.policies_rule.frequency = ReviewFrequencyChoices.SIX_MONTHS
+        self.assertEqual(self.policies_rule.set_next_review_dates(site=self.site), 1)
+
+    def test_deleting_subtree_rule(self):
+        self.settings.frequency_rules = [self.rule, self.policies_rule]
+        self.settings.save()
+
+        # Archived policies fall back to the enclosing subtree's rule
+        self.assertNextReviewDates(
+            {
+                "home-page": datetime.date(2025, 1, 31),
+                "policy": datetime.date(2024, 4, 30),
+                "archived-policy": datetime.date(2024, 4, 30),
+            }
+        )
+
+    def test_get_changed_content_type_ids(self):
+        content_type_id = self.rule.content_type_id
+        previous_frequencies = self.settings.get_saved_frequencies()
+        self.assertEqual(
+            previous_frequencies[content_type_id], ReviewFrequencyChoices.TWELVE_MONTHS
+        )
+        self.assertEqual(
+            previous_frequencies[(content_type_id, self.policies.pk)],
+            ReviewFrequencyChoices.THREE_MONTHS,
+        )
+        self.assertEqual(
+            previous_frequencies[(content_type_id, self.archive.pk)],
+            ReviewFrequencyChoices.TWO_YEARS,
+        )
+
+        self.archive_rule.delete()
+        self.assertEqual(
+            self.settings.get_changed_content_type_ids(previous_frequencies),
+            {content_type_id},
+        )
+
+    def test_clean(self):
+        self.policies_rule.full_clean()
+
+        outside = Page.get_first_root_node().add_child(
+            instance=SimplePage(title="Outside", slug="outside")
+        )
+        self.policies_rule.root_page = outside
+        with self.assertRaises(ValidationError) as cm:
+            self.policies_rule.full_clean()
+        self.assertIn("root_page", cm.exception.message_dict)
+
+    def test_clean_site_root_page(self):
+        self.policies_rule.root_page = self.site.root_page
+        with self.assertRaises(ValidationError) as cm:
+            self.policies_rule.full_clean()
+        self.assertIn("root_page", cm.exception.message_dict)
+
+    def test_sync_frequency_rules_keeps_subtree_rules(self):
+        self.rule.delete()
+
+        PeriodicReviewFrequencySettings.sync_frequency_rules()
+
+        self.assertEqual(
+            set(self.settings.frequency_rules.values_list("root_page", flat=True)),
+            {None, self.policies.pk, self.archive.pk},
+        )
+
+    def test_page_move_invalidates_map(self):
+        get_rule_map()
+        self.addCleanup(invalidate_site_paths)
+
+        self.pages["policy"].move(self.archive, pos="last-child")
+
+        page = ReviewedPage.objects.get(pk=self.pages["policy"].pk)
+        self.assertEqual(page.get_review_frequency(), ReviewFrequencyChoices.TWO_YEARS)
+
+
+@skipIf(task is None, "Requires Django 6.0+ or django-tasks")
+@override_settings(WAGTAIL_PERIODIC_REVIEW_DEFER_RECALCULATION=True)
+class TestDeferredRecalculation(WagtailTestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.site = Site.objects.get(is_default_site=True)
+        cls.page = ReviewedPage(
+            title="Reviewed",
+            slug="reviewed",
+            last_review_date=datetime.date(2024, 1, 31),
+        )
+        cls.site.root_page.add_child(instance=cls.page)
+
+    def setUp(self):
+        self.addCleanup(invalidate_rule_map)
+
+    def change_frequency(self, frequency):
+        settings = PeriodicReviewFrequencySettings.for_site(self.site)
+        rule = settings.frequency_rules.get(content_type__model="reviewedpage")
+        rule.frequency = frequency
+        settings.frequency_rules = [rule]
+        with self.captureOnCommitCallbacks() as callbacks:
+            settings.save()
+        return settings, callbacks
+
+    def test_changed_frequency_is_recalculated_by_task(self):
+        settings, callbacks = self.change_frequency(ReviewFrequencyChoices.THREE_MONTHS)
+
+        self.assertTrue(
+            settings.frequency_rules.get(
+                content_type__model="reviewedpage"
+            ).recalculation_pending
+        )
+        self.page.refresh_from_db()
+        self.assertEqual(self.page.next_review_date, datetime.date(2025, 1, 31))
+
+        for callback in callbacks:
+            callback()
+
+        self.assertFalse(
+            settings.frequency_rules.get(
+                content_type__model="reviewedpage"
+            ).recalculation_pending
+        )
+        self.page.refresh_from_db()
+        self.assertEqual(self.page.next_review_date, datetime.date(2024, 4, 30))
+
+    def test_recalculation_task_is_idempotent(self):
+        settings, _callbacks = self.change_frequency(ReviewFrequencyChoices.ONE_MONTH)
+        rule = settings.frequency_rules.get(content_type__model="reviewedpage")
+
+        for _ in range(2):
+            recalculate_rule_next_review_dates.call(rule.pk)
+            self.page.refresh_from_db()
+            self.assertEqual(self.page.next_review_date, datetime.date(2024, 2, 29))
+
+    def test_settings_show_pending_recalculation(self):
+        settings, _callbacks = self.change_frequency(
+            ReviewFrequencyChoices.THREE_MONTHS
+        )
+        self.login()
+
+        response = self.client.get(
+            reverse(
+                "wagtailsettings:edit",
+                args=[
+                    settings._meta.app_label,
+                    settings._meta.model_name,
+                    self.site.pk,
+                ],
+            )
+        )
+
+        self.assertContains(
+            response, "Next review dates are being recalculated for: Reviewed page."
+        )
+
+
+class TestSyncFrequencyRules(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.addClassCleanup(invalidate_rule_map)
+        cls.settings = PeriodicReviewFrequencySettings.objects.create(
+            site=Site.objects.get(is_default_site=True)
+        )
+        cls.content_type_ids = sorted(
+            content_type.pk
+            for content_type in ContentType.objects.get_for_models(
+                *get_periodic_review_models()
+            ).values()
+        )
+
+    def setUp(self):
+        self.addCleanup(invalidate_rule_map)
+
+    def test_sync_frequency_rules(self):
+        self.settings.frequency_rules.all().delete()
+        PeriodicReviewFrequencyRule.objects.create(
+            sitesettings=self.settings,
+            content_type=ContentType.objects.get_for_model(SimplePage),
+        )
+
+        # settings IDs, rules, stale rule collection and deletion, and new rules
+        with self.assertNumQueries(5):
+            PeriodicReviewFrequencySettings.sync_frequency_rules()
+
+        self.assertEqual(
+            list(
+                self.settings.frequency_rules.values_list("content_type", "frequency")
+            ),
+            [
+                (content_type_id, ReviewFrequencyChoices.TWELVE_MONTHS)
+                for content_type_id in self.content_type_ids
+            ],
+        )
+
+    def test_saving_settings_does_not_sync_rules(self):
+        self.settings.frequency_rules.all().delete()
+        self.settings.save()
+        self.assertFalse(self.settings.frequency_rules.exists())
+
+    def test_post_migrate_syncs_rules(self):
+        self.settings.frequency_rules.all().delete()
+
+        emit_post_migrate_signal(verbosity=0, interactive=False, db="default")
+
+        self.assertEqual(
+            list(self.settings.frequency_rules.values_list("content_type", flat=True)),
+            self.content_type_ids,
+        )
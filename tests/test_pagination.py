@@ -0,0 +1,100 @@
+import datetime
+
+from django.test import TestCase
+from wagtail.models import Page, Site
+
+from tests.models import ReviewedPage
+from wagtail_periodic_review.pagination import KeysetPaginator
+from wagtail_periodic_review.utils import add_review_date_annotations
+
+
+class TestKeysetPaginator(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        root_page = Site.objects.get(is_default_site=True).root_page
+        # Pairs of pages with the same review date
+        cls.pages = [
+            root_page.add_child(
+                instance=ReviewedPage(
+                    title=f"Page {i}",
+                    slug=f"page-{i}",
+                    last_review_date=datetime.date(2024, 1 + i // 2, 1),
+                )
+            )
+            for i in range(7)
+        ]
+
+    def get_paginator(self, per_page=3, **kwargs):
+        return KeysetPaginator(
+            add_review_date_annotations(Page.objects.all()),
+            per_page,
+            date_field="next_review_date",
+            **kwargs,
+        )
+
+    def get_page_ids(self, page):
+        return [item.pk for item in page]
+
+    def test_pages(self):
+        paginator = self.get_paginator()
+        page_ids = [page.pk for page in self.pages]
+
+        first = paginator.get_page(None)
+        self.assertEqual(first.number, 1)
+        self.assertEqual(self.get_page_ids(first), page_ids[:3])
+        self.assertFalse(first.has_previous())
+        self.assertTrue(first.has_next())
+
+        second = paginator.get_page(first.next_page_number())
+        self.assertEqual(second.number, 2)
+        self.assertEqual(self.get_page_ids(second), page_ids[3:6])
+
+        third = paginator.get_page(second.next_page_number())
+        self.assertEqual(third.number, 3)
+        self.assertEqual(self.get_page_ids(third), page_ids[6:])
+        self.assertFalse(third.has_next())
+
+        previous = paginator.get_page(third.previous_page_number())
+        self.assertEqual(previous.number, 2)
+        self.assertEqual(self.get_page_ids(previous), page_ids[3:6])
+        self.assertTrue(previous.has_next())
+
+        previous = paginator.get_page(previous.previous_page_number())
+        self.assertEqual(previous.number, 1)
+        self.assertEqual(self.get_page_ids(previous), page_ids[:3])
+        self.assertFalse(previous.has_previous())
+
+    def test_page_queries(self):
+        paginator = self.get_paginator()
+        cursor = paginator.get_page(None).next_page_number()
+
+        with self.assertNumQueries(1) as context:
+            paginator.get_page(cursor)
+
+        sql = context.captured_queries[0]["sql"]
+        self.assertIn("LIMIT 4", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_invalid_cursor(self):
+        paginator = self.get_paginator()
+        for cursor in ("", "2", "2-x-20240101-1", "0-a-20240101-1", "1-a-2024-1"):
+            with self.subTest(cursor=cursor):
+                page = paginator.get_page(cursor)
+                self.assertEqual(page.number, 1)
+                self.assertFalse(page.has_previous())
+
+    def test_count(self):
+        paginator = self.get_paginator()
+        self.assertEqual(paginator.count, 7)
+        self.assertFalse(paginator.count_is_limited)
+        self.assertEqual(paginator.num_pages, 3)
+
+    def test_limited_count(self):
+        paginator = self.get_paginator(count_limit=5)
+        self.assertEqual(paginator.count, 5)
+        self.assertTrue(paginator.count_is_limited)
+        self.assertEqual(paginator.num_pages, "2+")
+
+        paginator = self.get_paginator(count_limit=7)
+        self.assertEqual(paginator.count, 7)
+        self.assertFalse(paginator.count_is_limited)
@@ -0,0 +1,128 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.test import TestCase
+from wagtail.models import GroupPagePermission, Page, Site
+from wagtail.permission_policies.pages import PagePermissionPolicy
+
+from tests.models import SimplePage
+from wagtail_periodic_review.paths import get_path_range, get_subtree_roots
+from wagtail_periodic_review.permissions import (
+    EditablePaths,
+    get_editable_pages,
+    get_editable_paths,
+    invalidate_editable_paths,
+)
+
+
+class TestPathHelpers(TestCase):
+    def test_get_path_range(self):
+        self.assertEqual(get_path_range("00010001"), ("00010001", "00010002"))
+        self.assertEqual(get_path_range("00010009"), ("00010009", "0001000A"))
+        self.assertEqual(get_path_range("0001000Z"), ("0001000Z", "0001001"))
+        self.assertEqual(get_path_range("0001ZZZZ"), ("0001ZZZZ", "0002"))
+        self.assertEqual(get_path_range("ZZZZ"), ("ZZZZ", None))
+
+    def test_get_subtree_roots(self):
+        self.assertEqual(
+            get_subtree_roots(["00010002", "0001", "00020001", "00010003", "0001"]),
+            ("0001", "00020001"),
+        )
+
+
+class TestEditablePages(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.addClassCleanup(invalidate_editable_paths)
+        root_page = Site.objects.get(is_default_site=True).root_page
+        cls.user = get_user_model().objects.create_user(username="editor")
+        cls.group = Group.objects.create(name="Section editors")
+        cls.user.groups.add(cls.group)
+
+        cls.section = root_page.add_child(
+            instance=SimplePage(title="Section", slug="section")
+        )
+        cls.section_child = cls.section.add_child(
+            instance=SimplePage(title="Section child", slug="child")
+        )
+        cls.next_section = root_page.add_child(
+            instance=SimplePage(title="Next section", slug="next-section")
+        )
+        cls.owned_page = cls.next_section.add_child(
+            instance=SimplePage(title="Owned", slug="owned", owner=cls.user)
+        )
+        cls.next_section.add_child(
+            instance=SimplePage(title="Not owned", slug="not-owned")
+        )
+
+        GroupPagePermission.objects.create(
+            group=cls.group,
+            page=cls.section,
+            permission=Permission.objects.get(codename="change_page"),
+        )
+        GroupPagePermission.objects.create(
+            group=cls.group,
+            page=cls.next_section,
+            permission=Permission.objects.get(codename="add_page"),
+        )
+
+    def setUp(self):
+        self.addCleanup(invalidate_editable_paths)
+
+    def assertEditablePages(self, user):
+        self.assertQuerySetEqual(
+            get_editable_pages(user).order_by("path"),
+            PagePermissionPolicy()
+            .instances_user_has_permission_for(user, "change")
+            .order_by("path"),
+        )
+
+    def test_get_editable_paths(self):
+        self.assertEqual(
+            get_editable_paths(self.user),
+            EditablePaths((self.section.path,), (self.next_section.path,)),
+        )
+
+    def test_get_editable_paths_is_cached(self):
+        get_editable_paths(self.user)
+        with self.assertNumQueries(0):
+            get_editable_paths(self.user)
+
+    def test_get_editable_pages(self):
+        self.assertEditablePages(self.user)
+        self.assertEqual(
+            set(get_editable_pages(self.user).values_list("pk", flat=True)),
+            {self.section.pk, self.section_child.pk, self.owned_page.pk},
+        )
+
+    def test_get_editable_pages_for_superuser(self):
+        superuser = get_user_model().objects.create_superuser(username="admin")
+        self.assertEqual(get_editable_pages(superuser).count(), Page.objects.count())
+
+    def test_get_editable_pages_without_permissions(self):
+        user = get_user_model().objects.create_user(username="reader")
+        self.assertFalse(get_editable_pages(user).exists())
+
+    def test_permission_changes_invalidate_cache(self):
+        get_editable_paths(self.user)
+
+        GroupPagePermission.objects.filter(permission__codename="add_page").delete()
+
+        self.assertEqual(
+            get_editable_paths(self.user), EditablePaths((self.section.path,), ())
+        )
+
+        self.user.groups.clear()
+
+        self.assertEqual(get_editable_paths(self.user), EditablePaths((), ()))
+
+    def test_page_move_invalidates_cache(self):
+        get_editable_paths(self.user)
+
+        self.section.move(self.next_section, pos="last-child")
+
+        self.section.refresh_from_db()
+        self.assertEqual(
+            get_editable_paths(self.user),
+            EditablePaths((self.section.path,), (self.next_section.path,)),
+        )
+        self.assertEditablePages(self.user)
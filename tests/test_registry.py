@@ -0,0 +1,81 @@
+from unittest import skipUnless
+
+from django.db import models
+from django.test import SimpleTestCase
+from django.test.utils import isolate_apps
+
+from tests.models import ReviewedPage, SimplePage
+from wagtail_periodic_review.models import PeriodicReviewMixin
+from wagtail_periodic_review.registry import (
+    build_review_models,
+    get_review_model,
+    get_review_models,
+    reset_review_models,
+)
+from wagtail_periodic_review.utils import get_periodic_review_models
+
+
+class TestReviewModelRegistry(SimpleTestCase):
+    def test_review_model(self):
+        review_model = get_review_model(ReviewedPage)
+
+        self.assertEqual(review_model.depth, 1)
+        self.assertIs(review_model.review_fields_model, ReviewedPage)
+        self.assertTrue(review_model.defines_review_fields)
+        self.assertFalse(review_model.generated_next_review_date)
+
+    def test_other_models(self):
+        self.assertIsNone(get_review_model(SimplePage))
+        self.assertIsNone(get_review_model(None))
+
+    @skipUnless(hasattr(models, "GeneratedField"), "Requires Django 5.0+")
+    def test_generated_next_review_date(self):
+        from tests.models import GeneratedReviewedPage
+
+        self.assertTrue(
+            get_review_model(GeneratedReviewedPage).generated_next_review_date
+        )
+
+    def test_get_periodic_review_models(self):
+        self.assertEqual(
+            get_periodic_review_models(),
+            [review_model.model for review_model in get_review_models()],
+        )
+
+    def test_reset(self):
+        review_models = get_review_models()
+
+        reset_review_models()
+
+        self.assertIsNot(get_review_models(), review_models)
+        self.assertEqual(get_review_models(), review_models)
+
+    @isolate_apps("tests")
+    def test_inheritance_order(self):
+        class ReviewedModel(PeriodicReviewMixin):
+            pass
+
+        class ChildModel(ReviewedModel):
+            pass
+
+        class GrandchildModel(ChildModel):
+            pass
+
+        review_models = build_review_models(
+            [GrandchildModel, ChildModel, ReviewedModel]
+        )
+
+        self.assertEqual(
+            [
+                (review_model.model, review_model.depth)
+                for review_model in review_models
+            ],
+            [(ReviewedModel, 0), (ChildModel, 1), (GrandchildModel, 2)],
+        )
+        for review_model in review_models:
+            with self.subTest(model=review_model.model):
+                self.assertIs(review_model.review_fields_model, ReviewedModel)
+                self.assertEqual(
+                    review_model.defines_review_fields,
+                    review_model.model is ReviewedModel,
+                )
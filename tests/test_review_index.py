@@ -0,0 +1,93 @@
+import datetime
+
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from wagtail.models import Page, Site
+
+from tests.models import ReviewedPage, SimplePage
+from wagtail_periodic_review.caching import REVIEW_DATA_CACHE_NAME, get_cache_version
+from wagtail_periodic_review.models import PageReviewIndex
+from wagtail_periodic_review.utils import review_overdue
+
+
+class TestPageReviewIndex(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.site = Site.objects.get(is_default_site=True)
+        cls.page = ReviewedPage(
+            title="Reviewed",
+            slug="reviewed",
+            last_review_date=datetime.date(2024, 1, 31),
+        )
+        cls.site.root_page.add_child(instance=cls.page)
+
+    def test_page_save_updates_index(self):
+        entry = PageReviewIndex.objects.get(page=self.page)
+        self.assertEqual(entry.site_id, self.site.pk)
+        self.assertEqual(entry.content_type_id, self.page.content_type_id)
+        self.assertEqual(entry.last_review_date, datetime.date(2024, 1, 31))
+        self.assertEqual(entry.next_review_date, datetime.date(2025, 1, 31))
+
+        page = ReviewedPage.objects.get(pk=self.page.pk)
+        page.last_review_date = datetime.date(2024, 2, 29)
+        page.save()
+
+        entry.refresh_from_db()
+        self.assertEqual(entry.last_review_date, datetime.date(2024, 2, 29))
+        self.assertEqual(entry.next_review_date, datetime.date(2025, 2, 28))
+
+    def test_save_update_fields_attname(self):
+        page = ReviewedPage.objects.get(pk=self.page.pk)
+        page.content_type = ContentType.objects.get_for_model(SimplePage)
+        page.save(update_fields=["content_type_id"])
+
+        self.assertEqual(
+            PageReviewIndex.objects.get(page=page).content_type_id,
+            page.content_type_id,
+        )
+
+    def test_unchanged_save_does_not_update_index(self):
+        page = ReviewedPage.objects.get(pk=self.page.pk)
+        page.title = "Changed title"
+        version = get_cache_version(REVIEW_DATA_CACHE_NAME)
+
+        with CaptureQueriesContext(connection) as queries:
+            page.save()
+            page.save_revision()
+
+        self.assertFalse(
+            any(PageReviewIndex._meta.db_table in query["sql"] for query in queries)
+        )
+        self.assertEqual(get_cache_version(REVIEW_DATA_CACHE_NAME), version)
+
+    def test_page_move_updates_index_site(self):
+        other_root = Page.get_first_root_node().add_child(
+            instance=SimplePage(title="Other site", slug="other-site")
+        )
+        other_site = Site.objects.create(hostname="other", root_page=other_root)
+
+        self.page.move(other_root, pos="last-child")
+
+        self.assertEqual(
+            PageReviewIndex.objects.get(page=self.page).site_id, other_site.pk
+        )
+
+    def test_rebuild_command(self):
+        PageReviewIndex.objects.all().delete()
+
+        call_command("rebuild_periodic_review_index", stdout=StringIO())
+
+        entry = PageReviewIndex.objects.get()
+        self.assertEqual(entry.page_id, self.page.pk)
+        self.assertEqual(entry.site_id, self.site.pk)
+        self.assertEqual(entry.next_review_date, datetime.date(2025, 1, 31))
+
+    def test_queries_do_not_join_subclass_tables(self):
+        sql = str(review_overdue(Page.objects.live()).query)
+        self.assertIn(PageReviewIndex._meta.db_table, sql)
+        self.assertNotIn(ReviewedPage._meta.db_table, sql)
@@ -0,0 +1,145 @@
+import datetime
+
+from unittest import mock
+
+from django.db import DatabaseError, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from wagtail.models import Locale, Page, Site
+
+from tests.models import ReviewedPage, SimplePage
+from wagtail_periodic_review.models import PageReviewIndex
+from wagtail_periodic_review.paths import PathPrefixIndex
+from wagtail_periodic_review.sites import (
+    get_site_id_for_path,
+    get_site_path_index,
+    invalidate_site_paths,
+)
+
+
+class TestPathPrefixIndex(SimpleTestCase):
+    def test_get(self):
+        index = PathPrefixIndex(
+            [
+                ("00010001", "a"),
+                ("000100010002", "nested"),
+                ("0001000100020001", "nested again"),
+                ("00010002", "b"),
+                ("00010001", "duplicate"),
+            ]
+        )
+
+        self.assertEqual(len(index), 4)
+        for path, expected in (
+            ("00010001", "a"),
+            ("000100010001", "a"),
+            ("000100010002", "nested"),
+            ("0001000100020003", "nested"),
+            ("00010001000200010001", "nested again"),
+            ("0001000100020002", "nested"),
+            ("000100010003", "a"),
+            ("0001000100030001", "a"),
+            ("000100020001", "b"),
+            ("0001", None),
+            ("00010003", None),
+            ("0002", None),
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(index.get(path), expected)
+
+    def test_empty(self):
+        self.assertIsNone(PathPrefixIndex([]).get("0001"))
+
+
+class TestSiteResolution(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.addClassCleanup(invalidate_site_paths)
+        cls.site = Site.objects.get(is_default_site=True)
+        cls.section = cls.site.root_page.add_child(
+            instance=SimplePage(title="Section", slug="section")
+        )
+        cls.nested_site = Site.objects.create(
+            hostname="nested.example.com", root_page=cls.section
+        )
+        cls.outside = Page.get_first_root_node().add_child(
+            instance=SimplePage(title="Outside", slug="outside")
+        )
+
+    def setUp(self):
+        self.addCleanup(invalidate_site_paths)
+
+    def test_get_site_id_for_path(self):
+        for page, expected in (
+            (self.site.root_page, self.site.pk),
+            (self.section, self.nested_site.pk),
+            (self.outside, None),
+            (Page.get_first_root_node(), None),
+        ):
+            with self.subTest(page=page):
+                self.assertEqual(get_site_id_for_path(page.path), expected)
+
+    def test_no_queries_once_built(self):
+        get_site_path_index()
+        with self.assertNumQueries(0):
+            get_site_id_for_path(self.section.path)
+
+    def test_sites_sharing_a_root_page(self):
+        other_site = Site.objects.create(
+            hostname="a.example.com", root_page=self.section
+        )
+        # The default site is preferred, then the first by hostname
+        self.assertEqual(get_site_id_for_path(self.section.path), other_site.pk)
+
+    def test_site_changes_invalidate_index(self):
+        get_site_path_index()
+
+        self.nested_site.delete()
+        self.assertEqual(get_site_id_for_path(self.section.path), self.site.pk)
+
+        site = Site.objects.create(
+            hostname="outside.example.com", root_page=self.outside
+        )
+        self.assertEqual(get_site_id_for_path(self.outside.path), site.pk)
+
+    def test_rolled_back_sites_are_not_kept(self):
+        get_site_path_index()
+        nested_site_id = self.nested_site.pk
+
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            self.nested_site.delete()
+            self.assertEqual(get_site_id_for_path(self.section.path), self.site.pk)
+            raise DatabaseError
+
+        self.assertEqual(get_site_id_for_path(self.section.path), nested_site_id)
+
+    def test_page_move_invalidates_index(self):
+        get_site_path_index()
+
+        self.section.move(self.outside, pos="last-child")
+
+        self.section.refresh_from_db()
+        self.assertEqual(get_site_id_for_path(self.section.path), self.nested_site.pk)
+
+    @override_settings(WAGTAIL_I18N_ENABLED=True)
+    def test_root_page_translations(self):
+        translation = self.site.root_page.copy_for_translation(
+            Locale.objects.create(language_code="fr")
+        )
+
+        self.assertEqual(get_site_id_for_path(translation.path), self.site.pk)
+
+    def test_review_page_site(self):
+        page = self.section.add_child(
+            instance=ReviewedPage(
+                title="Reviewed",
+                slug="reviewed",
+                last_review_date=datetime.date(2024, 1, 1),
+            )
+        )
+
+        # Pages don't have to be routable
+        with mock.patch.object(Page, "get_url_parts", return_value=None):
+            self.assertEqual(page.get_review_site_id(), self.nested_site.pk)
+        self.assertEqual(
+            PageReviewIndex.objects.get(page=page).site_id, self.nested_site.pk
+        )
@@ -1,3 +1,5 @@
+import datetime
+
 from unittest import mock
 
 from dateutil.relativedelta import relativedelta
@@ -5,11 +7,18 @@ from django.test import TestCase
 from django.utils import timezone
 from wagtail.models import Page, Site
 
-from tests.models import NonPageModel, ReviewedPage
+from tests.models import NonPageModel, ReviewedPage, SimplePage
 from wagtail_periodic_review.utils import (
+    OVERDUE,
+    THIS_MONTH,
+    ForecastBucket,
+    ReviewBucket,
     add_review_date_annotations,
     for_review_this_month,
+    get_month_range,
     get_periodic_review_models,
+    get_review_dashboard_data,
+    review_forecast,
     review_overdue,
 )
 
@@ -45,8 +54,27 @@ class TestUtils(TestCase):
     def test_get_periodic_review_models(self):
         models = get_periodic_review_models()
 
-        self.assertEqual(len(models), 1)
-        self.assertEqual(models[0], ReviewedPage)
+        self.assertIn(ReviewedPage, models)
+        self.assertNotIn(SimplePage, models)
+
+    def test_get_month_range(self):
+        self.assertEqual(
+            get_month_range(datetime.date(2024, 1, 31)),
+            (datetime.date(2024, 1, 1), datetime.date(2024, 2, 1)),
+        )
+        self.assertEqual(
+            get_month_range(datetime.date(2024, 12, 1)),
+            (datetime.date(2024, 12, 1), datetime.date(2025, 1, 1)),
+        )
+
+    def test_date_filters_are_ranges(self):
+        for queryset in (
+            review_overdue(Page.objects.live()),
+            for_review_this_month(Page.objects.live()),
+        ):
+            sql = str(queryset.query)
+            self.assertIn('"next_review_date" <', sql)
+            self.assertNotIn("django_date_extract", sql)
 
     def test_review_overdue(self):
         pages = review_overdue(Page.objects.live())
@@ -82,6 +110,83 @@ class TestUtils(TestCase):
         # for non-Page querysets, we just return the queryset unchanged
         self.assertEqual(for_review_this_month(NonPageModel.objects.all()).count(), 1)
 
+    def test_get_review_dashboard_data(self):
+        page_overdue_earlier = ReviewedPage(
+            title="Overdue earlier",
+            slug="overdue-earlier",
+            last_review_date=self.page_overdue.last_review_date
+            - relativedelta(months=1),
+        )
+        self.root_page.add_child(instance=page_overdue_earlier)
+
+        with self.assertNumQueries(1):
+            data = get_review_dashboard_data(Page.objects.live(), limit=1)
+
+        self.assertEqual(
+            [page.pk for page in data[OVERDUE].pages], [self.page_overdue.pk]
+        )
+        self.assertEqual(data[OVERDUE].total, 2)
+        self.assertEqual(
+            [page.pk for page in data[THIS_MONTH].pages], [self.page_soon.pk]
+        )
+        self.assertEqual(data[THIS_MONTH].total, 1)
+        self.assertEqual(
+            data[OVERDUE].pages[0].next_review_date,
+            self.page_overdue.next_review_date,
+        )
+
+    @mock.patch(
+        "wagtail_periodic_review.utils.get_periodic_review_models", return_value=[]
+    )
+    def test_get_review_dashboard_data_with_no_periodic_review_models(
+        self, _mocked_get_periodic_review_models
+    ):
+        self.assertEqual(
+            get_review_dashboard_data(Page.objects.live()),
+            {OVERDUE: ReviewBucket([], 0), THIS_MONTH: ReviewBucket([], 0)},
+        )
+
+    def test_review_forecast(self):
+        month_start = timezone.now().date().replace(day=1)
+        # Note: the default review period is 12 months
+        for months, slug in (
+            (-1, "due-in-11-months"),
+            (-1, "also-due-in-11-months"),
+            (0, "due-in-12-months"),
+        ):
+            self.root_page.add_child(
+                instance=ReviewedPage(
+                    title=slug,
+                    slug=slug,
+                    last_review_date=month_start + relativedelta(months=months),
+                )
+            )
+        content_type_id = self.page_soon.content_type_id
+
+        with self.assertNumQueries(1):
+            forecast = review_forecast(Page.objects.live())
+
+        # Overdue pages and pages due after the next 12 months are left out
+        self.assertEqual(
+            forecast,
+            [
+                ForecastBucket(month_start, content_type_id, self.site.pk, 1),
+                ForecastBucket(
+                    month_start + relativedelta(months=11),
+                    content_type_id,
+                    self.site.pk,
+                    2,
+                ),
+            ],
+        )
+        self.assertEqual(
+            review_forecast(Page.objects.live(), months=1),
+            [ForecastBucket(month_start, content_type_id, self.site.pk, 1)],
+        )
+
+    def test_review_forecast_with_non_page_queryset(self):
+        self.assertEqual(review_forecast(NonPageModel.objects.all()), [])
+
     def test_add_review_date_annotations(self):
         annotated = add_review_date_annotations(
             Page.objects.filter(pk=self.page_ok.pk)
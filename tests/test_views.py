@@ -1,13 +1,47 @@
-from unittest import mock
+from io import BytesIO
+from unittest import mock, skipIf
 
 from dateutil.relativedelta import relativedelta
-from django.test import TestCase
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
+from openpyxl import load_workbook
+from wagtail import VERSION as WAGTAIL_VERSION
 from wagtail.models import Site
 from wagtail.test.utils import WagtailTestUtils
 
 from tests.models import NonPageModel, ReviewedPage, SimplePage
+from wagtail_periodic_review.caching import invalidate_review_data
+from wagtail_periodic_review.models import PageReviewIndex
+from wagtail_periodic_review.views import PeriodicReviewContentReport
+from wagtail_periodic_review.wagtail_hooks import get_dashboard_cache_key
+
+
+def add_pages_due_for_review(parent, count):
+    """
+    Adds ``count`` overdue or due this month pages under ``parent``,
+    each with a draft revision.
+    """
+    month_start = timezone.now().date().replace(day=1)
+    offset = parent.get_children().count()
+    for i in range(offset, offset + count):
+        page = ReviewedPage(
+            title=f"Page {i}",
+            slug=f"page-{i}",
+            last_review_date=month_start - relativedelta(months=12 + i % 2),
+        )
+        parent.add_child(instance=page)
+        page.save_revision()
+
+
+def get_query_count(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        client.get(url)
+    return len(queries)
 
 
 class DashboardPanelsTest(WagtailTestUtils, TestCase):
@@ -27,6 +61,7 @@ class DashboardPanelsTest(WagtailTestUtils, TestCase):
     def setUp(self):
         super().setUp()
         self.user = self.login()
+        self.addCleanup(cache.clear)
 
     def add_overdue_page(self):
         # Note: the default review period is 12 months
@@ -45,6 +80,71 @@ class DashboardPanelsTest(WagtailTestUtils, TestCase):
         )
         self.root_page.add_child(instance=self.page_soon)
 
+    def test_query_count_does_not_grow_with_pages(self):
+        add_pages_due_for_review(self.root_page, 2)
+        # Page URLs use the cached site root paths
+        Site.get_site_root_paths()
+        expected = get_query_count(self.client, self.dashboard_url)
+
+        add_pages_due_for_review(self.root_page, 8)
+        self.assertEqual(get_query_count(self.client, self.dashboard_url), expected)
+
+    def get_index_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.dashboard_url)
+        return [
+            query["sql"]
+            for query in queries
+            if PageReviewIndex._meta.db_table in query["sql"]
+        ]
+
+    def test_panels_are_cached(self):
+        self.add_overdue_page()
+        # Both panels share a single query
+        self.assertEqual(len(self.get_index_queries()), 1)
+
+        self.assertEqual(self.get_index_queries(), [])
+        response = self.client.get(self.dashboard_url)
+        self.assertContains(response, self.page_overdue_title)
+
+    @override_settings(WAGTAIL_PERIODIC_REVIEW_DASHBOARD_CACHE_TIMEOUT=0)
+    def test_panels_are_not_cached_without_timeout(self):
+        self.add_overdue_page()
+        self.get_index_queries()
+        self.assertEqual(len(self.get_index_queries()), 1)
+
+    def test_panel_cache_is_invalidated_by_review(self):
+        self.add_overdue_page()
+        response = self.client.get(self.dashboard_url)
+        self.assertContains(response, self.page_overdue_title)
+
+        self.page_overdue.last_review_date = self.month_start
+        self.page_overdue.save()
+
+        response = self.client.get(self.dashboard_url)
+        self.assertNotContains(response, self.page_overdue_title)
+
+    def test_dashboard_cache_key(self):
+        key = get_dashboard_cache_key(self.user)
+
+        with mock.patch(
+            "django.utils.timezone.now",
+            return_value=timezone.now() + relativedelta(months=1),
+        ):
+            self.assertNotEqual(get_dashboard_cache_key(self.user), key)
+
+        invalidate_review_data()
+        self.assertNotEqual(get_dashboard_cache_key(self.user), key)
+
+    def test_panels_show_remaining_page_count(self):
+        add_pages_due_for_review(self.root_page, 23)
+
+        response = self.client.get(self.dashboard_url)
+
+        # 12 pages are overdue and 11 are due this month
+        self.assertContains(response, "And 2 more pages")
+        self.assertContains(response, "And 1 more page\n")
+
     def test_overdue_panel(self):
         self.add_overdue_page()
         response = self.client.get(self.dashboard_url)
@@ -110,7 +210,7 @@ class PeriodicReviewReportTest(WagtailTestUtils, TestCase):
 
         # Note: the default review period is 12 months
         cls.page_overdue = ReviewedPage(
-            title="Overdue",
+            title="Overdue page",
             slug="overdue",
             last_review_date=month_start - relativedelta(months=13),
         )
@@ -134,6 +234,7 @@ class PeriodicReviewReportTest(WagtailTestUtils, TestCase):
     def setUp(self):
         super().setUp()
         self.user = self.login()
+        self.addCleanup(cache.clear)
 
     def test_report(self):
         response = self.client.get(self.report_url)
@@ -144,6 +245,123 @@ class PeriodicReviewReportTest(WagtailTestUtils, TestCase):
         self.assertNotContains(response, self.page_ok.title)
         self.assertNotContains(response, self.regular_page.title)
 
+    @mock.patch.object(PeriodicReviewContentReport, "paginate_by", 1)
+    def test_report_pagination(self):
+        response = self.client.get(self.report_url)
+        self.assertContains(response, self.page_overdue.title)
+        self.assertNotContains(response, self.page_soon.title)
+        self.assertContains(response, "Page 1 of 2.")
+
+        cursor = response.context["page_obj"].next_page_number()
+        response = self.client.get(self.report_url, {"p": cursor})
+        self.assertNotContains(response, self.page_overdue.title)
+        self.assertContains(response, self.page_soon.title)
+        self.assertContains(response, "Page 2 of 2.")
+        self.assertContains(
+            response, f"?p={response.context['page_obj'].previous_page_number()}"
+        )
+
+    @mock.patch.object(PeriodicReviewContentReport, "count_limit", 1)
+    def test_report_limited_count(self):
+        response = self.client.get(self.report_url)
+        self.assertContains(response, "There are more than 1 pages")
+
+        response = self.client.get(self.report_url, {"review_due": "overdue"})
+        self.assertNotContains(response, "There are more than")
+
+    def test_report_query_count_does_not_grow_with_pages(self):
+        expected = get_query_count(self.client, self.report_url)
+
+        add_pages_due_for_review(self.root_page, 10)
+        # Count the filter choices again
+        cache.clear()
+        self.assertEqual(get_query_count(self.client, self.report_url), expected)
+
+    def test_filter_choice_counts(self):
+        response = self.client.get(self.report_url)
+
+        for label in (
+            "Reviewed page (2)",
+            "Overdue (1)",
+            "Due this month (1)",
+            "Due next month (0)",
+            "Due later (0)",
+        ):
+            self.assertContains(response, label)
+
+    def test_filter_choice_counts_apply_other_filters(self):
+        response = self.client.get(
+            self.report_url,
+            {
+                "content_type": self.page_overdue.content_type_id,
+                "review_due": "overdue",
+            },
+        )
+
+        self.assertNotContains(response, self.page_soon.title)
+        # Each filter's choices are counted with the other filters applied
+        self.assertContains(response, "Reviewed page (1)")
+        self.assertContains(response, "Due this month (1)")
+
+    def test_filter_choice_counts_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.report_url)
+        self.assertEqual(
+            len([query for query in queries if "facet_total" in query["sql"]]), 1
+        )
+
+        # The counts are cached
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.report_url)
+        self.assertFalse(any("facet_total" in query["sql"] for query in queries))
+        self.assertContains(response, "Overdue (1)")
+
+    @skipIf(WAGTAIL_VERSION < (6, 2), "The results view was added in Wagtail 6.2")
+    def test_filter_choice_counts_are_not_fetched_for_results(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("wagtail_periodic_review_report_results"))
+        self.assertFalse(any("facet_total" in query["sql"] for query in queries))
+
+    def test_export_csv(self):
+        response = self.client.get(self.report_url, {"export": "csv"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            b"".join(response.streaming_content).decode().splitlines(),
+            [
+                "Title,Type,Status,Last reviewed,Next review due",
+                f"Overdue page,Reviewed page,live,{self.page_overdue.last_review_date},"
+                f"{self.page_overdue.next_review_date}",
+                f"Coming soon,Reviewed page,live,{self.page_soon.last_review_date},"
+                f"{self.page_soon.next_review_date}",
+            ],
+        )
+
+    def test_export_xlsx(self):
+        response = self.client.get(self.report_url, {"export": "xlsx"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        workbook = load_workbook(BytesIO(b"".join(response.streaming_content)))
+        rows = list(workbook.active.values)
+        self.assertEqual(
+            rows[0], ("Title", "Type", "Status", "Last reviewed", "Next review due")
+        )
+        self.assertEqual(
+            [row[0] for row in rows[1:]],
+            [self.page_overdue.title, self.page_soon.title],
+        )
+
+    def test_export_does_not_query_page_models(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.report_url, {"export": "csv"})
+            b"".join(response.streaming_content)
+
+        self.assertFalse(
+            any(ReviewedPage._meta.db_table in query["sql"] for query in queries)
+        )
+
     @mock.patch(
         "wagtail_periodic_review.utils.get_periodic_review_models", return_value=[]
     )
@@ -160,4 +378,84 @@ class PeriodicReviewReportTest(WagtailTestUtils, TestCase):
         self.assertNotContains(response, self.non_page_model.name)
 
 
+class ReviewForecastTest(WagtailTestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.forecast_url = reverse("wagtail_periodic_review_forecast")
+        cls.root_page = Site.objects.get(is_default_site=True).root_page
+        add_pages_due_for_review(cls.root_page, 4)
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.login()
+        self.addCleanup(cache.clear)
+
+    def get_index_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.forecast_url)
+        self.assertEqual(response.status_code, 200)
+        return [
+            query["sql"]
+            for query in queries
+            if PageReviewIndex._meta.db_table in query["sql"]
+        ]
+
+    def test_forecast(self):
+        response = self.client.get(self.forecast_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["total"], 2)
+        self.assertEqual(response.context["monthly_totals"][0], 2)
+        self.assertEqual(
+            response.context["content_type_rows"],
+            [("Reviewed page", [2] + [0] * 11, 2)],
+        )
+        self.assertEqual(
+            response.context["site_rows"], [("localhost [default]", [2] + [0] * 11, 2)]
+        )
+
+    def test_forecast_is_cached(self):
+        self.assertEqual(len(self.get_index_queries()), 1)
+        self.assertEqual(self.get_index_queries(), [])
+
+        invalidate_review_data()
+        self.assertEqual(len(self.get_index_queries()), 1)
+
+    def test_deleted_site(self):
+        site_root = self.root_page.get_parent().add_child(
+            instance=SimplePage(title="Other", slug="other")
+        )
+        site = Site.objects.create(hostname="other", root_page=site_root)
+        add_pages_due_for_review(site_root, 2)
+        self.get_index_queries()
+
+        site.delete()
+        self.assertEqual(len(self.get_index_queries()), 1)
+        response = self.client.get(self.forecast_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context["site_rows"],
+            [
+                ("Not in a site", [1] + [0] * 11, 1),
+                ("localhost [default]", [2] + [0] * 11, 2),
+            ],
+        )
+
+    def test_no_pages_due(self):
+        self.user.is_superuser = False
+        self.user.save()
+        self.user.user_permissions.add(Permission.objects.get(codename="access_admin"))
+
+        response = self.client.get(self.forecast_url)
+
+        self.assertContains(
+            response, "No pages are due a review in the next 12 months."
+        )
+
+    def test_menu_item(self):
+        response = self.client.get(reverse("wagtailadmin_home"))
+        self.assertContains(response, self.forecast_url)
+
+
 # To-Do: test settings